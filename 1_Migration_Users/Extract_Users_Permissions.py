@@ -34,8 +34,10 @@ import argparse
 import logging
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 
 # ============================================================================
@@ -92,6 +94,9 @@ Examples:
   # Quiet mode
   python Extract_Users_Permissions.py --server localhost --database IntelliSTOR --windows-auth --quiet
 
+  # Decode ACLs inline instead of on a process pool
+  python Extract_Users_Permissions.py --server localhost --database IntelliSTOR --windows-auth --workers 1
+
   # Test data generation (dry-run to preview changes)
   python Extract_Users_Permissions.py --server localhost --database IntelliSTOR --windows-auth --TESTDATA-DRYRUN
 
@@ -128,6 +133,8 @@ Output Files:
                         help='Output directory for CSV files (default: current directory)')
     parser.add_argument('--quiet', action='store_true',
                         help='Quiet mode - minimal console output')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='ACL decoder processes; 1 decodes inline (default: CPU count)')
 
     # Test data generation options
     parser.add_argument('--TESTDATA', action='store_true',
@@ -149,6 +156,9 @@ Output Files:
     if not args.windows_auth and (not args.user or not args.password):
         parser.error('Either --windows-auth or both --user and --password must be provided')
 
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+
     return args
 
 
@@ -282,6 +292,157 @@ def find_all_sids_in_data(data):
     return results
 
 
+# Security descriptor layout (see ACL/parse_acl.py)
+SD_HEADER_SIZE = 20          # Revision, Sbz1, Control, Owner/Group/SACL/DACL offsets
+SD_LENGTH_PREFIX_SIZE = 4    # VALUE blobs usually start with a u32 descriptor length
+SE_SELF_RELATIVE = 0x8000
+ACL_HEADER_SIZE = 8          # AclRevision, Sbz1, AclSize, AceCount, Sbz2
+ACE_HEADER_SIZE = 4          # AceType, AceFlags, AceSize
+OBJECT_ACE_TYPES = {0x05, 0x06, 0x07, 0x08, 0x0B, 0x0C, 0x0F, 0x10}
+ACE_OBJECT_TYPE_PRESENT = 0x1
+ACE_INHERITED_OBJECT_TYPE_PRESENT = 0x2
+DOMAIN_SID_SUB_AUTHORITY = 21  # S-1-5-21-<domain>-<domain>-<domain>-<RID>
+
+# Permission extraction pipeline
+FETCH_BATCH_SIZE = 5000      # Rows per fetchmany() round trip
+DECODE_CHUNK_SIZE = 256      # ACL blobs per decoder process task
+
+
+def _acl_ace_sid_offsets(data, acl_offset, offsets):
+    """
+    Append the SID offset of every ACE in the ACL at acl_offset.
+
+    Follows AceCount/AceSize like parse_acl(). Returns False if the ACL is malformed.
+    """
+    if acl_offset + ACL_HEADER_SIZE > len(data):
+        return False
+    acl_size = int.from_bytes(data[acl_offset + 2:acl_offset + 4], 'little')
+    ace_count = int.from_bytes(data[acl_offset + 4:acl_offset + 6], 'little')
+    acl_end = min(acl_offset + acl_size, len(data)) if acl_size else len(data)
+
+    pos = acl_offset + ACL_HEADER_SIZE
+    for _ in range(ace_count):
+        if pos + ACE_HEADER_SIZE > acl_end:
+            return False
+        ace_type = data[pos]
+        ace_size = int.from_bytes(data[pos + 2:pos + 4], 'little')
+        if ace_size < ACE_HEADER_SIZE + 4 + 8 or pos + ace_size > acl_end:
+            return False
+
+        # Header, then the access mask, then the SID (object ACEs insert flags and GUIDs)
+        sid_offset = pos + ACE_HEADER_SIZE + 4
+        if ace_type in OBJECT_ACE_TYPES:
+            object_flags = int.from_bytes(data[sid_offset:sid_offset + 4], 'little')
+            sid_offset += 4
+            if object_flags & ACE_OBJECT_TYPE_PRESENT:
+                sid_offset += 16
+            if object_flags & ACE_INHERITED_OBJECT_TYPE_PRESENT:
+                sid_offset += 16
+        if (sid_offset + 8 > pos + ace_size
+                or sid_offset + 8 + 4 * data[sid_offset + 1] > pos + ace_size):
+            return False
+
+        offsets.append(sid_offset)
+        pos += ace_size
+    return True
+
+
+def find_acl_sid_offsets(data) -> Optional[List[int]]:
+    """
+    Find the SIDs of a self-relative security descriptor by walking its structure.
+
+    Reads the header's owner/group SIDs and every ACE of the SACL and DACL
+    (AceCount/AceSize), instead of testing every byte as a possible SID start.
+    The descriptor may be preceded by its u32 length, as in the database VALUE.
+
+    Returns:
+        SID offsets in ascending order, or None if data is not a valid descriptor
+    """
+    for base in (0, SD_LENGTH_PREFIX_SIZE):
+        if base + SD_HEADER_SIZE > len(data) or data[base] != 1:
+            continue
+        control = int.from_bytes(data[base + 2:base + 4], 'little')
+        if not control & SE_SELF_RELATIVE:
+            continue
+        owner, group, sacl, dacl = (int.from_bytes(data[base + o:base + o + 4], 'little')
+                                    for o in (4, 8, 12, 16))
+        if any(off and not SD_HEADER_SIZE <= off < len(data) - base
+               for off in (owner, group, sacl, dacl)):
+            continue
+
+        offsets = []
+        for off in (owner, group):
+            if off:
+                if (base + off + 8 > len(data)
+                        or base + off + 8 + 4 * data[base + off + 1] > len(data)):
+                    return None
+                offsets.append(base + off)
+        for off in (sacl, dacl):
+            if off and not _acl_ace_sid_offsets(data, base + off, offsets):
+                return None
+        return sorted(offsets)
+    return None
+
+
+def acl_cache_key(value_binary):
+    """Hashable key for a VALUE column (bytes or hex string)."""
+    return value_binary if isinstance(value_binary, (bytes, str)) else bytes(value_binary)
+
+
+def acl_value_to_bytes(value_binary) -> Optional[bytes]:
+    """
+    Convert a VALUE column to bytes.
+
+    Accepts bytes or a hex string (with or without 0x prefix).
+
+    Returns:
+        bytes, or None if the hex string is invalid
+    """
+    if not isinstance(value_binary, str):
+        return bytes(value_binary)
+    hex_value = value_binary[2:] if value_binary.startswith('0x') else value_binary
+    try:
+        return bytes.fromhex(hex_value)
+    except ValueError as e:
+        logging.debug(f"Failed to decode hex ACL: {hex_value[:50]}... Error: {e}")
+        return None
+
+
+def decode_acl_sids(data) -> Tuple[int, Tuple[int, ...]]:
+    """
+    Decode the Everyone flag and the domain RIDs of an ACL blob.
+
+    Uses find_acl_sid_offsets, falling back to find_all_sids_in_data for blobs
+    that are not a well-formed security descriptor. SIDs are read as integers
+    (no SID strings are built).
+
+    Returns:
+        (everyone: 1 or 0, unique RIDs in blob order)
+    """
+    offsets = find_acl_sid_offsets(data)
+    if offsets is None:
+        offsets = [sid_info['offset'] for sid_info in find_all_sids_in_data(data)]
+
+    everyone = 0
+    rids = {}
+    for offset in offsets:
+        sub_authority_count = data[offset + 1]
+        first_sub_authority = int.from_bytes(data[offset + 8:offset + 12], 'little')
+
+        # Everyone: S-1-1-0
+        if (sub_authority_count == 1 and first_sub_authority == 0
+                and int.from_bytes(data[offset + 2:offset + 8], 'big') == 1):
+            everyone = 1
+            continue
+
+        # Domain SID: S-1-5-21-domain1-domain2-domain3-RID (RID = last sub-authority)
+        if sub_authority_count >= 5 and first_sub_authority == DOMAIN_SID_SUB_AUTHORITY:
+            rid_offset = offset + 8 + 4 * (sub_authority_count - 1)
+            rids[int.from_bytes(data[rid_offset:rid_offset + 4], 'little')] = None
+
+    return everyone, tuple(rids)
+
+
 # ============================================================================
 # Data Extraction
 # ============================================================================
@@ -289,15 +450,20 @@ def find_all_sids_in_data(data):
 class UsersPermissionsExtractor:
     """Extracts users and permissions data from MS SQL Server."""
 
-    def __init__(self, conn, output_dir):
+    def __init__(self, conn, output_dir, connection_factory=None, workers=1):
         """Initialize the extractor.
 
         Args:
             conn: Database connection
             output_dir: Output directory for CSV files
+            connection_factory: Optional callable returning a new connection;
+                enables extracting the permission tables concurrently
+            workers: Number of ACL decoder processes (1 = decode inline)
         """
         self.conn = conn
         self.output_dir = Path(output_dir)
+        self.connection_factory = connection_factory
+        self.workers = workers
         self.stats = {
             'users': 0,
             'user_groups': 0,
@@ -325,9 +491,13 @@ class UsersPermissionsExtractor:
         self.user_rid_map = {}
         self.group_rid_map = {}
 
-    def table_exists(self, table_name):
+        # Decoded ACLs by VALUE blob: (everyone, RIDs). Identical ACLs repeat
+        # heavily across folders, report species and sections.
+        self.acl_cache = {}
+
+    def table_exists(self, table_name, conn=None):
         """Check if a table exists in the database."""
-        cursor = self.conn.cursor()
+        cursor = (conn or self.conn).cursor()
         try:
             cursor.execute("""
                 SELECT COUNT(*)
@@ -539,238 +709,179 @@ class UsersPermissionsExtractor:
         self.stats['sections'] = len(trimmed_rows)
         logging.info(f'Written {len(trimmed_rows)} sections to {output_path}')
 
-    def extract_folder_permissions(self):
-        """Extract and decode folder permissions from STYPE_FOLDER."""
-        output_file = 'STYPE_FOLDER_ACCESS.csv'
-        logging.info(f'Extracting and decoding folder permissions...')
+    def iter_decoded_rows(self, cursor, value_index, pool=None):
+        """
+        Yield the rows of an executed query with their VALUE ACLs decoded.
 
-        # Try common table names
-        table_name = None
-        for name in ['STYPE_FOLDER', 'FOLDER_PERMISSION', 'FOLDER_PERMISSIONS', 'ITEM_PERMISSION', 'PERMISSIONS']:
-            if self.table_exists(name):
-                table_name = name
-                break
+        Rows are fetched FETCH_BATCH_SIZE at a time. The blobs of a batch that
+        are not in acl_cache yet are decoded on the decoder pool (if given)
+        while the next batch is fetched, so decode_acl_value on the yielded
+        rows is a cache lookup.
 
-        if not table_name:
-            logging.warning('No folder permission table found (tried STYPE_FOLDER, FOLDER_PERMISSION, FOLDER_PERMISSIONS, ITEM_PERMISSION, PERMISSIONS)')
-            return
+        Args:
+            cursor: Cursor with an executed query
+            value_index: Column index of the VALUE blob
+            pool: Optional ProcessPoolExecutor for decode_acl_sids
+        """
+        pending_rows, pending = [], None
+        while True:
+            rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+            if pending is not None:
+                self.acl_cache.update(zip(*pending))
+                yield from pending_rows
+            if not rows:
+                return
+            pending_rows, pending = rows, self._start_acl_decoding(rows, value_index, pool)
+
+    def _start_acl_decoding(self, rows, value_index, pool):
+        """Start decoding the uncached VALUE blobs of a batch; returns (keys, results iterator)."""
+        keys, blobs = [], []
+        seen = set()
+        for row in rows:
+            value_binary = row[value_index]
+            key = acl_cache_key(value_binary)
+            if key in self.acl_cache or key in seen:
+                continue
+            seen.add(key)
+            data = acl_value_to_bytes(value_binary)
+            if data is None:
+                self.acl_cache[key] = (0, ())
+                continue
+            keys.append(key)
+            blobs.append(data)
+
+        # Small batches are not worth the round trip to the worker processes
+        if pool is not None and len(blobs) >= DECODE_CHUNK_SIZE:
+            return keys, pool.map(decode_acl_sids, blobs, chunksize=DECODE_CHUNK_SIZE)
+        return keys, map(decode_acl_sids, blobs)
+
+    def _find_table(self, candidates, conn=None):
+        """Return the first of the candidate table names that exists, or None."""
+        for name in candidates:
+            if self.table_exists(name, conn):
+                return name
+        return None
 
-        # Use instance RID mappings
+    def _extract_acl_table(self, conn, pool, query, id_columns, output_file, stat_key, description):
+        """
+        Stream an ACL query to CSV, decoding the VALUE blob of every row.
+
+        The query selects id_columns followed by VALUE. Rows are written as
+        they are decoded, so memory use does not grow with the table.
+        """
         user_rid_map = self.user_rid_map
         group_rid_map = self.group_rid_map
+        output_path = self.output_dir / output_file
+        fieldnames = id_columns + ['Group', 'User', 'RID', 'Everyone']
 
-        cursor = self.conn.cursor()
+        cursor = conn.cursor()
+        f = None
+        row_count = 0
 
         try:
-            # Query STYPE_FOLDER for binary ACL data
-            cursor.execute(f"""
-                SELECT FOLDER_ID, VALUE
-                FROM {table_name}
-                WHERE VALUE IS NOT NULL
-                ORDER BY FOLDER_ID
-            """)
+            cursor.execute(query)
 
-            # Decode ACLs and build output
-            decoded_rows = []
-            row_count = 0
-            for row in cursor:
-                folder_id = row[0]
-                value_binary = row[1]
+            for row in self.iter_decoded_rows(cursor, len(id_columns), pool):
+                ids = dict(zip(id_columns, row))
+                value_binary = row[-1]
 
                 # Debug first 10 entries
                 debug_idx = row_count if row_count < 10 else None
                 if debug_idx is not None:
-                    logging.debug(f"[{debug_idx}] Processing FOLDER_ID: {folder_id}")
+                    logging.debug(f"[{debug_idx}] Processing "
+                                  + ', '.join(f'{column}: {value}' for column, value in ids.items()))
                     logging.debug(f"[{debug_idx}] Value type: {type(value_binary)}")
 
                 # Decode ACL
                 acl_info = self.decode_acl_value(value_binary, user_rid_map, group_rid_map, debug_idx)
 
-                decoded_rows.append({
-                    'FOLDER_ID': folder_id,
+                # Open the CSV on the first row so an empty table leaves no file behind
+                if f is None:
+                    f = open(output_path, 'w', newline='', encoding='utf-8')
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    writer.writeheader()
+
+                ids.update({
                     'Group': '|'.join(str(gid) for gid in acl_info['groups']),
                     'User': '|'.join(str(uid) for uid in acl_info['users']),
                     'RID': '|'.join(str(rid) for rid in acl_info['rids']),
                     'Everyone': acl_info['everyone']
                 })
+                writer.writerow(ids)
 
                 row_count += 1
 
-            # Write CSV
-            if decoded_rows:
-                output_path = self.output_dir / output_file
-                fieldnames = ['FOLDER_ID', 'Group', 'User', 'RID', 'Everyone']
-
-                with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(decoded_rows)
-
-                self.stats['folder_permissions'] = len(decoded_rows)
-                logging.info(f'Written {len(decoded_rows)} folder permissions to {output_file}')
+            if row_count:
+                self.stats[stat_key] = row_count
+                logging.info(f'Written {row_count} {description} to {output_file}')
             else:
-                logging.warning('No folder permissions found')
+                logging.warning(f'No {description} found')
 
         except Exception as e:
-            logging.error(f'Error extracting folder permissions: {e}', exc_info=True)
+            logging.error(f'Error extracting {description}: {e}', exc_info=True)
         finally:
+            if f is not None:
+                f.close()
             cursor.close()
 
-    def extract_report_species_permissions(self):
-        """Extract and decode report species permissions."""
-        output_file = 'STYPE_REPORT_SPECIES_ACCESS.csv'
-        logging.info(f'Extracting and decoding report species permissions...')
+    def extract_folder_permissions(self, conn=None, pool=None):
+        """Extract and decode folder permissions from STYPE_FOLDER."""
+        conn = conn or self.conn
+        logging.info(f'Extracting and decoding folder permissions...')
 
         # Try common table names
-        table_name = None
-        for name in ['STYPE_REPORT_SPECIES', 'REPORT_SPECIES_PERMISSION', 'REPORT_SPECIES_PERMISSIONS', 'SPECIES_PERMISSION']:
-            if self.table_exists(name):
-                table_name = name
-                break
-
+        table_name = self._find_table(['STYPE_FOLDER', 'FOLDER_PERMISSION', 'FOLDER_PERMISSIONS', 'ITEM_PERMISSION', 'PERMISSIONS'], conn)
         if not table_name:
-            logging.warning('No report species permission table found (tried STYPE_REPORT_SPECIES, REPORT_SPECIES_PERMISSION, REPORT_SPECIES_PERMISSIONS, SPECIES_PERMISSION)')
+            logging.warning('No folder permission table found (tried STYPE_FOLDER, FOLDER_PERMISSION, FOLDER_PERMISSIONS, ITEM_PERMISSION, PERMISSIONS)')
             return
 
-        # Use instance RID mappings
-        user_rid_map = self.user_rid_map
-        group_rid_map = self.group_rid_map
-
-        cursor = self.conn.cursor()
-
-        try:
-            # Query STYPE_REPORT_SPECIES for binary ACL data
-            cursor.execute(f"""
-                SELECT REPORT_SPECIES_ID, VALUE
-                FROM {table_name}
-                WHERE VALUE IS NOT NULL
-                ORDER BY REPORT_SPECIES_ID
-            """)
-
-            # Decode ACLs and build output
-            decoded_rows = []
-            row_count = 0
-            for row in cursor:
-                report_species_id = row[0]
-                value_binary = row[1]
-
-                # Debug first 10 entries
-                debug_idx = row_count if row_count < 10 else None
-                if debug_idx is not None:
-                    logging.debug(f"[{debug_idx}] Processing REPORT_SPECIES_ID: {report_species_id}")
-                    logging.debug(f"[{debug_idx}] Value type: {type(value_binary)}")
-
-                # Decode ACL
-                acl_info = self.decode_acl_value(value_binary, user_rid_map, group_rid_map, debug_idx)
-
-                decoded_rows.append({
-                    'REPORT_SPECIES_ID': report_species_id,
-                    'Group': '|'.join(str(gid) for gid in acl_info['groups']),
-                    'User': '|'.join(str(uid) for uid in acl_info['users']),
-                    'RID': '|'.join(str(rid) for rid in acl_info['rids']),
-                    'Everyone': acl_info['everyone']
-                })
-
-                row_count += 1
-
-            # Write CSV
-            if decoded_rows:
-                output_path = self.output_dir / output_file
-                fieldnames = ['REPORT_SPECIES_ID', 'Group', 'User', 'RID', 'Everyone']
+        # Query STYPE_FOLDER for binary ACL data
+        self._extract_acl_table(conn, pool, f"""
+            SELECT FOLDER_ID, VALUE
+            FROM {table_name}
+            WHERE VALUE IS NOT NULL
+            ORDER BY FOLDER_ID
+        """, ['FOLDER_ID'], 'STYPE_FOLDER_ACCESS.csv', 'folder_permissions', 'folder permissions')
 
-                with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(decoded_rows)
+    def extract_report_species_permissions(self, conn=None, pool=None):
+        """Extract and decode report species permissions."""
+        conn = conn or self.conn
+        logging.info(f'Extracting and decoding report species permissions...')
 
-                self.stats['report_permissions'] = len(decoded_rows)
-                logging.info(f'Written {len(decoded_rows)} report species permissions to {output_file}')
-            else:
-                logging.warning('No report species permissions found')
+        # Try common table names
+        table_name = self._find_table(['STYPE_REPORT_SPECIES', 'REPORT_SPECIES_PERMISSION', 'REPORT_SPECIES_PERMISSIONS', 'SPECIES_PERMISSION'], conn)
+        if not table_name:
+            logging.warning('No report species permission table found (tried STYPE_REPORT_SPECIES, REPORT_SPECIES_PERMISSION, REPORT_SPECIES_PERMISSIONS, SPECIES_PERMISSION)')
+            return
 
-        except Exception as e:
-            logging.error(f'Error extracting report species permissions: {e}', exc_info=True)
-        finally:
-            cursor.close()
+        # Query STYPE_REPORT_SPECIES for binary ACL data
+        self._extract_acl_table(conn, pool, f"""
+            SELECT REPORT_SPECIES_ID, VALUE
+            FROM {table_name}
+            WHERE VALUE IS NOT NULL
+            ORDER BY REPORT_SPECIES_ID
+        """, ['REPORT_SPECIES_ID'], 'STYPE_REPORT_SPECIES_ACCESS.csv', 'report_permissions',
+            'report species permissions')
 
-    def extract_section_permissions(self):
+    def extract_section_permissions(self, conn=None, pool=None):
         """Extract and decode section permissions."""
-        output_file = 'STYPE_SECTION_ACCESS.csv'
+        conn = conn or self.conn
         logging.info(f'Extracting and decoding section permissions...')
 
         # Try common table names
-        table_name = None
-        for name in ['STYPE_SECTION', 'SECTION_PERMISSION', 'SECTION_PERMISSIONS']:
-            if self.table_exists(name):
-                table_name = name
-                break
-
+        table_name = self._find_table(['STYPE_SECTION', 'SECTION_PERMISSION', 'SECTION_PERMISSIONS'], conn)
         if not table_name:
             logging.warning('No section permission table found (tried STYPE_SECTION, SECTION_PERMISSION, SECTION_PERMISSIONS)')
             return
 
-        # Use instance RID mappings
-        user_rid_map = self.user_rid_map
-        group_rid_map = self.group_rid_map
-
-        cursor = self.conn.cursor()
-
-        try:
-            # Query STYPE_SECTION for binary ACL data
-            cursor.execute(f"""
-                SELECT REPORT_SPECIES_ID, SECTION_ID, VALUE
-                FROM {table_name}
-                WHERE VALUE IS NOT NULL
-                ORDER BY REPORT_SPECIES_ID, SECTION_ID
-            """)
-
-            # Decode ACLs and build output
-            decoded_rows = []
-            row_count = 0
-            for row in cursor:
-                report_species_id = row[0]
-                section_id = row[1]
-                value_binary = row[2]
-
-                # Debug first 10 entries
-                debug_idx = row_count if row_count < 10 else None
-                if debug_idx is not None:
-                    logging.debug(f"[{debug_idx}] Processing REPORT_SPECIES_ID: {report_species_id}, SECTION_ID: {section_id}")
-                    logging.debug(f"[{debug_idx}] Value type: {type(value_binary)}")
-
-                # Decode ACL
-                acl_info = self.decode_acl_value(value_binary, user_rid_map, group_rid_map, debug_idx)
-
-                decoded_rows.append({
-                    'REPORT_SPECIES_ID': report_species_id,
-                    'SECTION_ID': section_id,
-                    'Group': '|'.join(str(gid) for gid in acl_info['groups']),
-                    'User': '|'.join(str(uid) for uid in acl_info['users']),
-                    'RID': '|'.join(str(rid) for rid in acl_info['rids']),
-                    'Everyone': acl_info['everyone']
-                })
-
-                row_count += 1
-
-            # Write CSV
-            if decoded_rows:
-                output_path = self.output_dir / output_file
-                fieldnames = ['REPORT_SPECIES_ID', 'SECTION_ID', 'Group', 'User', 'RID', 'Everyone']
-
-                with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(decoded_rows)
-
-                self.stats['section_permissions'] = len(decoded_rows)
-                logging.info(f'Written {len(decoded_rows)} section permissions to {output_file}')
-            else:
-                logging.warning('No section permissions found')
-
-        except Exception as e:
-            logging.error(f'Error extracting section permissions: {e}', exc_info=True)
-        finally:
-            cursor.close()
+        # Query STYPE_SECTION for binary ACL data
+        self._extract_acl_table(conn, pool, f"""
+            SELECT REPORT_SPECIES_ID, SECTION_ID, VALUE
+            FROM {table_name}
+            WHERE VALUE IS NOT NULL
+            ORDER BY REPORT_SPECIES_ID, SECTION_ID
+        """, ['REPORT_SPECIES_ID', 'SECTION_ID'], 'STYPE_SECTION_ACCESS.csv', 'section_permissions',
+            'section permissions')
 
     def build_user_group_maps(self):
         """
@@ -1012,101 +1123,49 @@ class UsersPermissionsExtractor:
             group_rid_map: {RID: GROUP_ID} mapping
             debug_idx: Index for debug logging (only log first 10)
 
+        Decoded SIDs are memoised per VALUE blob; the user/group mapping is
+        applied on every call, as the RID maps are rebuilt after test data
+        generation.
+
         Returns:
             {
-                'users': [list of USER_IDs],
-                'groups': [list of GROUP_IDs],
-                'rids': [list of all extracted RIDs],
+                'users': {USER_ID: None} (insertion-ordered set of RIDs),
+                'groups': {GROUP_ID: None} (insertion-ordered set of RIDs),
+                'rids': {RID: None} (all extracted RIDs, in ACL order),
                 'everyone': 1 or 0
             }
         """
-        result = {
-            'users': [],
-            'groups': [],
-            'rids': [],
-            'everyone': 0
-        }
-
         debug = debug_idx is not None and debug_idx < 10
 
-        # Handle hex string vs bytes
-        if isinstance(value_binary, str):
+        cache_key = acl_cache_key(value_binary)
+        decoded = self.acl_cache.get(cache_key)
+        if decoded is None:
             if debug:
-                logging.debug(f"[{debug_idx}] ACL is string type, length: {len(value_binary)}")
-                logging.debug(f"[{debug_idx}] First 100 chars: {value_binary[:100]}")
-            if value_binary.startswith('0x'):
-                value_binary = value_binary[2:]
-            try:
-                data = bytes.fromhex(value_binary)
-                if debug:
-                    logging.debug(f"[{debug_idx}] Converted to {len(data)} bytes")
-            except Exception as e:
-                logging.debug(f"Failed to decode hex ACL: {str(value_binary)[:50]}... Error: {e}")
-                return result
-        else:
-            data = value_binary
-            if debug:
-                logging.debug(f"[{debug_idx}] ACL is bytes type, length: {len(data)}")
-                logging.debug(f"[{debug_idx}] First 64 bytes (hex): {data[:64].hex()}")
-
-        # Parse all SIDs from ACL
-        sids = find_all_sids_in_data(data)
-
-        if debug:
-            logging.debug(f"[{debug_idx}] Found {len(sids)} SID(s) in ACL")
-
-        for sid_info in sids:
-            sid = sid_info['sid']
-
-            if debug:
-                logging.debug(f"[{debug_idx}]   SID: {sid}, Name: {sid_info['name']}")
-
-            # Check for Everyone
-            if sid == 'S-1-1-0':
-                result['everyone'] = 1
-                if debug:
-                    logging.debug(f"[{debug_idx}]   → Everyone detected")
-                continue
-
-            # Extract RID from domain SIDs
-            rid = self.extract_rid_from_sid(sid)
-            if rid is None:
-                if debug:
-                    logging.debug(f"[{debug_idx}]   → No RID extracted (not domain SID)")
-                continue
+                logging.debug(f"[{debug_idx}] ACL is {type(value_binary).__name__} type, length: {len(value_binary)}")
+                logging.debug(f"[{debug_idx}] First 100 chars/bytes: {value_binary[:100]}")
+            data = acl_value_to_bytes(value_binary)
+            decoded = decode_acl_sids(data) if data is not None else (0, ())
+            self.acl_cache[cache_key] = decoded
+        elif debug:
+            logging.debug(f"[{debug_idx}] ACL already decoded (cached)")
+
+        everyone, rids = decoded
+        result = {
+            'users': dict.fromkeys(rid for rid in rids if rid in user_rid_map),
+            'groups': dict.fromkeys(rid for rid in rids if rid in group_rid_map),
+            'rids': dict.fromkeys(rids),
+            'everyone': everyone
+        }
 
-            if debug:
-                logging.debug(f"[{debug_idx}]   → Extracted RID: {rid}")
-                logging.debug(f"[{debug_idx}]   → Checking if {rid} in user_rid_map: {rid in user_rid_map}")
-                logging.debug(f"[{debug_idx}]   → Checking if {rid} in group_rid_map: {rid in group_rid_map}")
-
-            # Add RID to rids list (always, even if not in database)
-            if rid not in result['rids']:
-                result['rids'].append(rid)
-
-            # Try to map to USER_ID
-            if rid in user_rid_map:
-                if rid not in result['users']:
-                    result['users'].append(rid)
-                    if debug:
-                        logging.debug(f"[{debug_idx}]   → Mapped to USER_ID: {rid}")
-
-            # Try to map to GROUP_ID
-            if rid in group_rid_map:
-                if rid not in result['groups']:
-                    result['groups'].append(rid)
-                    if debug:
-                        logging.debug(f"[{debug_idx}]   → Mapped to GROUP_ID: {rid}")
-
-            # Track unmapped RIDs if in testdata mode
-            if self.testdata_mode:
-                if rid not in user_rid_map and rid not in group_rid_map:
-                    self.unmapped_rids.add(rid)
-                    if debug:
-                        logging.debug(f"[{debug_idx}]   → Unmapped RID tracked: {rid}")
+        # Track unmapped RIDs if in testdata mode
+        if self.testdata_mode:
+            self.unmapped_rids.update(rid for rid in rids
+                                      if rid not in user_rid_map and rid not in group_rid_map)
 
         if debug:
-            logging.debug(f"[{debug_idx}] Final result: Users={result['users']}, Groups={result['groups']}, RIDs={result['rids']}, Everyone={result['everyone']}")
+            logging.debug(f"[{debug_idx}] Final result: Users={list(result['users'])}, "
+                          f"Groups={list(result['groups'])}, RIDs={list(result['rids'])}, "
+                          f"Everyone={result['everyone']}")
 
         return result
 
@@ -1480,7 +1539,7 @@ class UsersPermissionsExtractor:
         finally:
             cursor.close()
 
-    def create_unique_sections_access(self):
+    def create_unique_sections_access(self, conn=None, pool=None):
         """
         Create aggregated section permissions across all report species.
 
@@ -1494,7 +1553,7 @@ class UsersPermissionsExtractor:
         user_rid_map = self.user_rid_map
         group_rid_map = self.group_rid_map
 
-        cursor = self.conn.cursor()
+        cursor = (conn or self.conn).cursor()
 
         try:
             # Query STYPE_SECTION joined with SECTION to get NAME
@@ -1512,7 +1571,7 @@ class UsersPermissionsExtractor:
             section_perms = {}  # {NAME: {users: set, groups: set, rids: set, everyone: int}}
 
             row_count = 0
-            for row in cursor:
+            for row in self.iter_decoded_rows(cursor, 1, pool):
                 section_name = row[0]
                 value_binary = row[1]
 
@@ -1544,8 +1603,6 @@ class UsersPermissionsExtractor:
                 if acl_info['everyone'] == 1:
                     section_perms[section_name]['everyone'] = 1
 
-            cursor.close()
-
             # Write aggregated output
             if section_perms:
                 output_path = self.output_dir / output_file
@@ -1572,8 +1629,36 @@ class UsersPermissionsExtractor:
         except Exception as e:
             logging.error(f'Error creating unique sections access: {e}', exc_info=True)
         finally:
-            if cursor:
-                cursor.close()
+            cursor.close()
+
+    def run_acl_extractions(self, extractions, pool=None):
+        """
+        Run ACL extraction methods at the same time, each on its own connection.
+
+        Without a connection factory they run one after another on self.conn.
+
+        Args:
+            extractions: Methods taking (conn, pool)
+            pool: Optional decoder pool shared by all of them
+        """
+        if self.connection_factory is None or len(extractions) < 2:
+            for extract in extractions:
+                extract(self.conn, pool)
+            return
+
+        with ThreadPoolExecutor(max_workers=len(extractions)) as executor:
+            futures = [executor.submit(self._run_on_new_connection, extract, pool)
+                       for extract in extractions]
+            for future in futures:
+                future.result()
+
+    def _run_on_new_connection(self, extract, pool):
+        """Run one ACL extraction on a dedicated connection."""
+        conn = self.connection_factory()
+        try:
+            extract(conn, pool)
+        finally:
+            conn.close()
 
     def extract_all(self):
         """Extract all users and permissions data."""
@@ -1586,27 +1671,38 @@ class UsersPermissionsExtractor:
         # Build initial RID maps
         self.user_rid_map, self.group_rid_map = self.build_user_group_maps()
 
-        # Phase 2: Extract ACLs (populates unmapped_rids if in testdata mode)
-        self.extract_folder_permissions()
-        self.extract_report_species_permissions()
-        self.extract_section_permissions()
+        acl_extractions = [
+            self.extract_folder_permissions,
+            self.extract_report_species_permissions,
+            self.extract_section_permissions,
+        ]
 
-        # Phase 3: Generate test data (if enabled)
-        if self.testdata_mode:
+        # ACL blobs are decoded on a shared process pool; the permission tables
+        # are streamed concurrently on separate connections
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            if not self.testdata_mode:
+                # Phase 2 + 4: Extract ACLs and create aggregated sections
+                self.run_acl_extractions(acl_extractions + [self.create_unique_sections_access], pool)
+                return
+
+            # Phase 2: Extract ACLs (populates unmapped_rids)
+            self.run_acl_extractions(acl_extractions, pool)
+
+            # Phase 3: Generate test data
             self.generate_test_data()
             # Rebuild RID maps from CSV to include newly created groups/users
             self.user_rid_map, self.group_rid_map = self.build_user_group_maps_from_csv()
             logging.info('Rebuilt RID maps from CSV after test data generation')
 
-            # Phase 3.5: Re-extract ACL permissions with updated RID maps
+            # Phase 3.5 + 4: Re-extract ACL permissions with updated RID maps
+            # and create aggregated sections
             logging.info('Re-extracting ACL permissions with updated RID maps...')
-            self.extract_folder_permissions()
-            self.extract_report_species_permissions()
-            self.extract_section_permissions()
+            self.run_acl_extractions(acl_extractions + [self.create_unique_sections_access], pool)
             logging.info('ACL permissions updated with test data groups')
-
-        # Phase 4: Create aggregated sections
-        self.create_unique_sections_access()
+        finally:
+            if pool is not None:
+                pool.shutdown()
 
 
 # ============================================================================
@@ -1630,8 +1726,9 @@ def main():
         logging.info(f'Output directory: {args.output_dir}')
 
     try:
-        # Connect to database
-        conn = create_connection(
+        # Connect to database (the permission tables get connections of their own)
+        connection_factory = partial(
+            create_connection,
             server=args.server,
             port=args.port,
             database=args.database,
@@ -1639,9 +1736,12 @@ def main():
             password=args.password,
             windows_auth=args.windows_auth
         )
+        conn = connection_factory()
 
         # Extract data
-        extractor = UsersPermissionsExtractor(conn, args.output_dir)
+        extractor = UsersPermissionsExtractor(conn, args.output_dir,
+                                              connection_factory=connection_factory,
+                                              workers=args.workers)
 
         # Configure test data mode
         if args.TESTDATA or args.TESTDATA_DRYRUN:
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+test_acl_decoding.py - ACL Decoding Regression Check
+
+Runs malformed security descriptors through the ACL decoder of
+Extract_Users_Permissions.py. Each blob must be rejected by the structure walk
+(find_acl_sid_offsets returns None) and decoded by the byte-scan fallback,
+instead of raising IndexError.
+"""
+
+import sys
+
+from Extract_Users_Permissions import decode_acl_sids, find_acl_sid_offsets, find_all_sids_in_data
+
+
+MALFORMED_BLOBS = {
+    # Owner/group offset 20 leaves only one byte of SID
+    'truncated owner SID': bytes.fromhex('01c50080140000001400000014000000000000004d'),
+    # DACL with one 16-byte object ACE (type 5, flags 3); its SID would start at pos+44
+    'object ACE too short for its SID': bytes.fromhex(
+        '01000480' '00000000' '00000000' '00000000' '14000000'
+        '04001800' '01000000'
+        '05001000' '00000000' '03000000' '00000000'
+    ),
+}
+
+
+def main():
+    failures = 0
+    for name, blob in MALFORMED_BLOBS.items():
+        try:
+            offsets = find_acl_sid_offsets(blob)
+            result = decode_acl_sids(blob)
+        except Exception as e:
+            print(f"✗ {name}: {type(e).__name__}: {e}")
+            failures += 1
+            continue
+
+        fallback = [sid_info['offset'] for sid_info in find_all_sids_in_data(blob)]
+        if offsets is not None:
+            print(f"✗ {name}: structure walk accepted the blob ({offsets})")
+            failures += 1
+        else:
+            print(f"✓ {name}: fallback used, {len(fallback)} SIDs, decoded {result}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -12,17 +12,26 @@ Date: 2026-01-23
 import ldap3
 import csv
 import argparse
+import itertools
+import json
 import logging
 import sys
 import os
 import ssl
 from pathlib import Path
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory, stream_with_context
 from flask_cors import CORS
 import secrets
 import string
 
 
+# Entries per page for Simple Paged Results searches (AD MaxPageSize defaults to 1000)
+DEFAULT_PAGE_SIZE = 500
+
+# Member DNs per MODIFY_ADD when assigning users to groups
+DEFAULT_MEMBER_BATCH_SIZE = 500
+
+
 # ============================================================================
 # Configuration and Setup
 # ============================================================================
@@ -79,6 +88,25 @@ def add_connection_args(parser):
                           help='Path to directory containing CA certificates')
 
 
+def add_import_check_args(parser):
+    """Add the existence check arguments for group/user imports."""
+    parser.add_argument('--trust-add-result', action='store_true',
+                        help='Do not preload existing entries; treat "entry already exists" from the add as skipped')
+    add_page_size_arg(parser)
+
+
+def add_member_batch_size_arg(parser):
+    """Add the group member batch size argument to a parser."""
+    parser.add_argument('--member-batch-size', type=int, default=DEFAULT_MEMBER_BATCH_SIZE,
+                        help=f'Users added to a group per LDAP modify (default: {DEFAULT_MEMBER_BATCH_SIZE})')
+
+
+def add_page_size_arg(parser):
+    """Add the paged search page size argument to a parser."""
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f'Entries per page for paged LDAP searches (default: {DEFAULT_PAGE_SIZE})')
+
+
 # ============================================================================
 # LDAP Connection Manager
 # ============================================================================
@@ -622,17 +650,24 @@ class CSVImporter:
 class LDAPGroupManager:
     """Creates groups in Active Directory."""
 
-    def __init__(self, conn_manager, groups_ou, country=None):
+    def __init__(self, conn_manager, groups_ou, country=None, trust_add_result=False,
+                 page_size=DEFAULT_PAGE_SIZE):
         """Initialize with connection manager and groups OU.
 
         Args:
             conn_manager: LDAPConnectionManager instance
             groups_ou: Groups OU DN
             country: ISO 3166 two-letter country code to set on IST_* groups (e.g., 'SG')
+            trust_add_result: Skip existence checks and treat entryAlreadyExists (68)
+                from the add as skipped
+            page_size: Page size for the preload search
         """
         self.conn_manager = conn_manager
         self.groups_ou = groups_ou
         self.country = country
+        self.trust_add_result = trust_add_result
+        self.page_size = page_size
+        self.existing_cns = None  # Lower-cased cn values, set by preload_existing()
         self.stats = {
             'total': 0,
             'created': 0,
@@ -655,7 +690,7 @@ class LDAPGroupManager:
         dn = group_data['dn']
 
         # Check if already exists
-        if self.group_exists(cn):
+        if not self.trust_add_result and self.group_exists(cn):
             logging.warning(f'Group already exists: {cn}')
             return {
                 'success': False,
@@ -683,6 +718,7 @@ class LDAPGroupManager:
             success = conn.add(dn, attributes=group_data['attributes'])
 
             if success:
+                self._remember_group(cn)
                 logging.info(f'Created group: {cn}')
                 return {
                     'success': True,
@@ -694,6 +730,7 @@ class LDAPGroupManager:
                 error_msg = conn.result.get('description', 'Unknown error')
                 # Treat "already exists" as a skip (e.g., built-in groups like Domain Users)
                 if 'AlreadyExists' in error_msg or conn.result.get('result', 0) == 68:
+                    self._remember_group(cn)
                     logging.warning(f'Group already exists (AD built-in): {cn}')
                     return {
                         'success': False,
@@ -741,6 +778,9 @@ class LDAPGroupManager:
         groups = importer.read_groups()
         self.stats['total'] = len(groups)
 
+        if not self.trust_add_result:
+            self.preload_existing()
+
         logging.info(f'Processing {len(groups)} groups...')
 
         results = []
@@ -766,15 +806,36 @@ class LDAPGroupManager:
             'results': results
         }
 
+    def preload_existing(self):
+        """Load the cn of every group in the groups OU with one paged search.
+
+        group_exists() then answers from memory instead of searching per group.
+        """
+        search_mgr = LDAPSearchManager(self.conn_manager, self.groups_ou, page_size=self.page_size)
+        self.existing_cns = set()
+        for entry in search_mgr.iter_search('(objectClass=group)', attributes=['cn']):
+            self.existing_cns.update(cn.lower() for cn in entry['attributes'].get('cn', []))
+        logging.info(f'Preloaded {len(self.existing_cns)} existing groups from {self.groups_ou}')
+
+    def _remember_group(self, cn):
+        """Record a group that now exists in AD."""
+        if self.existing_cns is not None:
+            self.existing_cns.add(cn.lower())
+
     def group_exists(self, cn):
         """Check if group exists.
 
+        Uses the preloaded cn set if preload_existing() was called.
+
         Args:
             cn: Group CN
 
         Returns:
             bool: True if group exists
         """
+        if self.existing_cns is not None:
+            return cn.lower() in self.existing_cns
+
         conn = self.conn_manager.connection
         if not conn:
             conn = self.conn_manager.connect()
@@ -799,7 +860,8 @@ class LDAPGroupManager:
 class LDAPUserManager:
     """Creates users in Active Directory."""
 
-    def __init__(self, conn_manager, users_ou, password_strategy='use-csv', default_password=None, country=None):
+    def __init__(self, conn_manager, users_ou, password_strategy='use-csv', default_password=None, country=None,
+                 trust_add_result=False, page_size=DEFAULT_PAGE_SIZE):
         """Initialize with connection manager and users OU.
 
         Args:
@@ -808,12 +870,18 @@ class LDAPUserManager:
             password_strategy: Password strategy (use-csv, default, skip, random)
             default_password: Default password if strategy is 'default'
             country: ISO 3166 two-letter country code (e.g., 'SG') to set on users
+            trust_add_result: Skip existence checks and treat entryAlreadyExists (68)
+                from the add as skipped
+            page_size: Page size for the preload search
         """
         self.conn_manager = conn_manager
         self.users_ou = users_ou
         self.password_strategy = password_strategy
         self.default_password = default_password
         self.country = country
+        self.trust_add_result = trust_add_result
+        self.page_size = page_size
+        self.existing_usernames = None  # Lower-cased sAMAccountName values, set by preload_existing()
         self.stats = {
             'total': 0,
             'created': 0,
@@ -843,7 +911,7 @@ class LDAPUserManager:
         dn = user_data['dn']
 
         # Check if already exists
-        if self.user_exists(username):
+        if not self.trust_add_result and self.user_exists(username):
             logging.warning(f'User already exists: {username}')
             return {
                 'success': False,
@@ -873,6 +941,7 @@ class LDAPUserManager:
             success = conn.add(dn, attributes=user_data['attributes'])
 
             if success:
+                self._remember_user(username)
                 password_set = 'unicodePwd' in user_data['attributes']
                 logging.info(f'Created user: {username} (password set: {password_set})')
 
@@ -897,6 +966,7 @@ class LDAPUserManager:
             else:
                 error_msg = conn.result.get('description', 'Unknown error')
                 if 'AlreadyExists' in error_msg or conn.result.get('result', 0) == 68:
+                    self._remember_user(username)
                     logging.warning(f'User already exists (AD): {username}')
                     return {
                         'success': False,
@@ -947,6 +1017,9 @@ class LDAPUserManager:
         users = importer.read_users()
         self.stats['total'] = len(users)
 
+        if not self.trust_add_result:
+            self.preload_existing()
+
         logging.info(f'Processing {len(users)} users...')
 
         results = []
@@ -982,15 +1055,36 @@ class LDAPUserManager:
             'results': results
         }
 
+    def preload_existing(self):
+        """Load the sAMAccountName of every user in the users OU with one paged search.
+
+        user_exists() then answers from memory instead of searching per user.
+        """
+        search_mgr = LDAPSearchManager(self.conn_manager, self.users_ou, page_size=self.page_size)
+        self.existing_usernames = set()
+        for entry in search_mgr.iter_search('(objectClass=user)', attributes=['sAMAccountName']):
+            self.existing_usernames.update(name.lower() for name in entry['attributes'].get('sAMAccountName', []))
+        logging.info(f'Preloaded {len(self.existing_usernames)} existing users from {self.users_ou}')
+
+    def _remember_user(self, sam_account_name):
+        """Record a user that now exists in AD."""
+        if self.existing_usernames is not None:
+            self.existing_usernames.add(sam_account_name.lower())
+
     def user_exists(self, sam_account_name):
         """Check if user exists.
 
+        Uses the preloaded sAMAccountName set if preload_existing() was called.
+
         Args:
             sam_account_name: User sAMAccountName
 
         Returns:
             bool: True if user exists
         """
+        if self.existing_usernames is not None:
+            return sam_account_name.lower() in self.existing_usernames
+
         conn = self.conn_manager.connection
         if not conn:
             conn = self.conn_manager.connect()
@@ -1030,7 +1124,8 @@ class LDAPUserManager:
 class LDAPGroupMembershipManager:
     """Manages user-group membership assignments in Active Directory."""
 
-    def __init__(self, conn_manager, groups_ou, users_ou, users_csv, groups_csv):
+    def __init__(self, conn_manager, groups_ou, users_ou, users_csv, groups_csv,
+                 batch_size=DEFAULT_MEMBER_BATCH_SIZE):
         """Initialize with connection manager and OUs.
 
         Args:
@@ -1039,12 +1134,16 @@ class LDAPGroupMembershipManager:
             users_ou: Users OU DN
             users_csv: Path to Users.csv (for USER_ID to USERNAME mapping)
             groups_csv: Path to UserGroups.csv (for GROUP_ID to GROUPNAME mapping)
+            batch_size: Members added per MODIFY_ADD in assign_from_csv
         """
         self.conn_manager = conn_manager
         self.groups_ou = groups_ou
         self.users_ou = users_ou
         self.users_csv = users_csv
         self.groups_csv = groups_csv
+        if batch_size < 1:
+            raise ValueError(f'Member batch size must be at least 1, got {batch_size}')
+        self.batch_size = batch_size
         self.stats = {
             'total': 0,
             'assigned': 0,
@@ -1139,6 +1238,32 @@ class LDAPGroupMembershipManager:
                 'message': 'Dry-run mode'
             }
 
+        return self._add_member(group_dn, groupname, {
+            'user_id': user_id,
+            'group_id': group_id,
+            'username': username,
+            'user_dn': user_dn
+        })
+
+    def _add_member(self, group_dn, groupname, member):
+        """Add one user to a group with a single-value MODIFY_ADD.
+
+        Args:
+            group_dn: Group DN
+            groupname: Group name (for results and logging)
+            member: Dict with 'user_id', 'group_id', 'username' and 'user_dn'
+
+        Returns:
+            dict: Result with 'success', 'action', and optional 'error'
+        """
+        username = member['username']
+        result = {
+            'user_id': member['user_id'],
+            'group_id': member['group_id'],
+            'username': username,
+            'groupname': groupname
+        }
+
         try:
             conn = self.conn_manager.connection
             if not conn:
@@ -1147,91 +1272,149 @@ class LDAPGroupMembershipManager:
             # Add user to group by modifying group's member attribute
             success = conn.modify(
                 group_dn,
-                {'member': [(ldap3.MODIFY_ADD, [user_dn])]}
+                {'member': [(ldap3.MODIFY_ADD, [member['user_dn']])]}
             )
 
             if success:
                 logging.info(f'Added {username} to group {groupname}')
-                return {
+                result.update(success=True, action='assigned',
+                              message='User assigned to group successfully')
+                return result
+
+            error_msg = conn.result.get('description', 'Unknown error')
+            # AD answers attributeOrValueExists (20) for a value that is already present
+            if 'AlreadyExists' in error_msg or conn.result.get('result', 0) in (20, 68):
+                logging.debug(f'User {username} already in group {groupname}')
+                result.update(success=False, action='skipped', message='User already in group')
+                return result
+            logging.error(f'Failed to add {username} to group {groupname}: {error_msg}')
+            result.update(success=False, action='error', error=error_msg)
+            return result
+
+        except Exception as e:
+            logging.error(f'Exception adding {username} to group {groupname}: {e}')
+            result.update(success=False, action='error', error=str(e))
+            return result
+
+    def _add_members(self, group_dn, groupname, members):
+        """Add users to a group with one multi-value MODIFY_ADD.
+
+        If the batch is rejected (e.g. one DN does not exist or is already a
+        member), its users are added one by one so each gets its own result.
+
+        Args:
+            group_dn: Group DN
+            groupname: Group name (for results and logging)
+            members: List of member dicts (see _add_member)
+
+        Returns:
+            list: One result per member
+        """
+        if len(members) > 1:
+            try:
+                conn = self.conn_manager.connection
+                if not conn:
+                    conn = self.conn_manager.connect()
+
+                success = conn.modify(
+                    group_dn,
+                    {'member': [(ldap3.MODIFY_ADD, [member['user_dn'] for member in members])]}
+                )
+                error_msg = None if success else conn.result.get('description', 'Unknown error')
+            except Exception as e:
+                error_msg = str(e)
+
+            if error_msg is None:
+                logging.info(f'Added {len(members)} users to group {groupname}')
+                return [{
                     'success': True,
                     'action': 'assigned',
-                    'user_id': user_id,
-                    'group_id': group_id,
-                    'username': username,
+                    'user_id': member['user_id'],
+                    'group_id': member['group_id'],
+                    'username': member['username'],
                     'groupname': groupname,
                     'message': 'User assigned to group successfully'
-                }
-            else:
-                error_msg = conn.result.get('description', 'Unknown error')
-                if 'AlreadyExists' in error_msg or conn.result.get('result', 0) == 68:
-                    logging.debug(f'User {username} already in group {groupname}')
-                    return {
-                        'success': False,
-                        'action': 'skipped',
-                        'user_id': user_id,
-                        'group_id': group_id,
-                        'username': username,
-                        'groupname': groupname,
-                        'message': 'User already in group'
-                    }
-                logging.error(f'Failed to add {username} to group {groupname}: {error_msg}')
-                return {
-                    'success': False,
-                    'action': 'error',
-                    'user_id': user_id,
-                    'group_id': group_id,
-                    'username': username,
-                    'groupname': groupname,
-                    'error': error_msg
-                }
+                } for member in members]
 
-        except Exception as e:
-            logging.error(f'Exception adding {username} to group {groupname}: {e}')
-            return {
-                'success': False,
-                'action': 'error',
-                'user_id': user_id,
-                'group_id': group_id,
-                'username': username,
-                'groupname': groupname,
-                'error': str(e)
-            }
+            logging.warning(f'Adding {len(members)} users to group {groupname} failed ({error_msg}), '
+                            f'retrying one by one')
 
-    def _user_in_group(self, user_dn, group_dn):
-        """Check if user is already in group.
+        return [self._add_member(group_dn, groupname, member) for member in members]
+
+    @staticmethod
+    def _normalize_dn(dn):
+        """Normalize a DN for comparison (AD returns its own case and spacing)."""
+        return ','.join(rdn.strip() for rdn in dn.split(',')).lower()
+
+    def get_group_members(self, group_dn):
+        """Read all member DNs of a group.
+
+        AD returns at most MaxValRange (1500) values per attribute read and
+        signals the rest with member;range=<start>-<end>; the remaining ranges
+        are requested until the range ending in '*'.
 
         Args:
-            user_dn: User DN
             group_dn: Group DN
 
         Returns:
-            bool: True if user is already a member
+            set: Normalized member DNs (empty if the group cannot be read)
         """
         conn = self.conn_manager.connection
         if not conn:
             conn = self.conn_manager.connect()
 
+        members = set()
+        attribute = 'member'
         try:
-            result = conn.search(
-                search_base=group_dn,
-                search_filter='(objectClass=group)',
-                search_scope=ldap3.BASE,
-                attributes=['member']
-            )
-
-            if result and len(conn.entries) > 0:
-                group_entry = conn.entries[0]
-                members = group_entry.member.values if hasattr(group_entry, 'member') else []
-                return user_dn in members
+            while attribute:
+                result = conn.search(
+                    search_base=group_dn,
+                    search_filter='(objectClass=group)',
+                    search_scope=ldap3.BASE,
+                    attributes=[attribute]
+                )
+                entries = [item for item in conn.response or [] if item.get('type') == 'searchResEntry']
+                if not result or not entries:
+                    break
 
-            return False
+                attribute = None
+                for name, values in entries[0]['attributes'].items():
+                    name = name.lower()
+                    if name != 'member' and not name.startswith('member;range='):
+                        continue
+                    if not isinstance(values, list):
+                        values = [values]
+                    members.update(self._normalize_dn(value) for value in values)
+
+                    # member;range=<start>-<end>: more values follow unless end is '*'
+                    if name.startswith('member;range='):
+                        end = name.rsplit('-', 1)[1]
+                        if end != '*':
+                            attribute = f'member;range={int(end) + 1}-*'
         except Exception as e:
-            logging.debug(f'Error checking group membership: {e}')
-            return False
+            logging.debug(f'Error reading members of {group_dn}: {e}')
+
+        return members
+
+    def _user_in_group(self, user_dn, group_dn):
+        """Check if user is already in group.
+
+        Args:
+            user_dn: User DN
+            group_dn: Group DN
+
+        Returns:
+            bool: True if user is already a member
+        """
+        return self._normalize_dn(user_dn) in self.get_group_members(group_dn)
 
     def assign_from_csv(self, csv_file, dry_run=False, continue_on_error=True):
         """Bulk assign users to groups from CSV.
 
+        Assignments are grouped by group: each group's members are read once,
+        and the missing users are added in MODIFY_ADD batches of batch_size.
+        Results are reported per assignment, grouped by group.
+
         Args:
             csv_file: Path to UserGroupAssignments.csv
             dry_run: Preview without executing
@@ -1255,14 +1438,10 @@ class LDAPGroupMembershipManager:
         logging.info(f'Processing {len(assignments)} user-group assignments...')
 
         results = []
-        for assignment in assignments:
-            result = self.assign_user_to_group(
-                assignment['USER_ID'],
-                assignment['GROUP_ID'],
-                dry_run=dry_run
-            )
 
-            # Update stats
+        def record(result):
+            """Update stats; returns False if processing should stop."""
+            results.append(result)
             if result['action'] in ('assigned', 'would_assign'):
                 self.stats['assigned'] += 1
             elif result['action'] == 'skipped':
@@ -1271,9 +1450,83 @@ class LDAPGroupMembershipManager:
                 self.stats['errors'] += 1
                 if not continue_on_error:
                     logging.error('Stopping due to error (continue-on-error disabled)')
-                    break
+                    return False
+            return True
 
-            results.append(result)
+        # Map IDs to names and group the assignments by group DN
+        by_group = {}  # group_dn -> (groupname, [member dicts])
+        for assignment in assignments:
+            user_id = assignment['USER_ID']
+            group_id = assignment['GROUP_ID']
+            username = self.user_id_to_username.get(user_id)
+            groupname = self.group_id_to_groupname.get(group_id)
+
+            if not username or not groupname:
+                if not username:
+                    logging.warning(f'USER_ID {user_id} not found in Users.csv')
+                    error = f'USER_ID {user_id} not found'
+                else:
+                    logging.warning(f'GROUP_ID {group_id} not found in UserGroups.csv')
+                    error = f'GROUP_ID {group_id} not found'
+                if not record({
+                    'success': False,
+                    'action': 'error',
+                    'error': error,
+                    'user_id': user_id,
+                    'group_id': group_id
+                }):
+                    return {'stats': self.stats, 'results': results}
+                continue
+
+            group_dn = f"cn={groupname},{self.groups_ou}"
+            by_group.setdefault(group_dn, (groupname, []))[1].append({
+                'user_id': user_id,
+                'group_id': group_id,
+                'username': username,
+                'user_dn': f"cn={username},{self.users_ou}"
+            })
+
+        logging.info(f'Assignments target {len(by_group)} groups')
+
+        for group_dn, (groupname, members) in by_group.items():
+            # Diff against the group's current members (read once per group)
+            existing = self.get_group_members(group_dn)
+            to_add = []
+            for member in members:
+                key = self._normalize_dn(member['user_dn'])
+                if key in existing:
+                    logging.debug(f'User {member["username"]} already in group {groupname}')
+                    record({
+                        'success': False,
+                        'action': 'skipped',
+                        'user_id': member['user_id'],
+                        'group_id': member['group_id'],
+                        'username': member['username'],
+                        'groupname': groupname,
+                        'message': 'User already in group'
+                    })
+                    continue
+                existing.add(key)
+                to_add.append(member)
+
+            if dry_run:
+                for member in to_add:
+                    logging.info(f'[DRY-RUN] Would add {member["username"]} to group {groupname}')
+                    record({
+                        'success': True,
+                        'action': 'would_assign',
+                        'user_id': member['user_id'],
+                        'group_id': member['group_id'],
+                        'username': member['username'],
+                        'groupname': groupname,
+                        'message': 'Dry-run mode'
+                    })
+                continue
+
+            for start in range(0, len(to_add), self.batch_size):
+                batch_results = self._add_members(group_dn, groupname, to_add[start:start + self.batch_size])
+                if not all([record(result) for result in batch_results]):
+                    return {'stats': self.stats, 'results': results}
 
         return {
             'stats': self.stats,
@@ -1288,18 +1541,27 @@ class LDAPGroupMembershipManager:
 class LDAPSearchManager:
     """Searches and browses LDAP directory."""
 
-    def __init__(self, conn_manager, base_dn):
+    def __init__(self, conn_manager, base_dn, page_size=DEFAULT_PAGE_SIZE):
         """Initialize with connection manager and base DN.
 
         Args:
             conn_manager: LDAPConnectionManager instance
             base_dn: Base DN for searches
+            page_size: Entries per page of the Simple Paged Results control
         """
         self.conn_manager = conn_manager
         self.base_dn = base_dn
+        # A page size of 0 would abandon the paged search (RFC 2696)
+        if page_size < 1:
+            raise ValueError(f'Page size must be at least 1, got {page_size}')
+        self.page_size = page_size
 
-    def search(self, filter_str, attributes=None, scope=ldap3.SUBTREE, base_dn=None):
-        """Generic LDAP search.
+    def iter_search(self, filter_str, attributes=None, scope=ldap3.SUBTREE, base_dn=None):
+        """Generic LDAP search, yielding entries as pages arrive.
+
+        Uses the Simple Paged Results control (RFC 2696), so the result is not
+        capped by the server's MaxPageSize/size limit and only one page is held
+        in memory at a time.
 
         Args:
             filter_str: LDAP filter string
@@ -1307,8 +1569,8 @@ class LDAPSearchManager:
             scope: Search scope
             base_dn: Base DN for search (uses default if None)
 
-        Returns:
-            list: List of entry dictionaries
+        Yields:
+            dict: {'dn': ..., 'attributes': {name: [values]}}
         """
         search_base = base_dn or self.base_dn
 
@@ -1318,63 +1580,112 @@ class LDAPSearchManager:
             if not conn or not conn.bound:
                 conn = self.conn_manager.connect()
 
+            yielded = False
             try:
-                conn.search(
+                for item in conn.extend.standard.paged_search(
                     search_base=search_base,
                     search_filter=filter_str,
                     search_scope=scope,
                     attributes=attributes or ldap3.ALL_ATTRIBUTES,
-                    size_limit=500
-                )
+                    paged_size=self.page_size,
+                    generator=True
+                ):
+                    # Skip search result references (referrals)
+                    if item.get('type') != 'searchResEntry':
+                        continue
+                    yielded = True
+                    yield {
+                        'dn': item['dn'],
+                        'attributes': {
+                            name: values if isinstance(values, list) else [values]
+                            for name, values in item['attributes'].items()
+                        }
+                    }
 
-                # Always check conn.entries - ldap3 populates them even on
-                # sizeLimitExceeded (AD returns partial results)
-                entries = []
-                for entry in conn.entries:
-                    entries.append({
-                        'dn': entry.entry_dn,
-                        'attributes': entry.entry_attributes_as_dict
-                    })
-                return entries
+                # A failed page ends the paged search without an exception
+                if conn.result and conn.result.get('result') not in (0, None):
+                    logging.warning(f'Search ended with {conn.result.get("description")}: '
+                                    f'{conn.result.get("message")} - results may be incomplete')
+                return
             except Exception as e:
+                if yielded:
+                    # Entries were already handed out, so the search cannot be restarted
+                    logging.error(f'Search error after partial results: {e}')
+                    raise
                 if attempt == 0:
                     logging.warning(f'Search failed, reconnecting: {e}')
                     self.conn_manager.disconnect()
                     continue
                 logging.error(f'Search error after reconnect: {e}')
-                return []
+                return
 
-    def search_users(self, username_filter=None):
-        """Search for users.
+    def search(self, filter_str, attributes=None, scope=ldap3.SUBTREE, base_dn=None):
+        """Generic LDAP search.
 
         Args:
-            username_filter: Username pattern to filter (None for all)
+            filter_str: LDAP filter string
+            attributes: List of attributes to retrieve
+            scope: Search scope
+            base_dn: Base DN for search (uses default if None)
 
         Returns:
-            list: List of user entries
+            list: List of entry dictionaries (all pages)
+        """
+        return list(self.iter_search(filter_str, attributes=attributes, scope=scope, base_dn=base_dn))
+
+    def iter_users(self, username_filter=None):
+        """Search for users, yielding entries.
+
+        Args:
+            username_filter: Username pattern to filter (None for all)
+
+        Yields:
+            dict: User entries
         """
         if username_filter:
             filter_str = f'(&(objectClass=user)(cn=*{username_filter}*))'
         else:
             filter_str = '(objectClass=user)'
 
-        return self.search(filter_str)
+        return self.iter_search(filter_str)
 
-    def search_groups(self, groupname_filter=None):
-        """Search for groups.
+    def iter_groups(self, groupname_filter=None):
+        """Search for groups, yielding entries.
 
         Args:
             groupname_filter: Groupname pattern to filter (None for all)
 
-        Returns:
-            list: List of group entries
+        Yields:
+            dict: Group entries
         """
         if groupname_filter:
             filter_str = f'(&(objectClass=group)(cn=*{groupname_filter}*))'
         else:
             filter_str = '(objectClass=group)'
 
-        return self.search(filter_str)
+        return self.iter_search(filter_str)
+
+    def search_users(self, username_filter=None):
+        """Search for users.
+
+        Args:
+            username_filter: Username pattern to filter (None for all)
+
+        Returns:
+            list: List of user entries
+        """
+        return list(self.iter_users(username_filter))
+
+    def search_groups(self, groupname_filter=None):
+        """Search for groups.
+
+        Args:
+            groupname_filter: Groupname pattern to filter (None for all)
+
+        Returns:
+            list: List of group entries
+        """
+        return list(self.iter_groups(groupname_filter))
 
     def get_tree_structure(self, base_dn=None):
         """Get LDAP tree structure for browser.
@@ -1386,7 +1697,7 @@ class LDAPSearchManager:
             list: List of OU entries
         """
         filter_str = '(objectClass=organizationalUnit)'
-        ous = self.search(filter_str, base_dn=base_dn)
+        ous = self.iter_search(filter_str, attributes=['ou'], base_dn=base_dn)
 
         tree = []
         for ou in ous:
@@ -1440,6 +1751,13 @@ class LDAPBrowserAPI:
             return list(obj)
         return str(obj)
 
+    def _stream_json_array(self, entries):
+        """Serialize entries one at a time as a JSON array."""
+        yield '['
+        for i, entry in enumerate(entries):
+            yield (',' if i else '') + json.dumps(entry, default=self._json_default)
+        yield ']'
+
     def _register_routes(self):
         """Register Flask routes."""
 
@@ -1478,22 +1796,30 @@ class LDAPBrowserAPI:
 
         @self.app.route('/api/search', methods=['GET'])
         def search():
-            """Search LDAP directory."""
+            """Search LDAP directory.
+
+            Results are streamed as a JSON array while the LDAP pages arrive.
+            Optional 'limit' caps the number of entries (0 = all).
+            """
             try:
                 query = request.args.get('q', '')
                 search_type = request.args.get('type', 'all')
+                limit = request.args.get('limit', 0, type=int)
 
                 if search_type == 'user':
-                    results = self.search_manager.search_users(query)
+                    results = self.search_manager.iter_users(query)
                 elif search_type == 'group':
-                    results = self.search_manager.search_groups(query)
+                    results = self.search_manager.iter_groups(query)
                 else:
                     # Search both
-                    users = self.search_manager.search_users(query)
-                    groups = self.search_manager.search_groups(query)
-                    results = users + groups
+                    results = itertools.chain(self.search_manager.iter_users(query),
+                                              self.search_manager.iter_groups(query))
 
-                return jsonify(results)
+                if limit > 0:
+                    results = itertools.islice(results, limit)
+
+                return Response(stream_with_context(self._stream_json_array(results)),
+                                mimetype='application/json')
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
 
@@ -1785,7 +2111,13 @@ def cmd_add_groups(args):
         return 1
 
     # Create group manager
-    group_mgr = LDAPGroupManager(conn_mgr, args.groups_ou, country=getattr(args, 'country', None))
+    group_mgr = LDAPGroupManager(
+        conn_mgr,
+        args.groups_ou,
+        country=getattr(args, 'country', None),
+        trust_add_result=getattr(args, 'trust_add_result', False),
+        page_size=getattr(args, 'page_size', DEFAULT_PAGE_SIZE)
+    )
 
     # Add groups
     result = group_mgr.add_groups_from_csv(
@@ -1854,7 +2186,9 @@ def cmd_add_users(args):
         args.users_ou,
         password_strategy=args.password_strategy,
         default_password=getattr(args, 'default_password', None),
-        country=getattr(args, 'country', None)
+        country=getattr(args, 'country', None),
+        trust_add_result=getattr(args, 'trust_add_result', False),
+        page_size=getattr(args, 'page_size', DEFAULT_PAGE_SIZE)
     )
 
     # Add users
@@ -1946,19 +2280,17 @@ def cmd_search(args):
     conn_mgr.connect()
 
     # Create search manager
-    search_mgr = LDAPSearchManager(conn_mgr, args.base_dn)
+    search_mgr = LDAPSearchManager(conn_mgr, args.base_dn, page_size=args.page_size)
 
     # Parse attributes
     attributes = None
     if hasattr(args, 'attributes') and args.attributes:
         attributes = [attr.strip() for attr in args.attributes.split(',')]
 
-    # Search
-    results = search_mgr.search(args.filter, attributes=attributes)
-
-    # Print results
-    logging.info(f'Found {len(results)} entries')
-    for i, entry in enumerate(results, 1):
+    # Search and print results as they arrive
+    count = 0
+    for i, entry in enumerate(search_mgr.iter_search(args.filter, attributes=attributes), 1):
+        count = i
         print(f"\n--- Entry {i} ---")
         print(f"DN: {entry['dn']}")
         print("Attributes:")
@@ -1969,6 +2301,8 @@ def cmd_search(args):
             else:
                 print(f"  {attr}: {values}")
 
+    logging.info(f'Found {count} entries')
+
     conn_mgr.disconnect()
     return 0
 
@@ -1997,7 +2331,7 @@ def cmd_serve_browser(args):
         return 1
 
     # Create search manager
-    search_mgr = LDAPSearchManager(conn_mgr, args.base_dn)
+    search_mgr = LDAPSearchManager(conn_mgr, args.base_dn, page_size=args.page_size)
 
     # Create and run API
     api = LDAPBrowserAPI(conn_mgr, search_mgr)
@@ -2125,77 +2459,9 @@ def cmd_export_rid_mapping(args):
     conn_mgr.connect()
 
     # Create search manager
-    search_mgr = LDAPSearchManager(conn_mgr, args.base_dn)
-
-    mapping_rows = []
-
-    # Export user mappings
-    logging.info('Querying users from AD...')
-    users_filter = '(&(objectClass=user)(employeeID=*))'  # Only users with employeeID
-    if hasattr(args, 'users_ou') and args.users_ou:
-        users = search_mgr.search(users_filter, base_dn=args.users_ou,
-                                  attributes=['sAMAccountName', 'employeeID', 'objectSid'])
-    else:
-        users = search_mgr.search(users_filter,
-                                  attributes=['sAMAccountName', 'employeeID', 'objectSid'])
+    search_mgr = LDAPSearchManager(conn_mgr, args.base_dn, page_size=args.page_size)
 
-    for user in users:
-        attrs = user['attributes']
-        employee_id = attrs.get('employeeID', [None])[0]
-        username = attrs.get('sAMAccountName', [None])[0]
-        object_sid = attrs.get('objectSid', [None])[0]
-
-        if employee_id and object_sid:
-            try:
-                rid = extract_rid_from_sid(object_sid)
-                mapping_rows.append({
-                    'Original_ID': employee_id,
-                    'Object_Type': 'User',
-                    'Name': username,
-                    'AD_SID': format_sid(object_sid),
-                    'AD_RID': rid
-                })
-            except Exception as e:
-                logging.warning(f'Failed to parse SID for user {username}: {e} (type={type(object_sid).__name__}, value={repr(object_sid)[:100]})')
-
-    logging.info(f'Found {len(mapping_rows)} users with employeeID')
-
-    # Export group mappings
-    logging.info('Querying groups from AD...')
-    groups_filter = '(&(objectClass=group)(description=*[OriginalID:*))'  # Groups with original ID
-    if hasattr(args, 'groups_ou') and args.groups_ou:
-        groups = search_mgr.search(groups_filter, base_dn=args.groups_ou,
-                                   attributes=['cn', 'description', 'objectSid'])
-    else:
-        groups = search_mgr.search(groups_filter,
-                                   attributes=['cn', 'description', 'objectSid'])
-
-    user_count = len(mapping_rows)
-    for group in groups:
-        attrs = group['attributes']
-        cn = attrs.get('cn', [None])[0]
-        description = attrs.get('description', [''])[0]
-        object_sid = attrs.get('objectSid', [None])[0]
-
-        # Extract original ID from description [OriginalID:12345]
-        original_id = extract_original_id_from_description(description)
-
-        if original_id and object_sid:
-            try:
-                rid = extract_rid_from_sid(object_sid)
-                mapping_rows.append({
-                    'Original_ID': original_id,
-                    'Object_Type': 'Group',
-                    'Name': cn,
-                    'AD_SID': format_sid(object_sid),
-                    'AD_RID': rid
-                })
-            except Exception as e:
-                logging.warning(f'Failed to parse SID for group {cn}: {e} (type={type(object_sid).__name__}, value={repr(object_sid)[:100]})')
-
-    logging.info(f'Found {len(mapping_rows) - user_count} groups with OriginalID')
-
-    # Write mapping CSV
+    # Write mapping CSV while the paged searches stream in
     output_file = args.output_file if hasattr(args, 'output_file') else 'rid_mapping.csv'
     logging.info(f'Writing RID mapping to {output_file}...')
 
@@ -2203,14 +2469,75 @@ def cmd_export_rid_mapping(args):
         fieldnames = ['Original_ID', 'Object_Type', 'Name', 'AD_SID', 'AD_RID']
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        writer.writerows(mapping_rows)
 
-    logging.info(f'RID mapping exported: {len(mapping_rows)} entries')
+        # Export user mappings
+        logging.info('Querying users from AD...')
+        users_filter = '(&(objectClass=user)(employeeID=*))'  # Only users with employeeID
+        users = search_mgr.iter_search(users_filter, base_dn=getattr(args, 'users_ou', None),
+                                       attributes=['sAMAccountName', 'employeeID', 'objectSid'])
+
+        user_count = 0
+        for user in users:
+            attrs = user['attributes']
+            employee_id = attrs.get('employeeID', [None])[0]
+            username = attrs.get('sAMAccountName', [None])[0]
+            object_sid = attrs.get('objectSid', [None])[0]
+
+            if employee_id and object_sid:
+                try:
+                    rid = extract_rid_from_sid(object_sid)
+                    writer.writerow({
+                        'Original_ID': employee_id,
+                        'Object_Type': 'User',
+                        'Name': username,
+                        'AD_SID': format_sid(object_sid),
+                        'AD_RID': rid
+                    })
+                    user_count += 1
+                except Exception as e:
+                    logging.warning(f'Failed to parse SID for user {username}: {e} (type={type(object_sid).__name__}, value={repr(object_sid)[:100]})')
+
+        logging.info(f'Found {user_count} users with employeeID')
+
+        # Export group mappings
+        logging.info('Querying groups from AD...')
+        groups_filter = '(&(objectClass=group)(description=*[OriginalID:*))'  # Groups with original ID
+        groups = search_mgr.iter_search(groups_filter, base_dn=getattr(args, 'groups_ou', None),
+                                        attributes=['cn', 'description', 'objectSid'])
+
+        group_count = 0
+        for group in groups:
+            attrs = group['attributes']
+            cn = attrs.get('cn', [None])[0]
+            description = attrs.get('description', [''])[0]
+            object_sid = attrs.get('objectSid', [None])[0]
+
+            # Extract original ID from description [OriginalID:12345]
+            original_id = extract_original_id_from_description(description)
+
+            if original_id and object_sid:
+                try:
+                    rid = extract_rid_from_sid(object_sid)
+                    writer.writerow({
+                        'Original_ID': original_id,
+                        'Object_Type': 'Group',
+                        'Name': cn,
+                        'AD_SID': format_sid(object_sid),
+                        'AD_RID': rid
+                    })
+                    group_count += 1
+                except Exception as e:
+                    logging.warning(f'Failed to parse SID for group {cn}: {e} (type={type(object_sid).__name__}, value={repr(object_sid)[:100]})')
+
+        logging.info(f'Found {group_count} groups with OriginalID')
+
+    total = user_count + group_count
+    logging.info(f'RID mapping exported: {total} entries')
     logging.info('='*70)
     logging.info('MAPPING EXPORT COMPLETE')
-    logging.info(f'Total entries: {len(mapping_rows)}')
+    logging.info(f'Total entries: {total}')
     logging.info(f'Users: {user_count}')
-    logging.info(f'Groups: {len(mapping_rows) - user_count}')
+    logging.info(f'Groups: {group_count}')
     logging.info(f'Output file: {output_file}')
     logging.info('='*70)
 
@@ -2450,7 +2777,8 @@ def cmd_assign_groups(args):
         args.groups_ou,
         args.users_ou,
         args.users_csv,
-        args.groups_csv
+        args.groups_csv,
+        batch_size=getattr(args, 'member_batch_size', DEFAULT_MEMBER_BATCH_SIZE)
     )
 
     # Assign users to groups
@@ -2558,6 +2886,7 @@ Examples:
     groups_parser.add_argument('--country', help='ISO 3166 two-letter country code to set on IST_* groups (e.g., SG)')
     groups_parser.add_argument('--dry-run', action='store_true', help='Preview without executing')
     groups_parser.add_argument('--continue-on-error', action='store_true', default=True, help='Continue if entry fails')
+    add_import_check_args(groups_parser)
 
     # Add users
     users_parser = subparsers.add_parser('add-users', help='Import users from CSV')
@@ -2570,6 +2899,7 @@ Examples:
     users_parser.add_argument('--default-password', help='Default password (required if strategy is default)')
     users_parser.add_argument('--dry-run', action='store_true', help='Preview without executing')
     users_parser.add_argument('--continue-on-error', action='store_true', default=True, help='Continue if entry fails')
+    add_import_check_args(users_parser)
 
     # Add all
     all_parser = subparsers.add_parser('add-all', help='Import groups, users, and assignments')
@@ -2585,18 +2915,22 @@ Examples:
     all_parser.add_argument('--default-password', help='Default password (required if strategy is default)')
     all_parser.add_argument('--dry-run', action='store_true', help='Preview without executing')
     all_parser.add_argument('--continue-on-error', action='store_true', default=True, help='Continue if entry fails')
+    add_import_check_args(all_parser)
+    add_member_batch_size_arg(all_parser)
 
     # Search
     search_parser = subparsers.add_parser('search', help='Search LDAP directory')
     add_connection_args(search_parser)
     search_parser.add_argument('--filter', required=True, help='LDAP filter (e.g., "(objectClass=user)")')
     search_parser.add_argument('--attributes', help='Comma-separated attributes to retrieve')
+    add_page_size_arg(search_parser)
 
     # Serve browser
     browser_parser = subparsers.add_parser('serve-browser', help='Start browser API')
     add_connection_args(browser_parser)
     browser_parser.add_argument('--api-host', default='127.0.0.1', help='API host (default: 127.0.0.1)')
     browser_parser.add_argument('--api-port', type=int, default=5000, help='API port (default: 5000)')
+    add_page_size_arg(browser_parser)
 
     # Verify import
     verify_parser = subparsers.add_parser('verify-import', help='Verify imported entries')
@@ -2614,6 +2948,7 @@ Examples:
     assign_parser.add_argument('--assignments-csv', required=True, help='Path to UserGroupAssignments.csv')
     assign_parser.add_argument('--dry-run', action='store_true', help='Preview without executing')
     assign_parser.add_argument('--continue-on-error', action='store_true', default=True, help='Continue if assignment fails')
+    add_member_batch_size_arg(assign_parser)
 
     # Export RID mapping
     export_parser = subparsers.add_parser('export-rid-mapping', help='Export Original RID to AD RID mapping')
@@ -2622,6 +2957,7 @@ Examples:
     export_parser.add_argument('--groups-ou', help='Groups OU DN (optional, for filtering)')
     export_parser.add_argument('--output-file', default='rid_mapping.csv',
                               help='Output mapping file (default: rid_mapping.csv)')
+    add_page_size_arg(export_parser)
 
     # Delete groups
     del_groups_parser = subparsers.add_parser('delete-groups', help='Delete imported groups from AD')
@@ -2652,6 +2988,11 @@ Examples:
 
     args = parser.parse_args()
 
+    if getattr(args, 'page_size', 1) < 1:
+        parser.error('--page-size must be at least 1')
+    if getattr(args, 'member_batch_size', 1) < 1:
+        parser.error('--member-batch-size must be at least 1')
+
     # Setup logging
     # translate-permissions uses --output-dir for translated files, so log to '.' for that command
     if args.command == 'translate-permissions':
@@ -12,6 +12,7 @@ Features:
 - Timezone conversion (AS_OF_TIMESTAMP to UTC) with configurable source timezone
 - Comprehensive logging and error handling
 - SEGMENTS populated from RPT file SECTIONHDR (requires --rptfolder)
+- Bulk mode (--bulk): one ordered query per chunk of species instead of one per species
 
 Timezone Support:
 - Uses IANA timezone database (pytz library)
@@ -25,10 +26,19 @@ import argparse
 import logging
 import sys
 import os
+from itertools import groupby
 from pathlib import Path
 from datetime import datetime, timedelta
 import pytz
 from rpt_section_reader import read_sectionhdr, format_segments
+from rpt_index_cache import get_rpt_index
+
+
+# Bulk mode: species IDs per query (SQL Server allows at most 2100 parameters)
+BULK_CHUNK_SIZE = 1000
+MAX_BULK_CHUNK_SIZE = 2000
+# Rows fetched per round-trip while streaming a bulk query
+FETCH_BATCH_SIZE = 5000
 
 
 # ============================================================================
@@ -99,6 +109,9 @@ Examples:
   python Extract_Instances.py --server localhost --database IntelliSTOR --windows-auth --start-year 2023 \\
       --rptfolder "/path/to/rpt/files"
 
+  # Bulk mode: one query per 1000 species, IN_USE updates written once at the end
+  python Extract_Instances.py --server localhost --database IntelliSTOR --windows-auth --start-year 2023 --bulk
+
   # Custom paths with all options
   python Extract_Instances.py --server myserver --database IntelliSTOR --windows-auth \\
       --start-year 2023 --end-year 2025 --year-from-filename --timezone "Asia/Singapore" --quiet \\
@@ -179,6 +192,29 @@ Examples:
              'SEGMENTS column is populated from RPT file SECTIONHDR when provided. '
              'Without this option, the SEGMENTS column will be empty.'
     )
+    parser.add_argument(
+        '--rpt-index-cache',
+        nargs='?',
+        const='',
+        metavar='DIR',
+        help='Cache RPT section tables as .rptidx files so repeat runs skip the SECTIONHDR scan '
+             '(in DIR, or next to each RPT file if DIR is omitted). Requires --rptfolder.'
+    )
+
+    # Bulk mode
+    parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='Query instances for many report species at once (one ordered query per chunk of '
+             'REPORT_SPECIES_IDs) instead of one query per species; IN_USE=0 updates are '
+             'written to the input CSV once at the end'
+    )
+    parser.add_argument(
+        '--bulk-chunk-size',
+        type=int,
+        default=BULK_CHUNK_SIZE,
+        help=f'REPORT_SPECIES_IDs per bulk query (default: {BULK_CHUNK_SIZE}, max: {MAX_BULK_CHUNK_SIZE})'
+    )
 
     # Output options
     parser.add_argument(
@@ -203,9 +239,15 @@ Examples:
     except pytz.exceptions.UnknownTimeZoneError:
         parser.error(f'Invalid timezone: {args.timezone}. Use IANA timezone names like "Asia/Singapore", "America/New_York", "Europe/London", "Asia/Tokyo", "UTC". See: https://en.wikipedia.org/wiki/List_of_tz_database_time_zones')
 
+    # Validate bulk parameters
+    if not 1 <= args.bulk_chunk_size <= MAX_BULK_CHUNK_SIZE:
+        parser.error(f'--bulk-chunk-size must be between 1 and {MAX_BULK_CHUNK_SIZE}')
+
     # Validate rptfolder parameter
     if args.rptfolder and not os.path.isdir(args.rptfolder):
         parser.error(f'RPT folder does not exist: {args.rptfolder}')
+    if args.rpt_index_cache is not None and not args.rptfolder:
+        parser.error('--rpt-index-cache requires --rptfolder')
 
     return args
 
@@ -346,6 +388,20 @@ def update_in_use(csv_path, report_species_id, new_in_use_value=0):
         report_species_id: Report_Species_Id to update
         new_in_use_value: New value for IN_USE column (default: 0)
     """
+    update_in_use_many(csv_path, [report_species_id], new_in_use_value)
+
+
+def update_in_use_many(csv_path, report_species_ids, new_in_use_value=0):
+    """
+    Update IN_USE column for several report species in one CSV rewrite.
+
+    Args:
+        csv_path: Path to Report_Species.csv file
+        report_species_ids: Report_Species_Ids to update
+        new_in_use_value: New value for IN_USE column (default: 0)
+    """
+    id_strings = {str(rid) for rid in report_species_ids}
+    target = ', '.join(sorted(id_strings, key=int)) if len(id_strings) <= 10 else f'{len(id_strings)} report species'
     try:
         # Read entire CSV
         rows = []
@@ -353,9 +409,9 @@ def update_in_use(csv_path, report_species_id, new_in_use_value=0):
             reader = csv.DictReader(f)
             fieldnames = reader.fieldnames
             for row in reader:
-                if row['REPORT_SPECIES_ID'] == str(report_species_id):
+                if row['REPORT_SPECIES_ID'] in id_strings:
                     row['IN_USE'] = str(new_in_use_value)
-                    logging.debug(f'Updating REPORT_SPECIES_ID {report_species_id}: IN_USE={new_in_use_value}')
+                    logging.debug(f'Updating REPORT_SPECIES_ID {row["REPORT_SPECIES_ID"]}: IN_USE={new_in_use_value}')
                 rows.append(row)
 
         # Write back atomically (temp file + rename)
@@ -367,17 +423,17 @@ def update_in_use(csv_path, report_species_id, new_in_use_value=0):
 
         # Atomic replace
         os.replace(temp_path, csv_path)
-        logging.info(f'Updated IN_USE={new_in_use_value} for REPORT_SPECIES_ID {report_species_id}')
+        logging.info(f'Updated IN_USE={new_in_use_value} for REPORT_SPECIES_ID {target}')
 
     except Exception as e:
-        logging.error(f'Failed to update IN_USE for REPORT_SPECIES_ID {report_species_id}: {e}')
+        logging.error(f'Failed to update IN_USE for REPORT_SPECIES_ID {target}: {e}')
 
 
 # ============================================================================
 # SQL Query Execution
 # ============================================================================
 
-def get_sql_query(start_year, end_year=None):
+def get_sql_query(start_year, end_year=None, species_count=None):
     """
     Return SQL Server query for extracting report instances with year filtering.
 
@@ -387,6 +443,8 @@ def get_sql_query(start_year, end_year=None):
     Args:
         start_year: Start year for filtering (inclusive)
         end_year: Optional end year for filtering (exclusive)
+        species_count: If given, filter on an IN list of this many REPORT_SPECIES_IDs
+                       and order by species first (bulk mode)
 
     Returns:
         str: SQL query with appropriate WHERE clauses
@@ -406,14 +464,22 @@ LEFT JOIN RPTFILE_INSTANCE rfi
     AND ri.REPROCESS_IN_PROGRESS = rfi.REPROCESS_IN_PROGRESS
 LEFT JOIN RPTFILE rf
     ON rfi.RPT_FILE_ID = rf.RPT_FILE_ID
-WHERE ri.REPORT_SPECIES_ID = %s
+WHERE ri.REPORT_SPECIES_ID {species_filter}
     AND ri.AS_OF_TIMESTAMP >= %s"""
 
+    if species_count is None:
+        query = query.replace('{species_filter}', '= %s')
+    else:
+        query = query.replace('{species_filter}', 'IN (' + ', '.join(['%s'] * species_count) + ')')
+
     # Add end year filter if provided
     if end_year:
         query += "\n    AND ri.AS_OF_TIMESTAMP < %s"
 
-    query += "\nORDER BY ri.AS_OF_TIMESTAMP ASC\n"
+    if species_count is None:
+        query += "\nORDER BY ri.AS_OF_TIMESTAMP ASC\n"
+    else:
+        query += "\nORDER BY ri.REPORT_SPECIES_ID ASC, ri.AS_OF_TIMESTAMP ASC\n"
 
     return query
 
@@ -436,12 +502,7 @@ def execute_query(cursor, report_species_id, start_year, end_year=None):
         logging.debug(f'Executing query for REPORT_SPECIES_ID: {report_species_id}, years: {start_year}-{end_year or "present"}')
 
         # Build parameters: report_species_id, start_date, and optionally end_date
-        start_date = f'{start_year}-01-01 00:00:00'
-        params = [report_species_id, start_date]
-
-        if end_year:
-            end_date = f'{end_year + 1}-01-01 00:00:00'  # Exclusive end (next year)
-            params.append(end_date)
+        params = [report_species_id] + get_year_params(start_year, end_year)
 
         cursor.execute(sql, tuple(params))
 
@@ -464,6 +525,69 @@ def execute_query(cursor, report_species_id, start_year, end_year=None):
         raise
 
 
+def get_year_params(start_year, end_year=None):
+    """
+    Return the AS_OF_TIMESTAMP bounds for get_sql_query's year filter.
+
+    Args:
+        start_year: Start year for filtering
+        end_year: Optional end year for filtering
+
+    Returns:
+        list: start_date, and end_date (exclusive, next year) if end_year is given
+    """
+    params = [f'{start_year}-01-01 00:00:00']
+    if end_year:
+        params.append(f'{end_year + 1}-01-01 00:00:00')  # Exclusive end (next year)
+    return params
+
+
+class BulkQueryError(Exception):
+    """Executing or fetching a bulk query failed (the row stream is incomplete)."""
+
+
+def execute_bulk_query(cursor, report_species_ids, start_year, end_year=None):
+    """
+    Execute one SQL query for several report species and stream the results.
+
+    Rows come back ordered by REPORT_SPECIES_ID, then AS_OF_TIMESTAMP, and are
+    fetched FETCH_BATCH_SIZE at a time, so callers can group them per species
+    without holding the whole result set in memory.
+
+    Args:
+        cursor: Database cursor
+        report_species_ids: Report_Species_Ids to query (at most MAX_BULK_CHUNK_SIZE)
+        start_year: Start year for filtering
+        end_year: Optional end year for filtering
+
+    Yields:
+        dict: One query result row
+
+    Raises:
+        BulkQueryError: If the query or a fetch fails, so callers can tell an
+            incomplete stream from an error while processing the rows
+    """
+    sql = get_sql_query(start_year, end_year, species_count=len(report_species_ids))
+    logging.debug(f'Executing bulk query for {len(report_species_ids)} REPORT_SPECIES_IDs, '
+                  f'years: {start_year}-{end_year or "present"}')
+
+    try:
+        cursor.execute(sql, tuple(report_species_ids) + tuple(get_year_params(start_year, end_year)))
+        columns = [column[0] for column in cursor.description]
+    except Exception as e:
+        raise BulkQueryError(e) from e
+
+    while True:
+        try:
+            rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+        except Exception as e:
+            raise BulkQueryError(e) from e
+        if not rows:
+            break
+        for row in rows:
+            yield dict(zip(columns, row))
+
+
 # ============================================================================
 # CSV Output
 # ============================================================================
@@ -594,7 +718,7 @@ def convert_to_utc(timestamp, source_timezone):
 _rpt_segments_cache = {}
 
 
-def get_rpt_segments(rptfolder, filename):
+def get_rpt_segments(rptfolder, filename, rpt_index_cache=None):
     """
     Extract SECTIONHDR segments from an RPT file.
 
@@ -605,6 +729,7 @@ def get_rpt_segments(rptfolder, filename):
     Args:
         rptfolder: Directory containing RPT files
         filename: RPT filename from RPTFILE table (e.g., "260271NL.RPT")
+        rpt_index_cache: Optional .rptidx cache location ('' = next to the RPT file)
 
     Returns:
         str: Formatted segments string, or empty string if file not found or has no sections
@@ -630,7 +755,11 @@ def get_rpt_segments(rptfolder, filename):
         return ''
 
     try:
-        header, sections = read_sectionhdr(rpt_path)
+        if rpt_index_cache is not None:
+            index = get_rpt_index(rpt_path, rpt_index_cache)
+            header, sections = (index.header, index.sections) if index else (None, [])
+        else:
+            header, sections = read_sectionhdr(rpt_path)
         if header is None or not sections:
             result = ''
         else:
@@ -643,18 +772,23 @@ def get_rpt_segments(rptfolder, filename):
         return ''
 
 
-def write_output_csv(output_path, results, report_species_name, country, year_from_filename, source_timezone, rptfolder=None):
+def write_output_csv(output_path, results, report_species_name, country, year_from_filename, source_timezone, rptfolder=None,
+                     rpt_index_cache=None):
     """
     Write query results to CSV file with simplified column set.
 
     Args:
         output_path: Path to output CSV file
-        results: List of dictionaries containing query results
+        results: Dictionaries containing query results (a list or a streaming iterator)
         report_species_name: Report_Species_Name from Report_Species.csv
         country: COUNTRY from Report_Species.csv
         year_from_filename: If True, calculate YEAR from filename; else from AS_OF_TIMESTAMP
         source_timezone: Timezone of AS_OF_TIMESTAMP for UTC conversion
         rptfolder: Optional directory containing RPT files for SECTIONHDR extraction
+        rpt_index_cache: Optional .rptidx cache location for SECTIONHDR lookups
+
+    Returns:
+        int: Number of rows written
     """
     # Define output header - only essential columns
     output_header = [
@@ -670,6 +804,7 @@ def write_output_csv(output_path, results, report_species_name, country, year_fr
         'REPORT_FILE_ID'
     ]
 
+    row_count = 0
     try:
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
@@ -698,7 +833,7 @@ def write_output_csv(output_path, results, report_species_name, country, year_fr
 
                 # SEGMENTS always from RPT file SECTIONHDR (or empty if no --rptfolder)
                 # Pass basename to get_rpt_segments (RPT files are in a flat folder)
-                segments = get_rpt_segments(rptfolder, rpt_basename) if rptfolder else ''
+                segments = get_rpt_segments(rptfolder, rpt_basename, rpt_index_cache) if rptfolder else ''
 
                 # Map database columns to simplified output format
                 output_row = [
@@ -714,8 +849,10 @@ def write_output_csv(output_path, results, report_species_name, country, year_fr
                     row.get('RPT_FILE_ID', '')  # REPORT_FILE_ID
                 ]
                 writer.writerow(output_row)
+                row_count += 1
 
-        logging.debug(f'Wrote {len(results)} rows to {output_path}')
+        logging.debug(f'Wrote {row_count} rows to {output_path}')
+        return row_count
 
     except Exception as e:
         logging.error(f'Failed to write CSV file {output_path}: {e}')
@@ -726,9 +863,16 @@ def write_output_csv(output_path, results, report_species_name, country, year_fr
 # Main Processing Loop
 # ============================================================================
 
+def get_output_filename(report_name, start_year, end_year=None):
+    """Return the per-report CSV filename, with the year range as suffix."""
+    if end_year:
+        return f'{report_name}_{start_year}_{end_year}.csv'
+    return f'{report_name}_{start_year}.csv'
+
+
 def process_reports(conn, report_species_list, csv_path, output_dir, last_processed_id,
                     start_year, end_year, year_from_filename, source_timezone, quiet=False,
-                    rptfolder=None):
+                    rptfolder=None, rpt_index_cache=None):
     """
     Main processing loop for extracting report instances.
 
@@ -744,6 +888,7 @@ def process_reports(conn, report_species_list, csv_path, output_dir, last_proces
         source_timezone: Timezone of AS_OF_TIMESTAMP for UTC conversion
         quiet: If True, show single-line progress counter instead of detailed logs
         rptfolder: Optional directory containing RPT files for SECTIONHDR extraction
+        rpt_index_cache: Optional .rptidx cache location for SECTIONHDR lookups
 
     Returns:
         dict: Statistics about processing
@@ -794,13 +939,10 @@ def process_reports(conn, report_species_list, csv_path, output_dir, last_proces
 
             if results:
                 # Write CSV file with REPORT_SPECIES_NAME, COUNTRY, and YEAR columns
-                # Add year suffix to output filename
-                if end_year:
-                    output_filename = f'{report_name}_{start_year}_{end_year}.csv'
-                else:
-                    output_filename = f'{report_name}_{start_year}.csv'
+                output_filename = get_output_filename(report_name, start_year, end_year)
                 output_path = os.path.join(output_dir, output_filename)
-                write_output_csv(output_path, results, report_name, country, year_from_filename, source_timezone, rptfolder=rptfolder)
+                write_output_csv(output_path, results, report_name, country, year_from_filename, source_timezone, rptfolder=rptfolder,
+                                 rpt_index_cache=rpt_index_cache)
 
                 if not quiet:
                     logging.info(f'Query returned {len(results)} instances for {report_name}')
@@ -837,6 +979,163 @@ def process_reports(conn, report_species_list, csv_path, output_dir, last_proces
     return stats
 
 
+def process_reports_bulk(conn, report_species_list, csv_path, output_dir, last_processed_id,
+                         start_year, end_year, year_from_filename, source_timezone, quiet=False,
+                         rptfolder=None, rpt_index_cache=None, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Bulk variant of process_reports: one query per chunk of report species.
+
+    Species are processed in REPORT_SPECIES_ID order, chunk_size at a time.
+    Each chunk's instances are streamed from a single ordered query, grouped
+    per species as they arrive and written straight to the per-report CSVs.
+    Species without instances are collected and their IN_USE=0 updates are
+    written to Report_Species.csv in one rewrite at the end (also when the
+    run is interrupted).
+
+    Args:
+        conn: Database connection
+        report_species_list: List of report species from CSV
+        csv_path: Path to Report_Species.csv
+        output_dir: Output directory for CSV files
+        last_processed_id: Last processed Report_Species_Id
+        start_year: Start year for filtering
+        end_year: Optional end year for filtering
+        year_from_filename: If True, calculate YEAR from filename; else from AS_OF_TIMESTAMP
+        source_timezone: Timezone of AS_OF_TIMESTAMP for UTC conversion
+        quiet: If True, show single-line progress counter instead of detailed logs
+        rptfolder: Optional directory containing RPT files for SECTIONHDR extraction
+        rpt_index_cache: Optional .rptidx cache location for SECTIONHDR lookups
+        chunk_size: REPORT_SPECIES_IDs per query
+
+    Returns:
+        dict: Statistics about processing
+    """
+    cursor = conn.cursor()
+    progress_file = os.path.join(output_dir, 'progress.txt')
+
+    # Statistics
+    stats = {
+        'total_reports': 0,
+        'reports_with_instances': 0,
+        'reports_without_instances': 0,
+        'errors': 0
+    }
+
+    # Reports to process (those after last_processed_id), one per ID, in ID order
+    reports_by_id = {}
+    for r in report_species_list:
+        report_species_id = int(r['REPORT_SPECIES_ID'])
+        if report_species_id > last_processed_id:
+            reports_by_id.setdefault(report_species_id, r)
+    species_ids = sorted(reports_by_id)
+
+    total_count = len(species_ids)
+    year_range = f'{start_year}-{end_year}' if end_year else f'{start_year}+'
+    chunk_count = (total_count + chunk_size - 1) // chunk_size
+
+    if not quiet:
+        logging.info(f'Processing {total_count} report species (starting after ID {last_processed_id}) '
+                     f'in {chunk_count} bulk queries of up to {chunk_size} species')
+        logging.info(f'Year filter: {year_range}, YEAR column from: {"filename" if year_from_filename else "AS_OF_TIMESTAMP"}')
+        logging.info(f'Timezone: {source_timezone} (converting to UTC)')
+        if rptfolder:
+            logging.info(f'SEGMENTS source: RPT file SECTIONHDR from {rptfolder}')
+        else:
+            logging.info(f'SEGMENTS source: none (--rptfolder not provided, SEGMENTS will be empty)')
+    else:
+        rpt_info = f' | RPT folder: {rptfolder}' if rptfolder else ' | SEGMENTS: empty (no --rptfolder)'
+        print(f'Processing {total_count} report species | Year filter: {year_range} | Timezone: {source_timezone}{rpt_info}')
+
+    pending_in_use = []  # Species without instances, IN_USE=0 written at the end
+    done = 0
+    progress_blocked = False  # Set after a failure: progress.txt must not move past it
+
+    def finish_species(report_species_id, row_count):
+        """Record a species as processed (row_count None = failed)."""
+        nonlocal done, progress_blocked
+        done += 1
+        report_name = reports_by_id[report_species_id]['REPORT_SPECIES_NAME']
+        if row_count is None:
+            stats['errors'] += 1
+            if not progress_blocked:
+                progress_blocked = True
+                logging.warning(f'Progress will not be advanced past REPORT_SPECIES_ID {report_species_id} '
+                                f'so that failed species are retried on resume')
+            return
+        if row_count:
+            if not quiet:
+                logging.info(f'Wrote {row_count} rows to {get_output_filename(report_name, start_year, end_year)} '
+                             f'(REPORT_SPECIES_ID: {report_species_id}, {done}/{total_count})')
+            stats['reports_with_instances'] += 1
+        else:
+            if not quiet:
+                logging.warning(f'Query returned 0 instances for {report_name} (year range: {year_range}), '
+                                f'IN_USE=0 will be set at the end')
+            pending_in_use.append(report_species_id)
+            stats['reports_without_instances'] += 1
+
+        if not progress_blocked:
+            write_progress(progress_file, report_species_id)
+        stats['total_reports'] += 1
+
+        if quiet:
+            # Single-line progress counter (updates in place)
+            progress_msg = f'\rProgress: {done}/{total_count} reports processed | {stats["reports_with_instances"]} exported | {stats["reports_without_instances"]} skipped'
+            sys.stdout.write(progress_msg)
+            sys.stdout.flush()
+
+    try:
+        for chunk_start in range(0, total_count, chunk_size):
+            chunk = species_ids[chunk_start:chunk_start + chunk_size]
+            next_index = 0  # Species in chunk before this one are finished
+
+            try:
+                rows = execute_bulk_query(cursor, chunk, start_year, end_year)
+                for report_species_id, species_rows in groupby(rows, key=lambda r: r['REPORT_SPECIES_ID']):
+                    # Species skipped by the ordered stream have no instances
+                    while next_index < len(chunk) and chunk[next_index] < report_species_id:
+                        finish_species(chunk[next_index], 0)
+                        next_index += 1
+                    if next_index >= len(chunk) or chunk[next_index] != report_species_id:
+                        continue  # Not a requested species (should not happen)
+
+                    report = reports_by_id[report_species_id]
+                    report_name = report['REPORT_SPECIES_NAME']
+                    output_path = os.path.join(output_dir, get_output_filename(report_name, start_year, end_year))
+                    try:
+                        row_count = write_output_csv(output_path, species_rows, report_name,
+                                                     report.get('COUNTRY_CODE', ''), year_from_filename,
+                                                     source_timezone, rptfolder=rptfolder,
+                                                     rpt_index_cache=rpt_index_cache)
+                    except BulkQueryError:
+                        raise  # The row stream broke, not this species' CSV
+                    except Exception as e:
+                        logging.error(f'Error processing REPORT_SPECIES_ID {report_species_id}: {e}')
+                        row_count = None
+                    finish_species(report_species_id, row_count)
+                    next_index += 1
+
+            except Exception as e:
+                # Always log errors to file. The stream is incomplete, so the
+                # unfinished species of this chunk failed (not "no instances").
+                logging.error(f'Bulk query failed for REPORT_SPECIES_ID {chunk[0]}-{chunk[-1]} '
+                              f'({len(chunk) - next_index} species not processed): {e}')
+                for report_species_id in chunk[next_index:]:
+                    finish_species(report_species_id, None)
+                continue
+
+            # The stream finished cleanly: remaining species of the chunk had no instances
+            for report_species_id in chunk[next_index:]:
+                finish_species(report_species_id, 0)
+
+    finally:
+        if pending_in_use:
+            update_in_use_many(csv_path, pending_in_use, new_in_use_value=0)
+        cursor.close()
+
+    return stats
+
+
 # ============================================================================
 # Main Function
 # ============================================================================
@@ -876,7 +1175,8 @@ def main():
         )
 
         # Process reports
-        stats = process_reports(
+        bulk_options = {'chunk_size': args.bulk_chunk_size} if args.bulk else {}
+        stats = (process_reports_bulk if args.bulk else process_reports)(
             conn=conn,
             report_species_list=report_species_list,
             csv_path=args.input,
@@ -887,7 +1187,9 @@ def main():
             year_from_filename=args.year_from_filename,
             source_timezone=args.timezone,
             quiet=args.quiet,
-            rptfolder=args.rptfolder
+            rptfolder=args.rptfolder,
+            rpt_index_cache=args.rpt_index_cache,
+            **bulk_options
         )
 
         # Close connection
@@ -8,6 +8,15 @@ This script processes all binary .MAP files and extracts:
 2. Binary segment metadata (positions, lengths, internal structure)
 3. Database correlation (DOMAIN_ID, REPORT_SPECIES_ID, page ranges, sections)
 
+Only the header and the segment headers on the **ME next_offset chain are
+read from each file (memory-mapped), and the binary survey can run on a
+process pool (--workers). Database correlation uses in-memory caches loaded
+up front with one query per table (segment and section counts are grouped
+in SQL), so no queries are issued per file.
+
+Usage:
+    python batch_extract_all_segments.py [limit] [--workers N]
+
 Output:
 - results/map_segments_complete.csv - Complete mapping of all files
 - results/map_file_statistics.json - Summary statistics
@@ -17,18 +26,20 @@ Author: Migration Team
 Date: January 2025
 """
 
+import argparse
 import os
-import sys
 import struct
 import json
 import csv
 import logging
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Tuple, Optional, Any
 from collections import defaultdict
 import time
 
+from intellistor_viewer import MapFileParser
+
 # Database connection
 try:
     import pymssql
@@ -50,12 +61,13 @@ DB_CONFIG = {
 
 # Binary signatures
 MAPHDR_SIGNATURE = b'M\x00A\x00P\x00H\x00D\x00R\x00'  # "MAPHDR" in UTF-16LE
-ME_MARKER = b'\x2a\x00\x2a\x00\x4d\x00\x45\x00'  # "**ME" in UTF-16LE
 
 # Batch processing settings
 BATCH_SIZE = 1000  # Process files in batches
 COMMIT_INTERVAL = 100  # Write to CSV every N files
 PROGRESS_INTERVAL = 500  # Print progress every N files
+SURVEY_CHUNK_SIZE = 64  # Files handed to a worker process at a time
+HEADER_READ_SIZE = 96  # Bytes of MAPHDR needed by parse_header
 
 
 def setup_logging():
@@ -102,6 +114,8 @@ class BatchMAPParser:
         self.db_cache = {
             'mapfile': {},      # filename -> {MAP_FILE_ID, LOCATION_ID, STORED_ON_SIDE}
             'sst_storage': {},  # MAP_FILE_ID -> {DOMAIN_ID, REPORT_SPECIES_ID, AS_OF_TIMESTAMP}
+            'segment_counts': {},  # (DOMAIN_ID, REPORT_SPECIES_ID, AS_OF_TIMESTAMP) -> segments
+            'section_counts': {},  # (DOMAIN_ID, REPORT_SPECIES_ID) -> sections
         }
 
     def load_db_cache(self):
@@ -140,6 +154,30 @@ class BatchMAPParser:
             }
         self.logger.info(f"Loaded {len(self.db_cache['sst_storage']):,} SST_STORAGE entries")
 
+        # Segment counts per report instance (one grouped query instead of one per file)
+        self.logger.info("Loading REPORT_INSTANCE_SEGMENT counts...")
+        cursor.execute("""
+            SELECT DOMAIN_ID, REPORT_SPECIES_ID, AS_OF_TIMESTAMP, COUNT(*) AS SEGMENT_COUNT
+            FROM REPORT_INSTANCE_SEGMENT
+            GROUP BY DOMAIN_ID, REPORT_SPECIES_ID, AS_OF_TIMESTAMP
+        """)
+        for row in cursor.fetchall():
+            key = (row['DOMAIN_ID'], row['REPORT_SPECIES_ID'], row['AS_OF_TIMESTAMP'])
+            self.db_cache['segment_counts'][key] = row['SEGMENT_COUNT']
+        self.logger.info(f"Loaded segment counts for {len(self.db_cache['segment_counts']):,} instances")
+
+        # Section counts per report species
+        self.logger.info("Loading SECTION counts...")
+        cursor.execute("""
+            SELECT DOMAIN_ID, REPORT_SPECIES_ID, COUNT(*) AS SECTION_COUNT
+            FROM SECTION
+            GROUP BY DOMAIN_ID, REPORT_SPECIES_ID
+        """)
+        for row in cursor.fetchall():
+            key = (row['DOMAIN_ID'], row['REPORT_SPECIES_ID'])
+            self.db_cache['section_counts'][key] = row['SECTION_COUNT']
+        self.logger.info(f"Loaded section counts for {len(self.db_cache['section_counts']):,} report species")
+
     def parse_header(self, data: bytes) -> Dict[str, Any]:
         """Parse the MAPHDR header from binary data."""
         header = {
@@ -178,18 +216,6 @@ class BatchMAPParser:
 
         return header
 
-    def count_me_markers(self, data: bytes) -> int:
-        """Count the number of **ME markers in the binary data."""
-        count = 0
-        pos = 0
-        while True:
-            pos = data.find(ME_MARKER, pos)
-            if pos == -1:
-                break
-            count += 1
-            pos += len(ME_MARKER)
-        return count
-
     def get_db_info_cached(self, filename: str) -> Dict[str, Any]:
         """Get database information from cache."""
         db_info = {
@@ -197,6 +223,7 @@ class BatchMAPParser:
             'domain_id': None,
             'report_species_id': None,
             'as_of_timestamp': None,
+            'as_of_timestamp_raw': None,
             'location_id': None,
             'has_db_entry': False
         }
@@ -213,65 +240,55 @@ class BatchMAPParser:
                 db_info['domain_id'] = sst_info['domain_id']
                 db_info['report_species_id'] = sst_info['report_species_id']
                 db_info['as_of_timestamp'] = str(sst_info['as_of_timestamp']) if sst_info['as_of_timestamp'] else None
+                db_info['as_of_timestamp_raw'] = sst_info['as_of_timestamp']
                 db_info['has_db_entry'] = True
 
         return db_info
 
-    def get_db_segments(self, domain_id: int, report_species_id: int, as_of_timestamp) -> List[Dict]:
-        """Get segment information from database (not cached - too many)."""
-        segments = []
-        if not self.db or not as_of_timestamp:
-            return segments
-
-        try:
-            cursor = self.db.cursor(as_dict=True)
-            cursor.execute("""
-                SELECT SEGMENT_NUMBER, START_PAGE_NUMBER, NUMBER_OF_PAGES
-                FROM REPORT_INSTANCE_SEGMENT
-                WHERE DOMAIN_ID = %s
-                  AND REPORT_SPECIES_ID = %s
-                  AND AS_OF_TIMESTAMP = %s
-                ORDER BY SEGMENT_NUMBER
-            """, (domain_id, report_species_id, as_of_timestamp))
-
-            for row in cursor.fetchall():
-                segments.append({
-                    'segment_number': row['SEGMENT_NUMBER'],
-                    'start_page': row['START_PAGE_NUMBER'],
-                    'num_pages': row['NUMBER_OF_PAGES']
-                })
-        except Exception as e:
-            self.logger.debug(f"Segment query error: {e}")
-
-        return segments
-
-    def get_section_count(self, domain_id: int, report_species_id: int) -> int:
-        """Get section count from database."""
-        if not self.db:
-            return 0
-
-        try:
-            cursor = self.db.cursor()
-            cursor.execute("""
-                SELECT COUNT(*) FROM SECTION
-                WHERE DOMAIN_ID = %s AND REPORT_SPECIES_ID = %s
-            """, (domain_id, report_species_id))
-            result = cursor.fetchone()
-            return result[0] if result else 0
-        except Exception as e:
-            return 0
-
-    def process_file(self, filepath: str) -> Dict[str, Any]:
-        """Process a single MAP file."""
-        filename = os.path.basename(filepath)
+    def survey_file(self, filepath: str) -> Dict[str, Any]:
+        """
+        Read the binary part of a MAP file's result: header fields and **ME marker count.
 
+        The file is memory-mapped and markers are found by following the
+        next_offset chain (MapFileParser), so only the header and the segment
+        headers are read rather than the whole file.
+        """
         result = {
-            'filename': filename,
+            'filename': os.path.basename(filepath),
             'file_size': 0,
             'header_valid': False,
             'date_created': None,
             'version': None,
             'binary_segment_count': 0,
+            'error': None
+        }
+
+        try:
+            result['file_size'] = os.path.getsize(filepath)
+
+            parser = MapFileParser(filepath)
+            if not parser.load(use_mmap=True):
+                raise OSError(f"cannot read {filepath}")
+            try:
+                # Parse header
+                header = self.parse_header(parser.data[:HEADER_READ_SIZE])
+                result['header_valid'] = header['valid']
+                result['date_created'] = header.get('date_created')
+                result['version'] = header.get('version')
+
+                # Count binary segments
+                result['binary_segment_count'] = len(parser.find_me_markers())
+            finally:
+                parser.close()
+
+        except Exception as e:
+            result['error'] = str(e)
+
+        return result
+
+    def correlate(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Add database information from the caches to a survey_file result."""
+        result.update({
             'map_file_id': None,
             'domain_id': None,
             'report_species_id': None,
@@ -279,69 +296,43 @@ class BatchMAPParser:
             'db_segment_count': 0,
             'section_count': 0,
             'segments_match': False,
-            'error': None
-        }
+        })
+        if result['error']:
+            self.logger.error(f"Error processing {result['filename']}: {result['error']}")
+            return result
+
+        # Get database info
+        db_info = self.get_db_info_cached(result['filename'])
+        result['map_file_id'] = db_info['map_file_id']
+        result['domain_id'] = db_info['domain_id']
+        result['report_species_id'] = db_info['report_species_id']
+        result['as_of_timestamp'] = db_info['as_of_timestamp']
+
+        # Get DB segment and section counts if we have the info
+        if db_info['has_db_entry']:
+            if db_info['as_of_timestamp']:
+                result['db_segment_count'] = self.db_cache['segment_counts'].get(
+                    (db_info['domain_id'], db_info['report_species_id'],
+                     db_info['as_of_timestamp_raw']), 0)
+            result['section_count'] = self.db_cache['section_counts'].get(
+                (db_info['domain_id'], db_info['report_species_id']), 0)
+
+        # Check if segments match
+        result['segments_match'] = (result['binary_segment_count'] == result['db_segment_count'])
 
-        try:
-            # Read and parse binary file
-            with open(filepath, 'rb') as f:
-                data = f.read()
-
-            result['file_size'] = len(data)
-
-            # Parse header
-            header = self.parse_header(data)
-            result['header_valid'] = header['valid']
-            result['date_created'] = header.get('date_created')
-            result['version'] = header.get('version')
-
-            # Count binary segments
-            result['binary_segment_count'] = self.count_me_markers(data)
-
-            # Get database info
-            db_info = self.get_db_info_cached(filename)
-            result['map_file_id'] = db_info['map_file_id']
-            result['domain_id'] = db_info['domain_id']
-            result['report_species_id'] = db_info['report_species_id']
-            result['as_of_timestamp'] = db_info['as_of_timestamp']
-
-            # Get DB segments if we have the info
-            if db_info['has_db_entry'] and db_info['as_of_timestamp']:
-                # Parse timestamp back to datetime for query
-                from datetime import datetime as dt
-                try:
-                    ts = dt.strptime(db_info['as_of_timestamp'], '%Y-%m-%d %H:%M:%S.%f')
-                except:
-                    try:
-                        ts = dt.strptime(db_info['as_of_timestamp'], '%Y-%m-%d %H:%M:%S')
-                    except:
-                        ts = None
-
-                if ts:
-                    db_segments = self.get_db_segments(
-                        db_info['domain_id'],
-                        db_info['report_species_id'],
-                        ts
-                    )
-                    result['db_segment_count'] = len(db_segments)
-
-                # Get section count
-                result['section_count'] = self.get_section_count(
-                    db_info['domain_id'],
-                    db_info['report_species_id']
-                )
-
-            # Check if segments match
-            result['segments_match'] = (result['binary_segment_count'] == result['db_segment_count'])
+        return result
 
-        except Exception as e:
-            result['error'] = str(e)
-            self.logger.error(f"Error processing {filename}: {e}")
+    def process_file(self, filepath: str) -> Dict[str, Any]:
+        """Process a single MAP file."""
+        return self.correlate(self.survey_file(filepath))
 
-        return result
+    def process_all_files(self, limit: int = None, workers: int = 1):
+        """
+        Process all MAP files in the directory.
 
-    def process_all_files(self, limit: int = None):
-        """Process all MAP files in the directory."""
+        With workers > 1 the binary survey runs on a process pool; results come
+        back in file order and are correlated and written here.
+        """
         map_dir = Path(MAP_FILES_DIR)
         all_files = sorted(map_dir.glob("*.MAP"))
 
@@ -368,58 +359,70 @@ class BatchMAPParser:
         start_time = time.time()
         results_buffer = []
 
-        with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for i, filepath in enumerate(all_files):
-                # Process file
-                result = self.process_file(str(filepath))
-                results_buffer.append(result)
-
-                # Update statistics
-                self.stats['processed'] += 1
-                if result['error']:
-                    self.stats['errors'] += 1
-                if result['header_valid']:
-                    self.stats['valid_headers'] += 1
-                if result['domain_id']:
-                    self.stats['with_db_info'] += 1
-                    self.stats['by_domain'][result['domain_id']] += 1
-                if result['section_count'] > 0:
-                    self.stats['with_sections'] += 1
-                if result['segments_match']:
-                    self.stats['segments_match_count'] += 1
-
-                self.stats['binary_segments_total'] += result['binary_segment_count']
-                self.stats['db_segments_total'] += result['db_segment_count']
-                self.stats['segment_count_distribution'][result['binary_segment_count']] += 1
-
-                # Extract year from filename (first 2 digits)
-                if len(result['filename']) >= 2:
-                    year_code = result['filename'][:2]
-                    self.stats['by_year'][year_code] += 1
-
-                # Write to CSV periodically
-                if len(results_buffer) >= COMMIT_INTERVAL:
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            if pool:
+                self.logger.info(f"Surveying with {workers} worker processes")
+                surveys = pool.map(_survey_file, map(str, all_files), chunksize=SURVEY_CHUNK_SIZE)
+            else:
+                surveys = map(self.survey_file, map(str, all_files))
+
+            with open(csv_file, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+
+                for i, survey in enumerate(surveys):
+                    # Correlate the file with the database caches
+                    result = self.correlate(survey)
+                    results_buffer.append(result)
+
+                    # Update statistics
+                    self.stats['processed'] += 1
+                    if result['error']:
+                        self.stats['errors'] += 1
+                    if result['header_valid']:
+                        self.stats['valid_headers'] += 1
+                    if result['domain_id']:
+                        self.stats['with_db_info'] += 1
+                        self.stats['by_domain'][result['domain_id']] += 1
+                    if result['section_count'] > 0:
+                        self.stats['with_sections'] += 1
+                    if result['segments_match']:
+                        self.stats['segments_match_count'] += 1
+
+                    self.stats['binary_segments_total'] += result['binary_segment_count']
+                    self.stats['db_segments_total'] += result['db_segment_count']
+                    self.stats['segment_count_distribution'][result['binary_segment_count']] += 1
+
+                    # Extract year from filename (first 2 digits)
+                    if len(result['filename']) >= 2:
+                        year_code = result['filename'][:2]
+                        self.stats['by_year'][year_code] += 1
+
+                    # Write to CSV periodically
+                    if len(results_buffer) >= COMMIT_INTERVAL:
+                        writer.writerows(results_buffer)
+                        results_buffer = []
+                        f.flush()
+
+                    # Progress update
+                    if (i + 1) % PROGRESS_INTERVAL == 0:
+                        elapsed = time.time() - start_time
+                        rate = (i + 1) / elapsed
+                        eta = (self.stats['total_files'] - i - 1) / rate if rate > 0 else 0
+                        self.logger.info(
+                            f"Progress: {i + 1:,}/{self.stats['total_files']:,} "
+                            f"({100 * (i + 1) / self.stats['total_files']:.1f}%) "
+                            f"- Rate: {rate:.1f} files/sec - ETA: {eta / 60:.1f} min"
+                        )
+
+                # Write remaining buffer
+                if results_buffer:
                     writer.writerows(results_buffer)
-                    results_buffer = []
-                    f.flush()
-
-                # Progress update
-                if (i + 1) % PROGRESS_INTERVAL == 0:
-                    elapsed = time.time() - start_time
-                    rate = (i + 1) / elapsed
-                    eta = (self.stats['total_files'] - i - 1) / rate if rate > 0 else 0
-                    self.logger.info(
-                        f"Progress: {i + 1:,}/{self.stats['total_files']:,} "
-                        f"({100 * (i + 1) / self.stats['total_files']:.1f}%) "
-                        f"- Rate: {rate:.1f} files/sec - ETA: {eta / 60:.1f} min"
-                    )
-
-            # Write remaining buffer
-            if results_buffer:
-                writer.writerows(results_buffer)
+        finally:
+            # Also stops the worker processes if correlating or writing fails
+            if pool:
+                pool.shutdown()
 
         self.stats['processing_time'] = time.time() - start_time
         self.logger.info(f"Processing complete: {self.stats['processed']:,} files in {self.stats['processing_time']:.1f} seconds")
@@ -456,6 +459,14 @@ class BatchMAPParser:
         self.logger.info(f"Statistics saved to {RESULTS_DIR}/map_file_statistics.json")
 
 
+_survey_parser = BatchMAPParser()
+
+
+def _survey_file(filepath: str) -> Dict[str, Any]:
+    """BatchMAPParser.survey_file for worker processes."""
+    return _survey_parser.survey_file(filepath)
+
+
 def create_db_connection():
     """Create a database connection."""
     if not HAS_PYMSSQL:
@@ -482,14 +493,18 @@ def main():
     print("=" * 70)
 
     # Parse command line arguments
-    limit = None
-    if len(sys.argv) > 1:
-        try:
-            limit = int(sys.argv[1])
-            print(f"Processing limited to {limit} files")
-        except ValueError:
-            print(f"Usage: {sys.argv[0]} [limit]")
-            sys.exit(1)
+    parser = argparse.ArgumentParser(description='Batch process all MAP files')
+    parser.add_argument('limit', type=int, nargs='?',
+                        help='Only process the first N files')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for the binary survey (default: CPU count)')
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+
+    limit = args.limit
+    if limit:
+        print(f"Processing limited to {limit} files")
 
     # Set up logging
     logger = setup_logging()
@@ -504,7 +519,7 @@ def main():
 
     # Create processor and run
     processor = BatchMAPParser(db, logger)
-    stats = processor.process_all_files(limit)
+    stats = processor.process_all_files(limit, args.workers)
 
     # Print final summary
     print("\n" + "=" * 70)
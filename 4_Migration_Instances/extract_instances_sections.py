@@ -24,6 +24,8 @@ import argparse
 import logging
 import sys
 import os
+import mmap
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
 import pytz
@@ -34,18 +36,58 @@ import re
 # Map File Processing
 # ============================================================================
 
+# Segment name entries in MAP files: '( ' + ID + '-' + Name + multiple spaces
+# Example: ( 04-Chayanon Wannathepsakul
+# Pattern captures: group 1 = ID, group 2 = Name
+# Matched on raw bytes, so entries the old decoded-text scan only found after
+# dropping invalid UTF-8 bytes between '(', the ID and '-' no longer match, and
+# \s / \d are ASCII-only. Well-formed entries give the same results.
+SEGMENT_NAME_PATTERN = re.compile(rb'\(\s+(\d+)-(.+?)\s{2,}')
+
+# Default number of parsed MAP files kept in MapFileCache
+DEFAULT_MAP_CACHE_SIZE = 256
+
+
+def extract_segment_names(data):
+    """Extract segment ID -> name entries from raw MAP file bytes.
+
+    Args:
+        data: MAP file content (bytes or a read-only mmap)
+
+    Returns:
+        dict: {segment_id: name}, with both normalized ('4') and original ('04') IDs
+    """
+    segment_map = {}
+    for match in SEGMENT_NAME_PATTERN.finditer(data):
+        seg_id = match.group(1).decode('ascii')
+        clean_name = match.group(2).decode('utf-8', errors='ignore').strip()
+        # Store with both normalized and original ID formats
+        segment_map[str(int(seg_id))] = clean_name  # '04' → '4'
+        segment_map[seg_id] = clean_name  # Keep '04' too
+    return segment_map
+
+
 class MapFileCache:
-    """Caches parsed map file content to avoid repeated disk reads."""
+    """Caches parsed map file content to avoid repeated disk reads.
+
+    Parsed files are kept in a least-recently-used cache of at most max_files
+    entries, so memory stays bounded across thousands of species.
+    """
 
-    def __init__(self, map_dir):
+    def __init__(self, map_dir, max_files=DEFAULT_MAP_CACHE_SIZE):
         """Initialize cache with map file directory.
 
         Args:
             map_dir: Directory path where .MAP files are located
+            max_files: Maximum number of parsed MAP files to keep
         """
         self.map_dir = map_dir
-        self.cache = {}  # {filename: {segment_id: name}}
+        self.max_files = max(1, max_files)
+        self.cache = OrderedDict()  # {filename: {segment_id: name}}, least recently used first
         self.missing_files = set()  # Track files that don't exist
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def get_segment_name(self, map_filename, segment_id):
         """Look up segment name in map file.
@@ -62,14 +104,19 @@ class MapFileCache:
 
         # Skip files we know don't exist
         if map_filename in self.missing_files:
+            self.hits += 1
             return None
 
-        # Load file on first access
-        if map_filename not in self.cache:
-            self._load_map_file(map_filename)
+        # Load file on first access (or after it was evicted)
+        segment_map = self.cache.get(map_filename)
+        if segment_map is None:
+            self.misses += 1
+            segment_map = self._load_map_file(map_filename)
+        else:
+            self.hits += 1
+            self.cache.move_to_end(map_filename)
 
         # Try lookup with normalized ID (no leading zeros)
-        segment_map = self.cache.get(map_filename, {})
         name = segment_map.get(str(segment_id))
         if name:
             return name
@@ -78,11 +125,25 @@ class MapFileCache:
         padded_id = str(segment_id).zfill(2)
         return segment_map.get(padded_id)
 
+    def stats_summary(self):
+        """One-line summary of cache effectiveness for the log."""
+        lookups = self.hits + self.misses
+        hit_rate = (100.0 * self.hits / lookups) if lookups else 0.0
+        return (f'Map file cache: {self.hits} hits, {self.misses} misses ({hit_rate:.1f}% hit rate), '
+                f'{self.evictions} evictions, {len(self.cache)}/{self.max_files} files cached, '
+                f'{len(self.missing_files)} missing')
+
     def _load_map_file(self, filename):
-        """Parse .MAP file and populate cache.
+        """Parse .MAP file and add it to the cache.
+
+        The file is memory-mapped and searched with a precompiled bytes regex,
+        so it is never decoded as text.
 
         Args:
             filename: Name of .MAP file to load
+
+        Returns:
+            dict: {segment_id: name} for the file (empty if missing or unreadable)
         """
         file_path = os.path.join(self.map_dir, filename)
         segment_map = {}
@@ -90,31 +151,24 @@ class MapFileCache:
         if not os.path.exists(file_path):
             logging.warning(f'Map file not found: {file_path}')
             self.missing_files.add(filename)
-            self.cache[filename] = {}
-            return
+            return segment_map
 
         try:
-            # Read as text with 'ignore' to handle binary markers
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-
-            # Regex: '( ' + ID + '-' + Name + multiple spaces
-            # Example: ( 04-Chayanon Wannathepsakul
-            # Pattern captures: group 1 = ID, group 2 = Name
-            matches = re.findall(r'\(\s+(\d+)-(.+?)\s{2,}', content)
-
-            for seg_id, name in matches:
-                # Store with both normalized and original ID formats
-                clean_name = name.strip()
-                segment_map[str(int(seg_id))] = clean_name  # '04' → '4'
-                segment_map[seg_id] = clean_name  # Keep '04' too
-
-            self.cache[filename] = segment_map
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        segment_map = extract_segment_names(data)
+
             logging.debug(f'Loaded {len(set(segment_map.values()))} unique segments from {filename}')
 
         except Exception as e:
             logging.error(f'Error parsing map file {filename}: {e}')
-            self.cache[filename] = {}
+
+        self.cache[filename] = segment_map
+        if len(self.cache) > self.max_files:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+        return segment_map
 
 
 # ============================================================================
@@ -258,6 +312,12 @@ Examples:
         default='.',
         help='Directory containing .MAP files for segment name lookups (default: current directory)'
     )
+    parser.add_argument(
+        '--map-cache-size',
+        type=int,
+        default=DEFAULT_MAP_CACHE_SIZE,
+        help=f'Maximum number of parsed .MAP files kept in memory (default: {DEFAULT_MAP_CACHE_SIZE})'
+    )
 
     # Output options
     parser.add_argument(
@@ -272,6 +332,10 @@ Examples:
     if not args.windows_auth and (not args.user or not args.password):
         parser.error('Either --windows-auth or both --user and --password must be provided')
 
+    # Validate map cache size
+    if args.map_cache_size < 1:
+        parser.error('--map-cache-size must be at least 1')
+
     # Validate year parameters
     if args.end_year and args.end_year < args.start_year:
         parser.error(f'End year ({args.end_year}) cannot be before start year ({args.start_year})')
@@ -855,7 +919,7 @@ def get_indexed_fields(cursor, report_species_id):
 
 def process_reports(conn, report_species_list, csv_path, output_dir, last_processed_id,
                     start_year, end_year, year_from_filename, source_timezone,
-                    map_dir='.', quiet=False):
+                    map_dir='.', quiet=False, map_cache_size=DEFAULT_MAP_CACHE_SIZE):
     """
     Main processing loop for extracting report instances.
 
@@ -871,6 +935,7 @@ def process_reports(conn, report_species_list, csv_path, output_dir, last_proces
         source_timezone: Timezone of AS_OF_TIMESTAMP for UTC conversion
         map_dir: Directory containing .MAP files for segment name lookups
         quiet: If True, show single-line progress counter instead of detailed logs
+        map_cache_size: Maximum number of parsed MAP files kept in memory
 
     Returns:
         dict: Statistics about processing
@@ -879,7 +944,7 @@ def process_reports(conn, report_species_list, csv_path, output_dir, last_proces
     progress_file = os.path.join(output_dir, 'progress.txt')
 
     # Initialize map file cache and indexed fields cache
-    map_cache = MapFileCache(map_dir)
+    map_cache = MapFileCache(map_dir, map_cache_size)
     logging.info(f'Map file directory: {map_dir}')
     indexed_fields_cache = {}  # {report_species_id: 'FIELD1|FIELD2|...'}
 
@@ -968,6 +1033,7 @@ def process_reports(conn, report_species_list, csv_path, output_dir, last_proces
             continue
 
     cursor.close()
+    logging.info(map_cache.stats_summary())
     return stats
 
 
@@ -1021,7 +1087,8 @@ def main():
             year_from_filename=args.year_from_filename,
             source_timezone=args.timezone,
             map_dir=args.map_dir,
-            quiet=args.quiet
+            quiet=args.quiet,
+            map_cache_size=args.map_cache_size
         )
 
         # Close connection
@@ -37,6 +37,15 @@ Usage:
     # List indexed fields for a report
     python intellistor_extractor.py --report DDU017P --list-fields
 
+    # Extract from every instance in a date range (process pool, records streamed
+    # to the output as each instance finishes, tagged with AS_OF_TIMESTAMP)
+    python intellistor_extractor.py --report DDU017P --field ACCOUNT_NO --value "200-044295-001" \\
+        --from 2024-01-01 --to 2024-12-31 --workers 8 --output account.csv --format csv
+
+    # Find every instance containing a value (MAP value index, see map_value_index.py)
+    python intellistor_extractor.py --report DDU017P --field ACCOUNT_NO --value "200-044295-001" \\
+        --all-instances --value-index map_values.sqlite
+
 Requirements:
     - Database: iSTSGUAT on localhost:1433 (pymssql)
     - MAP files: /Volumes/X9Pro/OCBC/250_MapFiles/
@@ -47,12 +56,13 @@ import argparse
 import csv
 import json
 import os
-import struct
 import sys
+import textwrap
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field as dataclass_field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set, Union
 
 # Import from existing modules
 from intellistor_viewer import (
@@ -60,9 +70,13 @@ from intellistor_viewer import (
     FieldDef, LineDef, ReportInstance, IndexEntry
 )
 from rpt_page_extractor import (
-    read_page_table, decompress_pages, PageTableEntry
+    RptFile, decompress_pages, PageTableEntry
+)
+from rpt_section_reader import RptHeader
+from map_value_index import (
+    open_index as open_value_index, indexed_files, lookup as lookup_value_index,
+    is_current as is_value_index_current
 )
-from rpt_section_reader import parse_rpt_header, RptHeader
 
 
 # ============================================================================
@@ -107,7 +121,11 @@ def score_line_against_template(line_text: str, template: str) -> float:
     Returns:
         Score from 0.0 to 1.0 (1.0 = perfect match)
     """
-    tmpl = _prepare_template(template)
+    return _score_prepared(line_text, _prepare_template(template))
+
+
+def _score_prepared(line_text: str, tmpl: str) -> float:
+    """score_line_against_template for an already prepared template."""
     if not tmpl:
         return 0.0
 
@@ -173,7 +191,227 @@ def score_line_against_template(line_text: str, template: str) -> float:
 MIN_MATCH_SCORE = 0.55
 
 
-def classify_lines(page_text: str, line_defs: List[LineDef]) -> List[Tuple[str, Optional[LineDef]]]:
+# Character classes used by the compiled matcher. '*' and '#' earn partial
+# credit in both A and 9 slots; the other specials only in one of them.
+_CLS_ALPHA, _CLS_DIGIT, _CLS_SPACE, _CLS_SPECIAL, _CLS_SPECIAL_A, _CLS_SPECIAL_9, _CLS_OTHER = range(7)
+
+# Earned points per character class, in tenths (see score_line_against_template)
+_EARN_A = (10, 7, 3, 5, 5, 0, 0)
+_EARN_9 = (7, 10, 3, 5, 0, 5, 0)
+_EARN_SPACE = (1, 1, 5, 1, 1, 1, 1)
+_WEIGHT_A9, _WEIGHT_SPACE, _WEIGHT_LITERAL = 10, 5, 30
+
+# Integer scores are exact; the float heuristic can differ from them in the
+# last few bits. Templates within this margin of the best score (or of
+# MIN_MATCH_SCORE) are re-scored with the float heuristic to break ties.
+_SCORE_EPSILON = 1e-9
+
+_char_classes: Dict[str, int] = {}
+
+
+def _char_class(ch: str) -> int:
+    cls = _char_classes.get(ch)
+    if cls is None:
+        if ch.isalpha():
+            cls = _CLS_ALPHA
+        elif ch.isdigit():
+            cls = _CLS_DIGIT
+        elif ch == ' ':
+            cls = _CLS_SPACE
+        elif ch in '*#':
+            cls = _CLS_SPECIAL
+        elif ch in '@&()':
+            cls = _CLS_SPECIAL_A
+        elif ch in '.,-+':
+            cls = _CLS_SPECIAL_9
+        else:
+            cls = _CLS_OTHER
+        _char_classes[ch] = cls
+    return cls
+
+
+class CompiledTemplates:
+    """
+    LINE templates of one STRUCTURE_DEF_ID, compiled for best-fit matching.
+
+    Every template position is reduced to points per character class (A, 9
+    and space slots) or a literal anchor, in integer tenths. The per-template
+    points are packed into fixed-width lanes of one Python integer per
+    position, so a line is scored against all templates in a single pass over
+    its characters: one integer add per position.
+
+    Before that pass, templates are pruned branch-and-bound style against an
+    upper bound of their score: positions past the end of the line earn a
+    known amount (space padding), positions within it at most full points.
+    When the literal anchors are sparse, they are scored first from an index
+    of anchor positions and characters and replace their best case in the
+    bound; a missed anchor costs 3.0, so this prunes most templates on lines
+    of another format. Lines no template can lift above MIN_MATCH_SCORE skip
+    the full pass altogether.
+
+    best_match() returns the same LineDef as scoring each template with
+    score_line_against_template and keeping the first highest score above
+    MIN_MATCH_SCORE.
+    """
+
+    def __init__(self, line_defs: List[LineDef]):
+        active = [(ld, _prepare_template(ld.template)) for ld in line_defs if ld.template]
+        active = [(ld, tmpl) for ld, tmpl in active if tmpl]
+        self.line_defs = [ld for ld, _ in active]
+        self.templates = [tmpl for _, tmpl in active]
+
+        self.totals = []
+        for tmpl in self.templates:
+            self.totals.append(sum(
+                _WEIGHT_A9 if t in 'A9' else _WEIGHT_SPACE if t == ' ' else _WEIGHT_LITERAL
+                for t in tmpl))
+        self.width = max((len(t) for t in self.templates), default=0)
+        self._lane_bits = max(self.totals, default=0).bit_length() + 1
+        self._lane_mask = (1 << self._lane_bits) - 1
+
+        # Per position: points by character class; anchors: literal char -> points
+        class_rows = [[0] * 7 for _ in range(self.width)]
+        literal_rows: List[Dict[str, int]] = [{} for _ in range(self.width)]
+        anchor_max = [0] * self.width  # per position: best case of its anchors
+        self._long_templates = 0  # lanes of templates longer than 10 chars
+        self._score_bias = 0      # per lane: 2**(lane_bits-1) - points needed
+        self._lane_high = 0       # per lane: the top bit
+        top = 1 << (self._lane_bits - 1)
+        for lane, (tmpl, total) in enumerate(zip(self.templates, self.totals)):
+            shift = lane * self._lane_bits
+            if len(tmpl) > 10:
+                self._long_templates |= self._lane_mask << shift
+            for i, t in enumerate(tmpl):
+                if t == 'A' or t == '9' or t == ' ':
+                    earn = _EARN_A if t == 'A' else _EARN_9 if t == '9' else _EARN_SPACE
+                    row = class_rows[i]
+                    for cls in range(7):
+                        row[cls] += earn[cls] << shift
+                else:
+                    lit = literal_rows[i]
+                    lit[t] = lit.get(t, 0) + (_WEIGHT_LITERAL << shift)
+                    anchor_max[i] += _WEIGHT_LITERAL << shift
+            self._score_bias |= (top - self._points_needed(total)) << shift
+            self._lane_high |= top << shift
+        self._class_rows = [tuple(row) for row in class_rows]
+        self._literal_rows = [lit or None for lit in literal_rows]
+        self._anchors = [(i, lit) for i, lit in enumerate(literal_rows) if lit]
+        # Scoring anchors in a separate pass only pays off when they are sparse
+        self._prefilter_anchors = 0 < len(self._anchors) <= self.width // 4
+
+        # Points earned by the space padding from position i to the end, and
+        # the most a line's first n characters can earn (with and without
+        # the anchors)
+        self._space_suffix = [0] * (self.width + 1)
+        for i in range(self.width - 1, -1, -1):
+            self._space_suffix[i] = self._space_suffix[i + 1] + class_rows[i][_CLS_SPACE]
+        self._class_max_prefix = [0] * (self.width + 1)
+        self._anchor_max_prefix = [0] * (self.width + 1)
+        for i in range(self.width):
+            self._class_max_prefix[i + 1] = self._class_max_prefix[i] + self._row_max(class_rows[i])
+            self._anchor_max_prefix[i + 1] = self._anchor_max_prefix[i] + anchor_max[i]
+
+    def _row_max(self, row: List[int]) -> int:
+        """Per-lane maximum over the class points of one position."""
+        best = 0
+        bits, mask = self._lane_bits, self._lane_mask
+        for lane in range(len(self.templates)):
+            shift = lane * bits
+            best |= max((points >> shift) & mask for points in row) << shift
+        return best
+
+    @staticmethod
+    def _points_needed(total: int) -> int:
+        """Fewest earned points that can score above MIN_MATCH_SCORE - _SCORE_EPSILON."""
+        bound = MIN_MATCH_SCORE - _SCORE_EPSILON
+        need = int(bound * total)
+        while need > 0 and (need - 1) / total > bound:
+            need -= 1
+        while need / total <= bound:
+            need += 1
+        return need
+
+    def _survivors(self, upper_bound: int) -> int:
+        """Top bits of the lanes whose upper bound reaches the points needed."""
+        return (upper_bound + self._score_bias) & self._lane_high
+
+    def _anchor_points(self, line_text: str) -> int:
+        packed = 0
+        n = len(line_text)
+        for i, lit in self._anchors:
+            if i >= n:
+                break  # padding spaces never match a literal
+            packed += lit.get(line_text[i], 0)
+        return packed
+
+    def _class_points(self, line_text: str, with_anchors: bool) -> int:
+        packed = 0
+        n = min(len(line_text), self.width)
+        if with_anchors:
+            for ch, row, lit in zip(line_text[:n], self._class_rows, self._literal_rows):
+                packed += row[_char_class(ch)]
+                if lit is not None:
+                    packed += lit.get(ch, 0)
+        else:
+            for ch, row in zip(line_text[:n], self._class_rows):
+                packed += row[_char_class(ch)]
+        return packed + self._space_suffix[n]
+
+    def best_match(self, line_text: str) -> Optional[LineDef]:
+        """Return the best-fit LineDef above MIN_MATCH_SCORE, or None."""
+        if not self.templates:
+            return None
+
+        # Bound by line length: padding earns exactly the space suffix
+        n = min(len(line_text), self.width)
+        bound = self._class_max_prefix[n] + self._space_suffix[n]
+        if not self._survivors(bound + self._anchor_max_prefix[n]):
+            return None
+
+        if self._prefilter_anchors:
+            # Bound by the anchors actually matched
+            anchor_points = self._anchor_points(line_text)
+            survivors = self._survivors(bound + anchor_points)
+            if not survivors:
+                return None
+            packed = self._class_points(line_text, with_anchors=False) + anchor_points
+        else:
+            packed = self._class_points(line_text, with_anchors=True)
+            survivors = self._lane_high
+        if not line_text.rstrip():
+            # Empty lines can't match meaningful templates
+            packed &= ~self._long_templates
+
+        bits, mask = self._lane_bits, self._lane_mask
+        if survivors == self._lane_high:
+            lanes = range(len(self.templates))
+        else:
+            lanes = [lane for lane in range(len(self.templates))
+                     if survivors >> (lane * bits + bits - 1) & 1]
+        scores = [(lane, ((packed >> (lane * bits)) & mask) / self.totals[lane])
+                  for lane in lanes]
+
+        best = max(score for _, score in scores)
+        if best <= MIN_MATCH_SCORE - _SCORE_EPSILON:
+            return None
+
+        candidates = [lane for lane, score in scores if score >= best - _SCORE_EPSILON]
+        if len(candidates) == 1 and best > MIN_MATCH_SCORE + _SCORE_EPSILON:
+            return self.line_defs[candidates[0]]
+
+        # Near-tie or near the threshold: decide with the float heuristic
+        best_def = None
+        best_score = MIN_MATCH_SCORE
+        for i in candidates:
+            score = _score_prepared(line_text, self.templates[i])
+            if score > best_score:
+                best_score = score
+                best_def = self.line_defs[i]
+        return best_def
+
+
+def classify_lines(page_text: str,
+                   line_defs: Union[List[LineDef], CompiledTemplates]) -> List[Tuple[str, Optional[LineDef]]]:
     """
     Classify each line of a page against LINE templates using best-fit scoring.
 
@@ -184,34 +422,19 @@ def classify_lines(page_text: str, line_defs: List[LineDef]) -> List[Tuple[str,
 
     Args:
         page_text: Decompressed page text
-        line_defs: List of LINE definitions with templates
+        line_defs: List of LINE definitions with templates, or the same
+                   compiled once with CompiledTemplates (preferred when
+                   classifying many pages)
 
     Returns:
         List of (line_text, matched_LineDef_or_None) tuples
     """
-    results = []
     # Handle \r\n line endings — strip \r from each line
     lines = page_text.replace('\r\n', '\n').split('\n')
     lines = [l.rstrip('\r') for l in lines]
 
-    # Pre-filter to only templates that have meaningful content
-    active_defs = [(ld, _prepare_template(ld.template))
-                   for ld in line_defs
-                   if ld.template and len(_prepare_template(ld.template)) > 0]
-
-    for line_text in lines:
-        best_def = None
-        best_score = MIN_MATCH_SCORE
-
-        for line_def, prepped_tmpl in active_defs:
-            score = score_line_against_template(line_text, line_def.template)
-            if score > best_score:
-                best_score = score
-                best_def = line_def
-
-        results.append((line_text, best_def))
-
-    return results
+    compiled = line_defs if isinstance(line_defs, CompiledTemplates) else CompiledTemplates(line_defs)
+    return [(line_text, compiled.best_match(line_text)) for line_text in lines]
 
 
 # ============================================================================
@@ -238,9 +461,10 @@ def extract_field_value(line_text: str, field_def: FieldDef) -> str:
 
 def extract_fields_from_page(
     page_text: str,
-    line_defs: List[LineDef],
+    line_defs: Union[List[LineDef], CompiledTemplates],
     field_defs_by_line: Dict[int, List[FieldDef]],
-    page_number: int = 0
+    page_number: int = 0,
+    section_id: Optional[int] = None
 ) -> List[Dict[str, str]]:
     """
     Extract all field values from a decompressed page.
@@ -251,9 +475,10 @@ def extract_fields_from_page(
 
     Args:
         page_text: Decompressed page text
-        line_defs: LINE definitions with templates
+        line_defs: LINE definitions with templates (or CompiledTemplates)
         field_defs_by_line: Dict mapping LINE_ID → List[FieldDef]
         page_number: Page number for metadata
+        section_id: SECTION_ID covering the page (from SECTIONHDR), for metadata
 
     Returns:
         List of dicts, one per classified line with field values
@@ -271,6 +496,7 @@ def extract_fields_from_page(
 
         record = {
             '_page': str(page_number),
+            '_section_id': '' if section_id is None else str(section_id),
             '_line_id': str(line_def.line_id),
             '_line_name': line_def.name,
         }
@@ -288,56 +514,6 @@ def extract_fields_from_page(
 # Page Resolution for Large MAP Files (u32_index format)
 # ============================================================================
 
-def build_segment0_page_lookup(parser: MapFileParser) -> Dict[int, int]:
-    """
-    Build u32_join_key → page_number lookup from Segment 0 for large MAP files.
-
-    In large MAP files, index entries use u32_index format where the 4-byte
-    value is a join key into Segment 0's 15-byte record array. This function
-    parses that array and builds a lookup dict.
-
-    Segment 0 record format (15 bytes, little-endian):
-      [page_number:4][rec_id_byte:1][type:1][pad:1][u32_join_key:4][u32_extra:4]
-
-    Record types (byte 5):
-      0x08 = data record (contains page mapping, u32_join_key is the key)
-      0x0c = separator record (skip)
-
-    The u32_join_key values are sequential odd numbers (1, 3, 5, 7...).
-    MAP index entries reference these keys via their u32_index field.
-
-    Args:
-        parser: MapFileParser with loaded data and parsed segments
-
-    Returns:
-        Dict mapping u32_join_key → page_number
-    """
-    if not parser.segments:
-        return {}
-
-    seg0 = parser.segments[0]
-    lookup = {}
-    record_size = 15
-    offset = seg0.data_offset
-    end = seg0.offset + seg0.size
-
-    while offset + record_size <= end:
-        if offset + record_size > len(parser.data):
-            break
-
-        page_raw = struct.unpack('<I', parser.data[offset:offset+4])[0]
-        rec_type = parser.data[offset + 5]  # type byte at position 5
-        u32_join_key = struct.unpack('<I', parser.data[offset+7:offset+11])[0]
-
-        if rec_type == 0x08:  # data record
-            page_number = page_raw & 0x7FFFFFFF  # mask off branch boundary flag
-            lookup[u32_join_key] = page_number
-
-        offset += record_size
-
-    return lookup
-
-
 def resolve_pages_from_entries(
     entries: List[IndexEntry],
     parser: MapFileParser
@@ -368,8 +544,8 @@ def resolve_pages_from_entries(
             if entry.page_number > 0:
                 pages.add(entry.page_number)
     elif fmt == 'u32_index':
-        # Build lookup from Segment 0
-        seg0_lookup = build_segment0_page_lookup(parser)
+        # Segment 0 join-key lookup (built once per parser)
+        seg0_lookup = parser.segment0_page_lookup()
         if seg0_lookup:
             for entry in entries:
                 page = seg0_lookup.get(entry.u32_index)
@@ -411,6 +587,77 @@ def find_rpt_file(rpt_filename: str, rpt_dirs: List[str]) -> Optional[str]:
     return None
 
 
+# ============================================================================
+# Per-Instance Extraction (Date-Range Search)
+# ============================================================================
+
+@dataclass
+class InstanceJob:
+    """One report instance of a --from/--to search, as sent to a worker process."""
+    as_of_timestamp: str
+    structure_def_id: int
+    map_filepath: str
+    rpt_filepath: str
+    line_id: int                                    # Searched field's LINE_ID
+    field_id: int                                   # Searched field's FIELD_ID
+    line_defs: List[LineDef]
+    field_defs_by_line: Dict[int, List[FieldDef]]
+    keep_lines: Optional[Set[int]] = None           # LINE_IDs to output (None = all)
+
+
+# CompiledTemplates per STRUCTURE_DEF_ID, reused by a worker across instances
+_templates_cache: Dict[int, CompiledTemplates] = {}
+
+
+def extract_instance(job: InstanceJob, search_value: str,
+                     index_cache: Optional[str] = None) -> Tuple[List[Dict[str, str]], str]:
+    """
+    Search one instance's MAP file, decompress the matching RPT pages and
+    extract their fields.
+
+    Runs in a worker process, so nothing is printed; the caller reports the
+    returned status line.
+
+    Returns:
+        (records tagged with AS_OF_TIMESTAMP, status message)
+    """
+    parser = MapFileParser(job.map_filepath)
+    if not parser.load(use_mmap=True):
+        return [], "failed to load MAP file"
+    try:
+        matches = parser.search_index(search_value, job.line_id, job.field_id)
+        pages = sorted(resolve_pages_from_entries(matches, parser)) if matches else []
+    finally:
+        parser.close()
+
+    if not pages:
+        return [], "no matches"
+
+    with RptFile(job.rpt_filepath, index_cache) as rpt:
+        if not rpt.header:
+            return [], "failed to parse RPT file header"
+        page_table = rpt.read_page_table(rpt.header.page_count)
+        target_entries = [page_table[p - 1] for p in pages if 1 <= p <= len(page_table)]
+        if not target_entries:
+            return [], "resolved pages not in the RPT page table"
+        decompressed = decompress_pages(rpt, target_entries)
+        section_index = rpt.section_index
+
+    templates = _templates_cache.get(job.structure_def_id)
+    if templates is None:
+        templates = _templates_cache[job.structure_def_id] = CompiledTemplates(job.line_defs)
+
+    records = []
+    for page_num, page_data in decompressed:
+        text = page_data.decode('utf-8', errors='replace')
+        for record in extract_fields_from_page(text, templates, job.field_defs_by_line, page_num,
+                                               section_index.section_for_page(page_num)):
+            if job.keep_lines is None or int(record['_line_id']) in job.keep_lines:
+                records.append({'AS_OF_TIMESTAMP': job.as_of_timestamp, **record})
+
+    return records, f"{len(pages)} pages, {len(records)} records"
+
+
 # ============================================================================
 # Output Formatters
 # ============================================================================
@@ -483,6 +730,50 @@ def output_table(records: List[Dict[str, str]], max_rows: int = 50):
     print(f"\nTotal: {len(records)} records")
 
 
+class RecordStreamWriter:
+    """
+    Write records to CSV or JSON incrementally, as a range search produces them.
+
+    CSV needs its columns up front, so the caller passes every field name the
+    records can carry; missing values are written as empty cells.
+    """
+
+    def __init__(self, output_path: str, output_format: str, fieldnames: List[str]):
+        self.output_path = output_path
+        self.output_format = output_format
+        self.count = 0
+        self._file = open(output_path, 'w', newline='', encoding='utf-8')
+        if output_format == 'json':
+            self._file.write('[')
+            self._writer = None
+        else:
+            self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, restval='')
+            self._writer.writeheader()
+
+    def write(self, records: List[Dict[str, str]]):
+        """Append records and flush them to disk."""
+        if self._writer is not None:
+            self._writer.writerows(records)
+        else:
+            for i, record in enumerate(records, self.count):
+                self._file.write(',\n' if i else '\n')
+                self._file.write(textwrap.indent(json.dumps(record, indent=2, default=str), '  '))
+        self.count += len(records)
+        self._file.flush()
+
+    def close(self):
+        if self._writer is None:
+            self._file.write('\n]\n' if self.count else ']\n')
+        self._file.close()
+        print(f"Wrote {self.count} records to {self.output_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 # ============================================================================
 # Main Extraction Pipeline
 # ============================================================================
@@ -490,9 +781,11 @@ def output_table(records: List[Dict[str, str]], max_rows: int = 50):
 class IntelliSTORExtractor:
     """Main data extraction tool."""
 
-    def __init__(self, config: Config, rpt_dirs: Optional[List[str]] = None):
+    def __init__(self, config: Config, rpt_dirs: Optional[List[str]] = None,
+                 index_cache: Optional[str] = None):
         self.config = config
         self.rpt_dirs = rpt_dirs or []
+        self.index_cache = index_cache  # .rptidx cache: None = off, '' = sidecar, else dir
         self.db: Optional[DatabaseAccess] = None
 
     def connect(self):
@@ -532,6 +825,80 @@ class IntelliSTORExtractor:
             )
         return None
 
+    def _get_instances_with_map_files(self, species_id: int) -> List[Tuple[ReportInstance, str]]:
+        """
+        Get all instances of a report species with their MAP filenames
+        (one query, oldest first).
+        """
+        cursor = self.db.conn.cursor(as_dict=True)
+        cursor.execute("""
+            SELECT ri.DOMAIN_ID, ri.REPORT_SPECIES_ID, ri.AS_OF_TIMESTAMP,
+                   ri.STRUCTURE_DEF_ID, ri.RPT_FILE_SIZE_KB, ri.MAP_FILE_SIZE_KB,
+                   mf.FILENAME
+            FROM REPORT_INSTANCE ri
+            JOIN SST_STORAGE sst ON sst.DOMAIN_ID = ri.DOMAIN_ID
+                 AND sst.REPORT_SPECIES_ID = ri.REPORT_SPECIES_ID
+                 AND sst.AS_OF_TIMESTAMP = ri.AS_OF_TIMESTAMP
+            JOIN MAPFILE mf ON sst.MAP_FILE_ID = mf.MAP_FILE_ID
+            WHERE ri.DOMAIN_ID = %s AND ri.REPORT_SPECIES_ID = %s
+            ORDER BY ri.AS_OF_TIMESTAMP
+        """, (self.config.domain_id, species_id))
+
+        return [
+            (ReportInstance(
+                domain_id=row['DOMAIN_ID'],
+                report_species_id=row['REPORT_SPECIES_ID'],
+                as_of_timestamp=row['AS_OF_TIMESTAMP'],
+                structure_def_id=row['STRUCTURE_DEF_ID'],
+                rpt_file_size_kb=row['RPT_FILE_SIZE_KB'] or 0,
+                map_file_size_kb=row['MAP_FILE_SIZE_KB'] or 0
+            ), row['FILENAME'].strip())
+            for row in cursor.fetchall() if row['FILENAME']
+        ]
+
+    def _get_instances_in_range(
+        self, species_id: int, date_from: Optional[str], date_to: Optional[str]
+    ) -> List[Tuple[ReportInstance, Optional[str], Optional[str]]]:
+        """
+        Get the instances of a report species between two dates (YYYY-MM-DD,
+        inclusive; None = unbounded) with their MAP and RPT filenames, in one
+        query, oldest first.
+        """
+        cursor = self.db.conn.cursor(as_dict=True)
+        cursor.execute("""
+            SELECT ri.DOMAIN_ID, ri.REPORT_SPECIES_ID, ri.AS_OF_TIMESTAMP,
+                   ri.STRUCTURE_DEF_ID, ri.RPT_FILE_SIZE_KB, ri.MAP_FILE_SIZE_KB,
+                   mf.FILENAME AS MAP_FILENAME, rf.FILENAME AS RPT_FILENAME
+            FROM REPORT_INSTANCE ri
+            LEFT JOIN SST_STORAGE sst ON sst.DOMAIN_ID = ri.DOMAIN_ID
+                 AND sst.REPORT_SPECIES_ID = ri.REPORT_SPECIES_ID
+                 AND sst.AS_OF_TIMESTAMP = ri.AS_OF_TIMESTAMP
+            LEFT JOIN MAPFILE mf ON sst.MAP_FILE_ID = mf.MAP_FILE_ID
+            LEFT JOIN RPTFILE_INSTANCE rfi ON rfi.DOMAIN_ID = ri.DOMAIN_ID
+                 AND rfi.REPORT_SPECIES_ID = ri.REPORT_SPECIES_ID
+                 AND rfi.AS_OF_TIMESTAMP = ri.AS_OF_TIMESTAMP
+            LEFT JOIN RPTFILE rf ON rfi.RPT_FILE_ID = rf.RPT_FILE_ID
+            WHERE ri.DOMAIN_ID = %s AND ri.REPORT_SPECIES_ID = %s
+                  AND CAST(ri.AS_OF_TIMESTAMP AS DATE) BETWEEN %s AND %s
+            ORDER BY ri.AS_OF_TIMESTAMP
+        """, (self.config.domain_id, species_id,
+              date_from or '1900-01-01', date_to or '9999-12-31'))
+
+        instances = {}
+        for row in cursor.fetchall():
+            if row['AS_OF_TIMESTAMP'] in instances:
+                continue  # Extra SST/RPT file rows: keep the first, as get_*_filename do
+            instances[row['AS_OF_TIMESTAMP']] = (ReportInstance(
+                domain_id=row['DOMAIN_ID'],
+                report_species_id=row['REPORT_SPECIES_ID'],
+                as_of_timestamp=row['AS_OF_TIMESTAMP'],
+                structure_def_id=row['STRUCTURE_DEF_ID'],
+                rpt_file_size_kb=row['RPT_FILE_SIZE_KB'] or 0,
+                map_file_size_kb=row['MAP_FILE_SIZE_KB'] or 0
+            ), (row['MAP_FILENAME'] or '').strip() or None,
+                (row['RPT_FILENAME'] or '').strip() or None)
+        return list(instances.values())
+
     def list_indexed_fields(self, report_name: str):
         """List all indexed fields for a report."""
         species_id = self.db.get_report_species_id_by_name(report_name)
@@ -642,11 +1009,10 @@ class IntelliSTORExtractor:
         print(f"  MAP file: {map_filename}")
 
         parser = MapFileParser(map_filepath)
-        if not parser.load():
+        if not parser.load(use_mmap=True):
             print(f"  ERROR: Failed to load MAP file.")
             return []
 
-        parser.parse_segments()
         matches = parser.search_index(search_value, target_field.line_id, target_field.field_id)
 
         if not matches:
@@ -657,6 +1023,7 @@ class IntelliSTORExtractor:
 
         # === Step 4: Resolve page numbers ===
         page_numbers = resolve_pages_from_entries(matches, parser)
+        parser.close()
 
         if not page_numbers:
             print(f"  WARNING: Could not resolve any page numbers from MAP entries.")
@@ -682,32 +1049,33 @@ class IntelliSTORExtractor:
 
         print(f"  RPT file: {rpt_filepath}")
 
-        # Parse RPT header to get page count
-        with open(rpt_filepath, 'rb') as f:
-            header_data = f.read(0x200)
-        rpt_header = parse_rpt_header(header_data)
-        if not rpt_header:
-            print(f"  ERROR: Failed to parse RPT file header.")
-            return []
+        with RptFile(rpt_filepath, self.index_cache) as rpt:
+            # Header and page table come from the .rptidx cache when enabled
+            rpt_header = rpt.header
+            section_index = rpt.section_index
+            if not rpt_header:
+                print(f"  ERROR: Failed to parse RPT file header.")
+                return []
 
-        print(f"  RPT pages: {rpt_header.page_count}")
+            print(f"  RPT pages: {rpt_header.page_count}")
 
-        # Read page table
-        page_table = read_page_table(rpt_filepath, rpt_header.page_count)
-        if not page_table:
-            print(f"  ERROR: Failed to read page table from RPT file.")
-            return []
+            # Read page table
+            page_table = rpt.read_page_table(rpt_header.page_count)
+            if not page_table:
+                print(f"  ERROR: Failed to read page table from RPT file.")
+                return []
 
-        # Select entries for our pages
-        target_entries = [e for e in page_table if e.page_number in page_numbers]
+            # Select entries for our pages (page N is row N-1 of the page table)
+            target_entries = [page_table[p - 1] for p in sorted_pages
+                              if 1 <= p <= len(page_table)]
 
-        if not target_entries:
-            print(f"  ERROR: None of the resolved pages exist in the page table.")
-            return []
+            if not target_entries:
+                print(f"  ERROR: None of the resolved pages exist in the page table.")
+                return []
 
-        # Decompress
-        print(f"  Decompressing {len(target_entries)} pages...")
-        decompressed = decompress_pages(rpt_filepath, target_entries)
+            # Decompress
+            print(f"  Decompressing {len(target_entries)} pages...")
+            decompressed = decompress_pages(rpt, target_entries)
 
         if not decompressed:
             print(f"  ERROR: Failed to decompress any pages.")
@@ -719,7 +1087,8 @@ class IntelliSTORExtractor:
         if raw_pages:
             for page_num, page_data in decompressed:
                 print(f"\n{'='*60}")
-                print(f"PAGE {page_num}")
+                sid = section_index.section_for_page(page_num)
+                print(f"PAGE {page_num}" + (f"  (SECTION {sid})" if sid is not None else ''))
                 print('='*60)
                 text = page_data.decode('utf-8', errors='replace')
                 print(text)
@@ -741,11 +1110,15 @@ class IntelliSTORExtractor:
         print(f"  {len(line_defs)} LINE templates, "
               f"{len(all_fields)} FIELD definitions")
 
+        # Compile the templates once for all pages of this structure
+        templates = CompiledTemplates(line_defs)
+
         # Extract from each page
         all_records = []
         for page_num, page_data in decompressed:
             text = page_data.decode('utf-8', errors='replace')
-            records = extract_fields_from_page(text, line_defs, field_defs_by_line, page_num)
+            records = extract_fields_from_page(text, templates, field_defs_by_line, page_num,
+                                               section_index.section_for_page(page_num))
             all_records.extend(records)
 
         print(f"  Extracted {len(all_records)} records from {len(decompressed)} pages.")
@@ -775,6 +1148,300 @@ class IntelliSTORExtractor:
         return all_records
 
 
+    def search_date_range(
+        self,
+        report_name: str,
+        field_name: str,
+        search_value: str,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        output_path: Optional[str] = None,
+        output_format: str = 'table',
+        detail_only: bool = False,
+        line_filter: Optional[List[int]] = None,
+        workers: int = 1
+    ) -> List[Dict[str, str]]:
+        """
+        Search → decompress → extract across every instance in a date range.
+
+        Instances are resolved in one query and each is processed by
+        extract_instance on a process pool. Records are tagged with
+        AS_OF_TIMESTAMP and written to the CSV/JSON output as each instance
+        finishes (table output is printed at the end).
+
+        Args:
+            report_name: Report species name (e.g., 'DDU017P')
+            field_name: Indexed field name (e.g., 'ACCOUNT_NO')
+            search_value: Value to search for
+            date_from: First instance date (YYYY-MM-DD), None = earliest
+            date_to: Last instance date (YYYY-MM-DD), None = latest
+            output_path: Optional file path for CSV/JSON output
+            output_format: 'table', 'csv', or 'json'
+            detail_only: If True, only include the LINE that contains the search field
+            line_filter: Optional list of LINE_IDs to include
+            workers: Number of worker processes (1 = run in this process)
+
+        Returns:
+            All extracted records, ordered by AS_OF_TIMESTAMP
+        """
+        print(f"Resolving report '{report_name}'...")
+        species_id = self.db.get_report_species_id_by_name(report_name)
+        if not species_id:
+            print(f"  ERROR: Report '{report_name}' not found in database.")
+            return []
+
+        instances = self._get_instances_in_range(species_id, date_from, date_to)
+        if not instances:
+            print(f"  ERROR: No instances found for report '{report_name}' between "
+                  f"{date_from or 'the first'} and {date_to or 'the last'}.")
+            return []
+        print(f"  {len(instances)} instances from {instances[0][0].as_of_timestamp} "
+              f"to {instances[-1][0].as_of_timestamp}")
+
+        # LINE/FIELD definitions are loaded once per structure, not per instance
+        structures: Dict[int, Optional[Tuple[FieldDef, List[LineDef], Dict[int, List[FieldDef]]]]] = {}
+        for structure_def_id in sorted({inst.structure_def_id for inst, _, _ in instances}):
+            all_fields = self.db.get_field_definitions(structure_def_id)
+            target_field = None
+            for f in all_fields:
+                if f.is_indexed and f.name.strip().upper() == field_name.strip().upper():
+                    target_field = f
+                    break
+            if not target_field:
+                structures[structure_def_id] = None
+                continue
+            field_defs_by_line: Dict[int, List[FieldDef]] = {}
+            for fdef in all_fields:
+                field_defs_by_line.setdefault(fdef.line_id, []).append(fdef)
+            structures[structure_def_id] = (
+                target_field, self.db.get_line_definitions(structure_def_id), field_defs_by_line)
+
+        missing_structures = [sid for sid, s in structures.items() if s is None]
+        if missing_structures:
+            print(f"  WARNING: Field '{field_name}' is not indexed for STRUCTURE_DEF_ID "
+                  f"{', '.join(map(str, missing_structures))}", file=sys.stderr)
+
+        jobs: List[InstanceJob] = []
+        fieldnames = ['AS_OF_TIMESTAMP', '_page', '_section_id', '_line_id', '_line_name']
+        skipped = {'field': 0, 'map': 0, 'rpt': 0}
+        for inst, map_filename, rpt_filename in instances:
+            structure = structures[inst.structure_def_id]
+            if structure is None:
+                skipped['field'] += 1
+                continue
+            map_filepath = (os.path.join(self.config.map_file_dir, map_filename)
+                            if map_filename else None)
+            if not map_filepath or not os.path.exists(map_filepath):
+                skipped['map'] += 1
+                continue
+            rpt_filepath = find_rpt_file(rpt_filename, self.rpt_dirs) if rpt_filename else None
+            if not rpt_filepath:
+                skipped['rpt'] += 1
+                continue
+
+            target_field, line_defs, field_defs_by_line = structure
+            if detail_only:
+                keep_lines = {target_field.line_id}
+            else:
+                keep_lines = set(line_filter) if line_filter else None
+            for line_id, fdefs in field_defs_by_line.items():
+                if keep_lines is None or line_id in keep_lines:
+                    for fdef in fdefs:
+                        if fdef.name not in fieldnames:
+                            fieldnames.append(fdef.name)
+
+            jobs.append(InstanceJob(
+                as_of_timestamp=str(inst.as_of_timestamp),
+                structure_def_id=inst.structure_def_id,
+                map_filepath=map_filepath,
+                rpt_filepath=rpt_filepath,
+                line_id=target_field.line_id,
+                field_id=target_field.field_id,
+                line_defs=line_defs,
+                field_defs_by_line=field_defs_by_line,
+                keep_lines=keep_lines
+            ))
+
+        for reason, label in (('field', 'field not indexed'), ('map', 'MAP file not found'),
+                              ('rpt', 'RPT file not found')):
+            if skipped[reason]:
+                print(f"  WARNING: Skipped {skipped[reason]} instances ({label})", file=sys.stderr)
+        if not jobs:
+            print(f"  ERROR: No instances left to search.")
+            return []
+
+        print(f"  Searching {len(jobs)} instances with {min(workers, len(jobs))} workers...")
+        all_records: List[Dict[str, str]] = []
+        writer = None
+        if output_path:
+            writer = RecordStreamWriter(output_path,
+                                        'json' if output_format == 'json' else 'csv',
+                                        fieldnames)
+
+        def report(done: int, job: InstanceJob, records: List[Dict[str, str]], status: str):
+            print(f"  [{done}/{len(jobs)}] {job.as_of_timestamp}: {status}")
+            if records:
+                all_records.extend(records)
+                if writer:
+                    writer.write(records)
+
+        try:
+            if workers <= 1 or len(jobs) == 1:
+                for done, job in enumerate(jobs, 1):
+                    report(done, job, *extract_instance(job, search_value, self.index_cache))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = {pool.submit(extract_instance, job, search_value, self.index_cache): job
+                               for job in jobs}
+                    for done, future in enumerate(as_completed(futures), 1):
+                        job = futures[future]
+                        try:
+                            records, status = future.result()
+                        except Exception as e:
+                            records, status = [], f"ERROR: {e}"
+                        report(done, job, records, status)
+        finally:
+            if writer:
+                writer.close()
+
+        all_records.sort(key=lambda r: r['AS_OF_TIMESTAMP'])
+        instances_hit = len({r['AS_OF_TIMESTAMP'] for r in all_records})
+        print(f"  Extracted {len(all_records)} records from {instances_hit} of "
+              f"{len(jobs)} instances.")
+
+        if not output_path:
+            output_table(all_records)
+
+        return all_records
+
+    def search_all_instances(
+        self,
+        report_name: str,
+        field_name: str,
+        search_value: str,
+        value_index: str,
+        output_path: Optional[str] = None,
+        output_format: str = 'table'
+    ) -> List[Dict[str, str]]:
+        """
+        Find every instance of a report whose MAP file contains a value.
+
+        Uses the MAP value index built by map_value_index.py instead of opening
+        each MAP file, so the lookup costs one indexed query per field layout.
+
+        Args:
+            report_name: Report species name (e.g., 'DDU017P')
+            field_name: Indexed field name (e.g., 'ACCOUNT_NO')
+            search_value: Value to search for
+            value_index: Path to the SQLite MAP value index
+            output_path: Optional file path for CSV/JSON output
+            output_format: 'table', 'csv', or 'json'
+
+        Returns:
+            One record per matching instance (AS_OF_TIMESTAMP, MAP_FILE, pages)
+        """
+        print(f"Resolving report '{report_name}'...")
+        species_id = self.db.get_report_species_id_by_name(report_name)
+        if not species_id:
+            print(f"  ERROR: Report '{report_name}' not found in database.")
+            return []
+
+        instances = self._get_instances_with_map_files(species_id)
+        if not instances:
+            print(f"  ERROR: No instances with MAP files found for report '{report_name}'.")
+            return []
+        print(f"  {len(instances)} instances with MAP files")
+
+        # The field's LINE_ID/FIELD_ID can differ between structure definitions
+        by_field: Dict[Tuple[int, int], Dict[str, Tuple[ReportInstance, str]]] = {}
+        missing_structures = []
+        for structure_def_id in sorted({inst.structure_def_id for inst, _ in instances}):
+            target_field = None
+            for f in self.db.get_field_definitions(structure_def_id, indexed_only=True):
+                if f.name.strip().upper() == field_name.strip().upper():
+                    target_field = f
+                    break
+            if not target_field:
+                missing_structures.append(structure_def_id)
+                continue
+            files = by_field.setdefault((target_field.line_id, target_field.field_id), {})
+            for inst, map_filename in instances:
+                if inst.structure_def_id == structure_def_id:
+                    files[map_filename.upper()] = (inst, map_filename)
+
+        if missing_structures:
+            print(f"  WARNING: Field '{field_name}' is not indexed for STRUCTURE_DEF_ID "
+                  f"{', '.join(map(str, missing_structures))}", file=sys.stderr)
+        if not by_field:
+            print(f"  ERROR: Field '{field_name}' is not indexed for this report.")
+            return []
+
+        conn = open_value_index(value_index)
+        try:
+            # Instances whose MAP file is missing from the index (no file system access)
+            known = {name.upper(): (name, entry) for name, entry in indexed_files(conn).items()}
+            unindexed = sum(1 for files in by_field.values() for name in files if name not in known)
+
+            # Prefix match, as MapFileParser.search_index does; one hit per instance
+            hits: Dict[str, Tuple[ReportInstance, str, int, int, List[str], Set[int]]] = {}
+            for (line_id, field_id), files in sorted(by_field.items()):
+                for map_filename, value, pages in lookup_value_index(
+                        conn, search_value, line_id, field_id, prefix=True):
+                    known_file = files.get(map_filename.upper())
+                    if known_file is None:
+                        continue  # Another report's MAP file
+                    inst, db_filename = known_file
+                    hit = hits.setdefault(db_filename.upper(),
+                                          (inst, db_filename, line_id, field_id, [], set()))
+                    hit[4].append(value)
+                    hit[5].update(pages)
+
+            # Only the MAP files that produced hits are checked for changes since indexing
+            changed = 0
+            for map_key in hits:
+                # Stat the name as indexed (the database name may differ in case)
+                indexed_name, entry = known.get(map_key, (hits[map_key][1], None))
+                try:
+                    st = os.stat(os.path.join(self.config.map_file_dir, indexed_name))
+                except OSError:
+                    st = None
+                if st is None or not is_value_index_current(entry, st):
+                    changed += 1
+            problems = []
+            if unindexed:
+                problems.append(f"{unindexed} MAP files are not indexed")
+            if changed:
+                problems.append(f"{changed} matching MAP files changed since the index was built")
+            if problems:
+                print(f"  WARNING: {' and '.join(problems)}; rerun map_value_index.py "
+                      f"--map-dir to refresh.", file=sys.stderr)
+        finally:
+            conn.close()
+
+        records = [{
+            'AS_OF_TIMESTAMP': str(inst.as_of_timestamp),
+            'MAP_FILE': db_filename,
+            'LINE_ID': str(line_id),
+            'FIELD_ID': str(field_id),
+            'VALUES': ' '.join(values),
+            'PAGE_COUNT': str(len(pages)),
+            'PAGES': ','.join(map(str, sorted(pages))),
+        } for inst, db_filename, line_id, field_id, values, pages in hits.values()]
+
+        records.sort(key=lambda r: r['AS_OF_TIMESTAMP'])
+        print(f"  '{search_value}' found in {len(records)} of {len(instances)} instances.")
+
+        if output_path:
+            if output_format == 'json':
+                output_json(records, output_path)
+            else:
+                output_csv(records, output_path)
+        else:
+            output_table(records)
+
+        return records
+
+
 # ============================================================================
 # CLI
 # ============================================================================
@@ -797,6 +1464,14 @@ Examples:
 
   # Show raw page text
   %(prog)s --report DDU017P --field ACCOUNT_NO --value "200-044295-001" --raw-pages
+
+  # Extract from every instance in a date range (parallel, streamed to CSV)
+  %(prog)s --report DDU017P --field ACCOUNT_NO --value "200-044295-001" \\
+      --from 2024-01-01 --to 2024-12-31 --output account.csv --format csv
+
+  # Every instance containing a value (index built by map_value_index.py)
+  %(prog)s --report DDU017P --field ACCOUNT_NO --value "200-044295-001" \\
+      --all-instances --value-index map_values.sqlite
         """
     )
 
@@ -807,6 +1482,17 @@ Examples:
     parser.add_argument('--field', help='Indexed field name to search (e.g., ACCOUNT_NO)')
     parser.add_argument('--value', help='Value to search for')
     parser.add_argument('--date', help='Report instance date (YYYY-MM-DD)')
+    parser.add_argument('--from', dest='date_from', metavar='DATE',
+                        help='Search every instance from this date (YYYY-MM-DD, inclusive)')
+    parser.add_argument('--to', dest='date_to', metavar='DATE',
+                        help='Search every instance up to this date (YYYY-MM-DD, inclusive)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for --from/--to searches (default: CPU count)')
+    parser.add_argument('--all-instances', action='store_true',
+                        help='List every instance whose MAP file contains the value '
+                             '(requires --value-index)')
+    parser.add_argument('--value-index', metavar='FILE',
+                        help='MAP value index built by map_value_index.py')
 
     # Output
     parser.add_argument('--output', '-o', help='Output file path')
@@ -832,6 +1518,9 @@ Examples:
                         help='MAP files directory')
     parser.add_argument('--rpt-dir', action='append', default=[],
                         help='RPT files directory (can specify multiple)')
+    parser.add_argument('--index-cache', nargs='?', const='', metavar='DIR',
+                        help='Cache RPT page/section tables as .rptidx files for repeat '
+                             'lookups (in DIR, or next to each RPT file if DIR is omitted)')
 
     args = parser.parse_args()
 
@@ -841,13 +1530,51 @@ Examples:
         map_file_dir=args.map_dir
     )
 
-    extractor = IntelliSTORExtractor(config, rpt_dirs=args.rpt_dir)
+    extractor = IntelliSTORExtractor(config, rpt_dirs=args.rpt_dir,
+                                     index_cache=args.index_cache)
 
     try:
         extractor.connect()
 
         if args.list_fields:
             extractor.list_indexed_fields(args.report)
+        elif args.all_instances:
+            if not (args.field and args.value and args.value_index):
+                print("Error: --all-instances requires --field, --value and --value-index")
+                sys.exit(1)
+            if not os.path.exists(args.value_index):
+                print(f"Error: MAP value index not found: {args.value_index}")
+                sys.exit(1)
+            extractor.search_all_instances(
+                report_name=args.report,
+                field_name=args.field,
+                search_value=args.value,
+                value_index=args.value_index,
+                output_path=args.output,
+                output_format=args.format
+            )
+        elif args.date_from or args.date_to:
+            if not (args.field and args.value):
+                print("Error: --from/--to requires --field and --value")
+                sys.exit(1)
+            if args.date or args.raw_pages:
+                print("Error: --from/--to cannot be combined with --date or --raw-pages")
+                sys.exit(1)
+            if args.workers < 1:
+                print("Error: --workers must be at least 1")
+                sys.exit(1)
+            extractor.search_date_range(
+                report_name=args.report,
+                field_name=args.field,
+                search_value=args.value,
+                date_from=args.date_from,
+                date_to=args.date_to,
+                output_path=args.output,
+                output_format=args.format,
+                detail_only=args.detail_only,
+                line_filter=args.line_filter,
+                workers=args.workers
+            )
         elif args.field and args.value:
             extractor.search_and_extract(
                 report_name=args.report,
@@ -37,12 +37,16 @@ Requirements:
 """
 
 import argparse
+import mmap
 import struct
 import os
 import sys
+from array import array
+from bisect import bisect_right
+from itertools import compress, groupby, islice
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Iterator, Optional, Tuple, Any
 from datetime import datetime
 
 try:
@@ -166,6 +170,226 @@ class IndexEntry:
     entry_format: str = 'page'  # 'page' (small files) or 'u32_index' (large files)
 
 
+class IndexEntrySet:
+    """
+    Columnar set of index entries read from one MAP segment.
+
+    Holds one buffer of fixed-width (space-padded) values, one buffer of the
+    5 trailing bytes per entry, and a uint32 array with the page number
+    ('page' format) or u32_index ('u32_index' format) of each entry. This is
+    about field_width + 9 bytes per entry; IndexEntry objects are only built
+    when an entry is accessed or iterated.
+    """
+
+    TRAILING_SIZE = 5
+
+    def __init__(self, field_width: int, entry_format: str = 'page',
+                 values: bytes = b'', trailing: bytes = b'', refs: Optional[array] = None):
+        self.field_width = field_width
+        self.entry_format = entry_format
+        self.values_buffer = values
+        self.trailing_buffer = trailing
+        self.refs = refs if refs is not None else array('I')
+
+    @classmethod
+    def from_entries(cls, raw: bytes, field_width: int, is_u32_format: bool) -> 'IndexEntrySet':
+        """
+        Build a set from contiguous raw entries ([length:2][value:N][trailing:5] each).
+
+        The columns are split out with strided slices, so no per-entry
+        Python objects are created.
+        """
+        width = field_width
+        entry_size = 2 + width + cls.TRAILING_SIZE
+        count = len(raw) // entry_size
+
+        values = bytearray(count * width)
+        for b in range(width):
+            values[b::width] = raw[2 + b::entry_size]
+        trailing = bytearray(count * cls.TRAILING_SIZE)
+        for b in range(cls.TRAILING_SIZE):
+            trailing[b::cls.TRAILING_SIZE] = raw[2 + width + b::entry_size]
+
+        # page: uint16 at trailing[0:2]; u32_index: uint32 at trailing[0:4]
+        ref_bytes = bytearray(count * 4)
+        for b in range(4 if is_u32_format else 2):
+            ref_bytes[b::4] = trailing[b::cls.TRAILING_SIZE]
+        refs = array('I')
+        refs.frombytes(ref_bytes)
+        if sys.byteorder == 'big':
+            refs.byteswap()
+
+        return cls(width, 'u32_index' if is_u32_format else 'page',
+                   bytes(values), bytes(trailing), refs)
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def __iter__(self) -> Iterator[IndexEntry]:
+        for i in range(len(self.refs)):
+            yield self._entry(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self.refs))
+            if step != 1:
+                return [self._entry(i) for i in range(start, stop, step)]
+            return self.subset(start, max(start, stop))
+        return self._entry(range(len(self.refs))[index])
+
+    def subset(self, start: int, stop: int) -> 'IndexEntrySet':
+        """Entries [start, stop) as a new set (buffers are sliced, not shared)."""
+        w, t = self.field_width, self.TRAILING_SIZE
+        return IndexEntrySet(self.field_width, self.entry_format,
+                             self.values_buffer[start * w:stop * w],
+                             self.trailing_buffer[start * t:stop * t],
+                             self.refs[start:stop])
+
+    def value(self, i: int) -> str:
+        """Decoded, stripped value of entry i."""
+        w = self.field_width
+        return self.values_buffer[i * w:(i + 1) * w].decode('ascii', errors='replace').strip()
+
+    def values(self) -> Iterator[str]:
+        """Decoded, stripped values in entry order."""
+        w = self.field_width
+        text = self.values_buffer.decode('ascii', errors='replace')
+        for start in range(0, len(text), w):
+            yield text[start:start + w].strip()
+
+    def _entry(self, i: int) -> IndexEntry:
+        t = self.TRAILING_SIZE
+        trailing = self.trailing_buffer[i * t:(i + 1) * t]
+        if self.entry_format == 'u32_index':
+            return IndexEntry(
+                value=self.value(i),
+                page_number=0,  # Cannot resolve without spool file
+                raw_length=self.field_width,
+                raw_trailing=trailing,
+                u32_index=self.refs[i],
+                entry_format='u32_index'
+            )
+        return IndexEntry(
+            value=self.value(i),
+            page_number=self.refs[i],
+            raw_length=self.field_width,
+            raw_trailing=trailing,
+            u32_index=0,
+            entry_format='page'
+        )
+
+    def without_placeholders(self) -> 'IndexEntrySet':
+        """
+        Drop placeholder entries (empty, or no alphanumeric character in the
+        first 5 characters of the value).
+        """
+        dropped = [i for i, v in enumerate(self.values())
+                   if not (v and any(map(str.isalnum, v[:5])))]
+        if not dropped:
+            return self
+
+        # Placeholders sort together, so keep the runs between them
+        runs = [self.subset(start, stop)
+                for start, stop in zip([0] + [i + 1 for i in dropped], dropped + [len(self)])
+                if start < stop]
+        refs = array('I')
+        for run in runs:
+            refs.extend(run.refs)
+        return IndexEntrySet(self.field_width, self.entry_format,
+                             b''.join(run.values_buffer for run in runs),
+                             b''.join(run.trailing_buffer for run in runs),
+                             refs)
+
+    def unique_counts(self) -> List[Tuple[str, int]]:
+        """
+        Return (value, count) tuples sorted by value.
+
+        MAP entries are stored sorted, so the counts normally come straight
+        from run lengths in entry order; values that are out of order once
+        stripped (e.g. leading blanks) are sorted first.
+        """
+        counts: List[Tuple[str, int]] = []
+        for value, run in groupby(self.values()):
+            if counts and value <= counts[-1][0]:
+                return [(v, sum(1 for _ in r)) for v, r in groupby(sorted(self.values()))]
+            counts.append((value, sum(1 for _ in run)))
+        return counts
+
+
+class Segment0PageLookup:
+    """
+    u32_join_key → page_number lookup from Segment 0 of a large MAP file.
+
+    In large MAP files, index entries use u32_index format where the 4-byte
+    value is a join key into Segment 0's 15-byte record array.
+
+    Segment 0 record format (15 bytes, little-endian):
+      [page_number:4][rec_id_byte:1][type:1][pad:1][u32_join_key:4][u32_extra:4]
+
+    Record types (byte 5):
+      0x08 = data record (contains page mapping, u32_join_key is the key)
+      0x0c = separator record (skip)
+
+    The u32_join_key values are sequential odd numbers (1, 3, 5, 7...), so the
+    keys normally arrive sorted. They are held as parallel sorted uint32 arrays
+    and resolved by bisection; a repeated key resolves to its last record.
+    """
+
+    RECORD_SIZE = 15
+    DATA_RECORD = 0x08
+
+    # Clears the branch boundary flag (bit 31) in the high byte of page_number
+    _PAGE_HIGH_MASK = bytes(b & 0x7F for b in range(256))
+
+    def __init__(self, keys: array, pages: array):
+        self.keys = keys
+        self.pages = pages
+
+    @classmethod
+    def from_records(cls, raw: bytes) -> 'Segment0PageLookup':
+        """Build the lookup from the raw Segment 0 record array."""
+        size = cls.RECORD_SIZE
+        raw = bytes(raw[:len(raw) // size * size])
+        count = len(raw) // size
+
+        # Transpose the packed records into uint32 columns with strided slices
+        page_bytes = bytearray(count * 4)
+        key_bytes = bytearray(count * 4)
+        for b in range(4):
+            page_bytes[b::4] = raw[b::size]
+            key_bytes[b::4] = raw[7 + b::size]
+        page_bytes[3::4] = page_bytes[3::4].translate(cls._PAGE_HIGH_MASK)
+
+        all_pages = array('I')
+        all_pages.frombytes(page_bytes)
+        all_keys = array('I')
+        all_keys.frombytes(key_bytes)
+        if sys.byteorder == 'big':
+            all_pages.byteswap()
+            all_keys.byteswap()
+
+        is_data = list(map(cls.DATA_RECORD.__eq__, raw[5::size]))
+        keys = array('I', compress(all_keys, is_data))
+        pages = array('I', compress(all_pages, is_data))
+
+        if any(a > b for a, b in zip(keys, keys[1:])):
+            # Stable, so repeated keys keep file order (last one wins on lookup)
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            keys = array('I', [keys[i] for i in order])
+            pages = array('I', [pages[i] for i in order])
+        return cls(keys, pages)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def get(self, join_key: int, default: Optional[int] = None) -> Optional[int]:
+        """Return the page number for a join key, or default if it is unknown."""
+        i = bisect_right(self.keys, join_key) - 1
+        if i >= 0 and self.keys[i] == join_key:
+            return self.pages[i]
+        return default
+
+
 # ============================================================================
 # Database Access
 # ============================================================================
@@ -375,17 +599,38 @@ class MapFileParser:
         self.me_positions: List[int] = []
         self.segments: List[MapSegmentInfo] = []
         self.lookup_table: List[Dict[str, int]] = []
+        # segment offset -> (entry_size, valid_entry_count, is_u32_format)
+        self._entry_layouts: Dict[int, Tuple[int, int, bool]] = {}
+        self._segment0_lookup: Optional[Segment0PageLookup] = None
+        # Segments materialised so far, by **ME marker number
+        self._segment_cache: Dict[int, Optional[MapSegmentInfo]] = {}
+        self._me_markers_complete = False
+
+    def load(self, use_mmap: bool = False) -> bool:
+        """
+        Load MAP file into memory.
 
-    def load(self) -> bool:
-        """Load MAP file into memory"""
+        With use_mmap=True the file is memory-mapped read-only instead, so only
+        the pages touched by a search (segment headers, bisection probes and
+        matching entries) are ever read. Call close() when done.
+        """
         try:
             with open(self.filepath, 'rb') as f:
-                self.data = f.read()
+                if use_mmap and os.fstat(f.fileno()).st_size > 0:
+                    self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    self.data = f.read()
             return True
         except Exception as e:
             print(f"Error loading MAP file: {e}")
             return False
 
+    def close(self):
+        """Release a memory-mapped MAP file"""
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = None
+
     def parse_header(self) -> Optional[MapFileInfo]:
         """Parse MAP file header"""
         if not self.data or len(self.data) < 90:
@@ -410,19 +655,40 @@ class MapFileParser:
 
     def find_me_markers(self) -> List[int]:
         """Find all **ME marker positions"""
-        if self.me_positions:
-            return self.me_positions
+        while self._me_marker(len(self.me_positions)) != -1:
+            pass
+        return self.me_positions
 
-        positions = []
-        pos = 0
-        while True:
-            pos = self.data.find(self.ME_MARKER, pos)
+    def _me_marker(self, n: int) -> int:
+        """
+        Return the position of the n-th **ME marker (-1 if there is none).
+
+        Markers are discovered on demand by following the next_offset chain in
+        each segment header (+16 from **ME, absolute position of the next
+        marker), so locating a segment only reads the segment headers before it.
+        A link that does not land on a **ME marker falls back to a forward scan,
+        unless the header's segment count says the last segment was reached.
+        """
+        while len(self.me_positions) <= n and not self._me_markers_complete:
+            if not self.me_positions:
+                pos = self.data.find(self.ME_MARKER)
+            else:
+                last = self.me_positions[-1]
+                pos = -1
+                if last + 20 <= len(self.data):
+                    next_offset = struct.unpack_from('<I', self.data, last + 16)[0]
+                    if next_offset > last and self.data[next_offset:next_offset + 8] == self.ME_MARKER:
+                        pos = next_offset
+                if pos == -1:
+                    segment_count = (struct.unpack_from('<H', self.data, 18)[0]
+                                     if len(self.data) >= 20 else 0)
+                    if len(self.me_positions) != segment_count:
+                        pos = self.data.find(self.ME_MARKER, last + 8)
             if pos == -1:
-                break
-            positions.append(pos)
-            pos += 8  # Move past marker
-        self.me_positions = positions
-        return positions
+                self._me_markers_complete = True
+            else:
+                self.me_positions.append(pos)
+        return self.me_positions[n] if n < len(self.me_positions) else -1
 
     def parse_segment_0_lookup_table(self) -> List[Dict[str, int]]:
         """
@@ -436,10 +702,7 @@ class MapFileParser:
         The table is small (one entry per indexed field) and is followed by the
         much larger sections/branch index data.
         """
-        if not self.me_positions:
-            self.find_me_markers()
-
-        if len(self.me_positions) < 2:
+        if self._me_marker(1) == -1:
             return []
 
         seg0_start = self.me_positions[0]
@@ -517,17 +780,35 @@ class MapFileParser:
 
     def parse_segments(self) -> List[MapSegmentInfo]:
         """Parse all binary segments with full metadata"""
-        if not self.me_positions:
-            self.find_me_markers()
-
-        segments = []
+        self.segments = list(self.iter_segments())
+        return self.segments
 
-        for i, me_pos in enumerate(self.me_positions):
-            next_pos = self.me_positions[i + 1] if i + 1 < len(self.me_positions) else len(self.data)
-
-            if me_pos + 48 > len(self.data):
-                continue
+    def iter_segments(self) -> Iterator[MapSegmentInfo]:
+        """
+        Yield segments in file order, materialising each one on first use.
 
+        Unlike parse_segments(), stopping early (e.g. once the wanted field is
+        found) leaves the rest of the file untouched.
+        """
+        n = 0
+        while self._me_marker(n) != -1:
+            segment = self._segment(n)
+            if segment is not None:
+                yield segment
+            n += 1
+
+    def _segment(self, n: int) -> Optional[MapSegmentInfo]:
+        """Parse the segment starting at the n-th **ME marker (cached)"""
+        if n in self._segment_cache:
+            return self._segment_cache[n]
+
+        me_pos = self._me_marker(n)
+        next_pos = self._me_marker(n + 1)
+        if next_pos == -1:
+            next_pos = len(self.data)
+
+        segment = None
+        if me_pos + 48 <= len(self.data):
             # Parse segment header (offset +8 from **ME marker)
             header_off = me_pos + 8
             const = struct.unpack('<I', self.data[header_off:header_off+4])[0]
@@ -537,7 +818,7 @@ class MapFileParser:
             # Parse segment metadata (offset +24 from **ME marker)
             meta_off = me_pos + 24
 
-            if i == 0:
+            if n == 0:
                 # Segment 0 is the lookup/directory - different structure
                 segment = MapSegmentInfo(
                     index=seg_index,
@@ -587,22 +868,36 @@ class MapFileParser:
                     data_offset=data_offset
                 )
 
-            segments.append(segment)
+        self._segment_cache[n] = segment
+        return segment
 
-        self.segments = segments
-        return segments
+    def segment0_page_lookup(self) -> Segment0PageLookup:
+        """
+        Return the Segment 0 u32_join_key → page_number lookup (large MAP files).
+
+        Built on first use and cached on the parser, so repeated u32_index
+        resolutions against the same MAP file share one parse.
+        """
+        if self._segment0_lookup is None:
+            seg0 = next(self.iter_segments(), None)
+            if seg0 is not None:
+                end = min(seg0.offset + seg0.size, len(self.data))
+                self._segment0_lookup = Segment0PageLookup.from_records(
+                    self.data[seg0.data_offset:end])
+            else:
+                self._segment0_lookup = Segment0PageLookup(array('I'), array('I'))
+        return self._segment0_lookup
 
     def find_segment_for_field(self, line_id: int, field_id: int) -> Optional[MapSegmentInfo]:
         """Find the segment that contains index data for a specific field"""
-        if not self.segments:
-            self.parse_segments()
+        segments = self.segments or self.iter_segments()
 
-        for seg in self.segments[1:]:  # Skip segment 0
+        for seg in islice(segments, 1, None):  # Skip segment 0
             if seg.line_id == line_id and seg.field_id == field_id:
                 return seg
         return None
 
-    def read_index_entries(self, segment: MapSegmentInfo, max_entries: int = 0) -> List[IndexEntry]:
+    def read_index_entries(self, segment: MapSegmentInfo, max_entries: int = 0) -> IndexEntrySet:
         """
         Read index entries from a segment.
 
@@ -613,128 +908,205 @@ class MapFileParser:
         Format detection: read a batch of entries and check if all uint16 values
         at the page position are odd. If so, it's the u32_index format.
 
+        Placeholder values (no alphanumeric character in the first 5 characters)
+        are skipped.
+
         Args:
             segment: The segment to read entries from
             max_entries: Maximum entries to read (0 = all entries in segment)
+
+        Returns:
+            IndexEntrySet (columnar; iterating it yields IndexEntry objects)
         """
         if segment.field_width == 0 or segment.field_width > 100:
-            return []  # Invalid or non-text segment
+            return IndexEntrySet(segment.field_width)  # Invalid or non-text segment
 
-        entries = []
-        entry_size = 7 + segment.field_width
+        width = segment.field_width
+        entry_size = 7 + width
         offset = segment.data_offset
         end_boundary = min(segment.offset + segment.size, len(self.data))
 
         # Calculate max possible entries in this segment
         available_bytes = end_boundary - offset
-        max_possible = available_bytes // entry_size if entry_size > 0 else 0
+        max_possible = max(available_bytes, 0) // entry_size
 
         if max_entries > 0:
             limit = min(max_entries, max_possible)
         else:
             limit = max_possible
 
-        # First pass: read raw entries to detect format
-        raw_entries = []
-        probe_offset = offset
-        probe_count = min(100, limit)  # Sample first 100 entries for format detection
+        # Valid entries are the leading run whose 2-byte length == field_width
+        raw = self.data[offset:offset + limit * entry_size]
+        length_lo, length_hi = raw[0::entry_size], raw[1::entry_size]
+        count = min(len(length_lo) - len(length_lo.lstrip(bytes([width]))),
+                    len(length_hi) - len(length_hi.lstrip(b'\x00')))
+        if count == 0:
+            return IndexEntrySet(width)
+        raw = raw[:count * entry_size]
 
-        for _ in range(probe_count):
-            if probe_offset + entry_size > end_boundary:
-                break
+        # Detect format: check if uint16 at trailing[0:2] are ALL odd
+        # Small files have page numbers that are typically small and can be even.
+        # Large files have u32 values where the low uint16 is always odd.
+        # If ALL sampled uint16 values are odd AND we have a meaningful sample
+        # (first 100 entries), this is the u32_index format.
+        sample = raw[2 + width:min(count, 100) * entry_size:entry_size]
+        is_u32_format = len(sample) >= 3 and all(b & 1 for b in sample)
+
+        return IndexEntrySet.from_entries(raw, width, is_u32_format).without_placeholders()
 
-            length = struct.unpack('<H', self.data[probe_offset:probe_offset+2])[0]
-            if length != segment.field_width:
-                break  # End of valid entries
+    # ------------------------------------------------------------------
+    # Sorted-entry search (bisect on raw bytes)
+    # ------------------------------------------------------------------
 
-            text_start = probe_offset + 2
-            text_end = text_start + segment.field_width
-            trailing_start = text_end
-            trailing_end = trailing_start + 5  # 5 bytes after text
+    def _entry_layout(self, segment: MapSegmentInfo) -> Tuple[int, int, bool]:
+        """
+        Return (entry_size, valid_entry_count, is_u32_format) for a segment.
 
-            try:
-                value = self.data[text_start:text_end].decode('ascii', errors='replace').strip()
-            except Exception:
-                value = ''
+        Valid entries are the contiguous run from data_offset whose 2-byte
+        length equals field_width; its end is found by bisection. The entry
+        format is detected from the first 100 entries, as in read_index_entries.
+        """
+        layout = self._entry_layouts.get(segment.offset)
+        if layout is not None:
+            return layout
 
-            trailing = self.data[trailing_start:trailing_end]
-            raw_entries.append((value, length, trailing, probe_offset))
-            probe_offset += entry_size
+        width = segment.field_width
+        entry_size = 7 + width
+        end_boundary = min(segment.offset + segment.size, len(self.data))
+        max_possible = max(end_boundary - segment.data_offset, 0) // entry_size
 
-        if not raw_entries:
-            return []
+        def is_valid(i: int) -> bool:
+            pos = segment.data_offset + i * entry_size
+            return struct.unpack_from('<H', self.data, pos)[0] == width
 
-        # Detect format: check if uint16 at trailing[0:2] are ALL odd
-        # Small files have page numbers that are typically small and can be even.
-        # Large files have u32 values where the low uint16 is always odd.
+        lo, hi = 0, max_possible
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if is_valid(mid):
+                lo = mid + 1
+            else:
+                hi = mid
+        count = lo
+
+        # Large files store a u32 line index whose low uint16 is always odd
+        sample = min(100, count)
         odd_count = 0
-        for _, _, trailing, _ in raw_entries:
-            if len(trailing) >= 2:
-                u16 = struct.unpack('<H', trailing[0:2])[0]
-                if u16 % 2 == 1:
-                    odd_count += 1
-
-        # If ALL sampled uint16 values are odd AND we have a meaningful sample,
-        # this is the u32_index format
-        is_u32_format = (odd_count == len(raw_entries) and len(raw_entries) >= 3)
-
-        # Now read all entries with the detected format
-        read_offset = offset
-        for i in range(limit):
-            if read_offset + entry_size > end_boundary:
-                break
+        for i in range(sample):
+            pos = segment.data_offset + i * entry_size + 2 + width
+            if struct.unpack_from('<H', self.data, pos)[0] % 2 == 1:
+                odd_count += 1
+        is_u32_format = odd_count == sample and sample >= 3
+
+        layout = (entry_size, count, is_u32_format)
+        self._entry_layouts[segment.offset] = layout
+        return layout
+
+    def _entry_value(self, segment: MapSegmentInfo, entry_size: int, i: int) -> bytes:
+        """Raw (space-padded) value bytes of entry i."""
+        pos = segment.data_offset + i * entry_size + 2
+        return self.data[pos:pos + segment.field_width]
+
+    def _decode_entry(self, segment: MapSegmentInfo, entry_size: int, i: int,
+                      is_u32_format: bool) -> IndexEntry:
+        """Decode entry i into an IndexEntry."""
+        pos = segment.data_offset + i * entry_size
+        text_end = pos + 2 + segment.field_width
+        value = self.data[pos + 2:text_end].decode('ascii', errors='replace').strip()
+        trailing = self.data[text_end:text_end + 5]
+        if is_u32_format:
+            return IndexEntry(
+                value=value,
+                page_number=0,  # Cannot resolve without spool file
+                raw_length=segment.field_width,
+                raw_trailing=trailing,
+                u32_index=struct.unpack('<I', trailing[0:4])[0],
+                entry_format='u32_index'
+            )
+        return IndexEntry(
+            value=value,
+            page_number=struct.unpack('<H', trailing[0:2])[0],
+            raw_length=segment.field_width,
+            raw_trailing=trailing,
+            u32_index=0,
+            entry_format='page'
+        )
 
-            length = struct.unpack('<H', self.data[read_offset:read_offset+2])[0]
-            if length != segment.field_width:
-                break  # End of valid entries
-
-            text_start = read_offset + 2
-            text_end = text_start + segment.field_width
-            trailing_start = text_end
-
-            try:
-                value = self.data[text_start:text_end].decode('ascii', errors='replace').strip()
-            except Exception:
-                value = ''
-
-            trailing = self.data[trailing_start:trailing_start+5]
-
-            if not value or not any(c.isalnum() for c in value[:5]):
-                read_offset += entry_size
-                continue
-
-            if is_u32_format:
-                # Large file format: [u32_index:4][last_byte:1]
-                u32_val = struct.unpack('<I', trailing[0:4])[0]
-                last_byte = trailing[4] if len(trailing) >= 5 else 0
-                entries.append(IndexEntry(
-                    value=value,
-                    page_number=0,  # Cannot resolve without spool file
-                    raw_length=length,
-                    raw_trailing=trailing,
-                    u32_index=u32_val,
-                    entry_format='u32_index'
-                ))
+    def find_entry_range(self, segment: MapSegmentInfo, search_value: str,
+                         prefix_match: bool = True) -> Tuple[int, int]:
+        """
+        Locate matching entries in a segment without decoding any entry.
+
+        Entries are sorted by value within a segment, so the matches form one
+        contiguous run, found by bisecting on the raw value bytes.
+
+        Args:
+            segment: Segment to search
+            search_value: Value to find (surrounding whitespace is ignored)
+            prefix_match: Match values starting with search_value; otherwise
+                          the (space-padded) value must equal search_value
+
+        Returns:
+            (first, end) entry indices of the matches (first == end if none)
+        """
+        if segment.field_width == 0 or segment.field_width > 100:
+            return 0, 0
+        entry_size, count, _ = self._entry_layout(segment)
+        key = self._search_key(segment, search_value, prefix_match)
+        return self._bisect_range(segment, entry_size, count, key)
+
+    @staticmethod
+    def _search_key(segment: MapSegmentInfo, search_value: str, prefix_match: bool) -> bytes:
+        """Raw bytes an entry value is compared with (padded for exact matches)."""
+        key = search_value.strip().encode('ascii', errors='replace')
+        if prefix_match:
+            return key[:segment.field_width]
+        return key.ljust(segment.field_width)[:segment.field_width]
+
+    def _bisect_range(self, segment: MapSegmentInfo, entry_size: int, count: int,
+                      key: bytes, lo: int = 0) -> Tuple[int, int]:
+        """(first, end) indices of the entries whose value starts with key, from lo."""
+        n = len(key)
+        hi = count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry_value(segment, entry_size, mid)[:n] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+
+        hi = count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry_value(segment, entry_size, mid)[:n] <= key:
+                lo = mid + 1
             else:
-                # Small file format: [page:2][flags:3]
-                page = struct.unpack('<H', trailing[0:2])[0]
-                entries.append(IndexEntry(
-                    value=value,
-                    page_number=page,
-                    raw_length=length,
-                    raw_trailing=trailing,
-                    u32_index=0,
-                    entry_format='page'
-                ))
-
-            read_offset += entry_size
+                hi = mid
+        return first, lo
 
-        return entries
+    def search_segment(self, segment: MapSegmentInfo, search_value: str,
+                       prefix_match: bool = True) -> List[IndexEntry]:
+        """
+        Binary search a segment for a value; O(log n) in the segment size.
+
+        Only the matching entries are decoded (see find_entry_range).
+
+        Returns: List of matching IndexEntry objects, in index order
+        """
+        first, end = self.find_entry_range(segment, search_value, prefix_match)
+        if first == end:
+            return []
+        entry_size, _, is_u32_format = self._entry_layout(segment)
+        return [self._decode_entry(segment, entry_size, i, is_u32_format)
+                for i in range(first, end)]
 
     def search_index(self, search_value: str, line_id: int, field_id: int) -> List[IndexEntry]:
         """
         Search for a value in the MAP file index.
 
+        Matches indexed values equal to or starting with search_value, using a
+        binary search over the field's sorted segment (see search_segment).
+
         Args:
             search_value: Value to search for
             line_id: LINE_ID from FIELD table
@@ -746,24 +1118,84 @@ class MapFileParser:
         if not segment:
             return []
 
-        entries = self.read_index_entries(segment)
-        matches = []
+        # Skip placeholder values, as read_index_entries does
+        return [entry for entry in self.search_segment(segment, search_value)
+                if entry.value and any(c.isalnum() for c in entry.value[:5])]
 
-        for entry in entries:
-            if entry.value == search_value or entry.value.startswith(search_value):
-                matches.append(entry)
+    def search_many(self, values: List[str], line_id: int, field_id: int,
+                    prefix_match: bool = False) -> Dict[str, List[IndexEntry]]:
+        """
+        Look up many values in one field's index at once.
+
+        The distinct search keys are sorted and merge-joined against the
+        segment's sorted entries in one forward sweep, O(n + m) for n entries
+        and m values, instead of one binary search per value. When the query
+        set is small next to the segment (or for prefix matches, which may
+        overlap), each key is bisected instead, starting where the previous
+        key's matches began.
 
-        return matches
+        Args:
+            values: Values to search for
+            line_id: LINE_ID from FIELD table
+            field_id: FIELD_ID from FIELD table
+            prefix_match: Match values starting with each search value
+                          (default: exact match)
 
-    def get_all_indexed_values(self, line_id: int, field_id: int) -> List[IndexEntry]:
+        Returns: Dict mapping every search value to its matching IndexEntry
+                 objects (empty list if not found), ordered by search value
+                 (surrounding whitespace ignored)
+        """
+        segment = self.find_segment_for_field(line_id, field_id)
+        if not segment or segment.field_width == 0 or segment.field_width > 100:
+            return {v: [] for v in sorted(values)}
+
+        entry_size, count, is_u32_format = self._entry_layout(segment)
+        queries: Dict[bytes, List[str]] = {}
+        for v in values:
+            queries.setdefault(self._search_key(segment, v, prefix_match), []).append(v)
+        keys = sorted(queries)
+
+        ranges: Dict[bytes, Tuple[int, int]] = {}
+        if prefix_match or len(keys) * max(count.bit_length(), 1) < count:
+            lo = 0
+            for key in keys:
+                ranges[key] = self._bisect_range(segment, entry_size, count, key, lo)
+                lo = ranges[key][0]
+        else:
+            data = self.data
+            width = segment.field_width
+            pos = segment.data_offset + 2
+            end_pos = pos + count * entry_size
+            for key in keys:
+                while pos < end_pos and data[pos:pos + width] < key:
+                    pos += entry_size
+                first = pos
+                while pos < end_pos and data[pos:pos + width] == key:
+                    pos += entry_size
+                start = (first - segment.data_offset - 2) // entry_size
+                ranges[key] = (start, start + (pos - first) // entry_size)
+
+        results: Dict[str, List[IndexEntry]] = {}
+        for key in keys:
+            first, end = ranges[key]
+            entries = [self._decode_entry(segment, entry_size, i, is_u32_format)
+                       for i in range(first, end)]
+            # Skip placeholder values, as read_index_entries does
+            entries = [e for e in entries
+                       if e.value and any(c.isalnum() for c in e.value[:5])]
+            for v in sorted(queries[key]):
+                results[v] = entries
+        return results
+
+    def get_all_indexed_values(self, line_id: int, field_id: int) -> IndexEntrySet:
         """
         Get all indexed values for a field.
 
-        Returns: List of IndexEntry objects
+        Returns: IndexEntrySet (empty if the field has no segment)
         """
         segment = self.find_segment_for_field(line_id, field_id)
         if not segment:
-            return []
+            return IndexEntrySet(0)
 
         return self.read_index_entries(segment)
 
@@ -773,11 +1205,7 @@ class MapFileParser:
 
         Returns: List of (value, count) tuples sorted by value
         """
-        entries = self.get_all_indexed_values(line_id, field_id)
-        counts: Dict[str, int] = {}
-        for entry in entries:
-            counts[entry.value] = counts.get(entry.value, 0) + 1
-        return sorted(counts.items())
+        return self.get_all_indexed_values(line_id, field_id).unique_counts()
 
     # Legacy method for backwards compatibility
     def parse_segments_legacy(self) -> List[Dict[str, Any]]:
@@ -1056,10 +1484,7 @@ class IntelliSTORViewer:
 
                         if fmt == 'u32_index':
                             # Show unique values with counts
-                            counts: Dict[str, int] = {}
-                            for e in total:
-                                counts[e.value] = counts.get(e.value, 0) + 1
-                            unique = sorted(counts.items())
+                            unique = total.unique_counts()
                             print(f"  Unique values: {len(unique)}")
                             for val, cnt in unique[:20]:
                                 print(f"  '{val}' × {cnt}")
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+map_value_index.py - Cross-instance inverted index of MAP file field values
+
+Finding every report instance in which a value (e.g. an ACCOUNT_NO) appears
+otherwise means loading and searching each MAP file in turn. This tool walks a
+MAP directory once and records every indexed value in a local SQLite database:
+
+    (LINE_ID, FIELD_ID, value) -> (MAP file, pages)
+
+The index is refreshed incrementally: MAP files whose size and mtime are
+unchanged since the last build are skipped, changed files are re-read, and
+files that disappeared from the directory are dropped. The report instance
+belonging to a MAP file is resolved from the database (SST_STORAGE → MAPFILE)
+at query time, e.g. by intellistor_extractor.py --all-instances.
+
+Index Layout (SQLite):
+  map_file(map_file_id, filename, size, mtime_ns)
+  map_value(value, line_id, field_id, map_file_id, pages)
+      value  - stripped field value, as matched by MapFileParser.search_index
+      pages  - comma-separated page numbers (u32_index entries are resolved
+               through Segment 0; unresolvable entries contribute no page)
+
+Usage:
+    # Build or refresh the index for a MAP directory
+    python map_value_index.py --map-dir /Volumes/X9Pro/OCBC/250_MapFiles --index map_values.sqlite
+
+    # Look up a value (exact, or --prefix)
+    python map_value_index.py --index map_values.sqlite --line-id 5 --field-id 3 \\
+        --value EP24123109039499
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, List, Optional, Set, Tuple
+
+from intellistor_viewer import MapFileParser
+
+
+INDEX_SCHEMA_VERSION = 1
+COMMIT_INTERVAL = 50      # MAP files per transaction
+PROGRESS_INTERVAL = 500   # Print progress every N files
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS map_file (
+    map_file_id INTEGER PRIMARY KEY,
+    filename    TEXT NOT NULL UNIQUE,
+    size        INTEGER NOT NULL,
+    mtime_ns    INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS map_value (
+    value       TEXT NOT NULL,
+    line_id     INTEGER NOT NULL,
+    field_id    INTEGER NOT NULL,
+    map_file_id INTEGER NOT NULL,
+    pages       TEXT NOT NULL,
+    PRIMARY KEY (value, line_id, field_id, map_file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_map_value_file ON map_value (map_file_id);
+"""
+
+
+# ============================================================================
+# Index Database
+# ============================================================================
+
+def open_index(index_path: str) -> sqlite3.Connection:
+    """Open (creating if needed) a MAP value index database."""
+    conn = sqlite3.connect(index_path)
+    version = conn.execute('PRAGMA user_version').fetchone()[0]
+    if version not in (0, INDEX_SCHEMA_VERSION):
+        conn.close()
+        raise RuntimeError(f"Unsupported MAP value index version {version}: {index_path}")
+    conn.executescript(_SCHEMA)
+    conn.execute(f'PRAGMA user_version = {INDEX_SCHEMA_VERSION}')
+    conn.commit()
+    return conn
+
+
+def indexed_files(conn: sqlite3.Connection) -> Dict[str, Tuple[int, int, int]]:
+    """Return {filename: (map_file_id, size, mtime_ns)} for all indexed MAP files."""
+    return {filename: (map_file_id, size, mtime_ns)
+            for map_file_id, filename, size, mtime_ns
+            in conn.execute('SELECT map_file_id, filename, size, mtime_ns FROM map_file')}
+
+
+def is_current(entry: Optional[Tuple[int, int, int]], st: os.stat_result) -> bool:
+    """True if an indexed_files() entry still matches the MAP file's size and mtime."""
+    return entry is not None and entry[1] == st.st_size and entry[2] == st.st_mtime_ns
+
+
+def lookup(conn: sqlite3.Connection, value: str, line_id: int, field_id: int,
+           prefix: bool = False) -> List[Tuple[str, str, List[int]]]:
+    """
+    Look up a field value across all indexed MAP files.
+
+    Args:
+        conn: Index connection from open_index()
+        value: Value to find (surrounding whitespace is ignored)
+        line_id: LINE_ID of the indexed field
+        field_id: FIELD_ID of the indexed field
+        prefix: If True, match all values starting with value
+
+    Returns:
+        List of (map_filename, value, pages) sorted by filename, then value
+    """
+    value = value.strip()
+    sql = """
+        SELECT f.filename, v.value, v.pages
+        FROM map_value v JOIN map_file f ON f.map_file_id = v.map_file_id
+        WHERE v.line_id = ? AND v.field_id = ? AND {}
+        ORDER BY f.filename, v.value
+    """
+    if prefix and value:
+        # Range scan on the primary key: value <= v < value with last char + 1
+        upper = value[:-1] + chr(ord(value[-1]) + 1)
+        rows = conn.execute(sql.format('v.value >= ? AND v.value < ?'),
+                            (line_id, field_id, value, upper))
+    elif prefix:
+        rows = conn.execute(sql.format('1'), (line_id, field_id))
+    else:
+        rows = conn.execute(sql.format('v.value = ?'), (line_id, field_id, value))
+    return [(filename, v, [int(p) for p in pages.split(',') if p])
+            for filename, v, pages in rows]
+
+
+# ============================================================================
+# Building
+# ============================================================================
+
+def read_map_values(map_path: str) -> Optional[List[Tuple[str, int, int, str]]]:
+    """
+    Read all indexed values of one MAP file.
+
+    Returns:
+        List of (value, line_id, field_id, pages) rows, or None if the file
+        could not be loaded
+    """
+    parser = MapFileParser(map_path)
+    if not parser.load(use_mmap=True):
+        return None
+    try:
+        # Equal values are adjacent within a segment (entries are stored sorted)
+        merged: Dict[Tuple[str, int, int], Set[int]] = {}
+        for segment in parser.parse_segments()[1:]:  # Skip segment 0
+            entries = parser.read_index_entries(segment)
+            if not entries:
+                continue
+            if entries.entry_format == 'u32_index':
+                seg0_lookup = parser.segment0_page_lookup()
+                pages = [seg0_lookup.get(ref, 0) for ref in entries.refs]
+            else:
+                pages = entries.refs
+
+            for value, group in groupby(zip(entries.values(), pages), key=itemgetter(0)):
+                page_set = merged.setdefault((value, segment.line_id, segment.field_id), set())
+                page_set.update(page for _, page in group if page > 0)
+
+        return [(value, line_id, field_id, ','.join(map(str, sorted(page_set))))
+                for (value, line_id, field_id), page_set in merged.items()]
+    finally:
+        parser.close()
+
+
+def build_index(map_dir: str, index_path: str, prune: bool = True,
+                limit: int = 0) -> Dict[str, int]:
+    """
+    Build or refresh the MAP value index for a directory of MAP files.
+
+    Args:
+        map_dir: Directory containing .MAP files
+        index_path: SQLite index file (created if missing)
+        prune: Drop index entries for MAP files no longer in map_dir
+        limit: Process at most this many new/changed files (0 = no limit)
+
+    Returns:
+        Stats dict (files, unchanged, indexed, errors, removed, values)
+    """
+    stats = {'files': 0, 'unchanged': 0, 'indexed': 0, 'errors': 0, 'removed': 0, 'values': 0}
+
+    conn = open_index(index_path)
+    try:
+        known = indexed_files(conn)
+        names = sorted(n for n in os.listdir(map_dir) if n.upper().endswith('.MAP'))
+        stats['files'] = len(names)
+
+        if prune:
+            present = set(names)
+            for filename, (map_file_id, _, _) in known.items():
+                if filename not in present:
+                    conn.execute('DELETE FROM map_value WHERE map_file_id = ?', (map_file_id,))
+                    conn.execute('DELETE FROM map_file WHERE map_file_id = ?', (map_file_id,))
+                    stats['removed'] += 1
+            conn.commit()
+
+        start_time = time.time()
+        pending = 0
+        for i, filename in enumerate(names):
+            if limit and stats['indexed'] + stats['errors'] >= limit:
+                break
+            path = os.path.join(map_dir, filename)
+            try:
+                st = os.stat(path)
+            except OSError as e:
+                print(f"  WARNING: Cannot stat {path}: {e}", file=sys.stderr)
+                stats['errors'] += 1
+                continue
+            entry = known.get(filename)
+            if is_current(entry, st):
+                stats['unchanged'] += 1
+                continue
+
+            try:
+                rows = read_map_values(path)
+            except Exception as e:
+                print(f"  WARNING: Failed to index {filename}: {e}", file=sys.stderr)
+                rows = None
+            if rows is None:
+                stats['errors'] += 1
+                continue
+
+            if entry is not None:
+                conn.execute('DELETE FROM map_value WHERE map_file_id = ?', (entry[0],))
+                conn.execute('UPDATE map_file SET size = ?, mtime_ns = ? WHERE map_file_id = ?',
+                             (st.st_size, st.st_mtime_ns, entry[0]))
+                map_file_id = entry[0]
+            else:
+                map_file_id = conn.execute(
+                    'INSERT INTO map_file (filename, size, mtime_ns) VALUES (?, ?, ?)',
+                    (filename, st.st_size, st.st_mtime_ns)).lastrowid
+            conn.executemany(
+                'INSERT INTO map_value (value, line_id, field_id, map_file_id, pages) '
+                'VALUES (?, ?, ?, ?, ?)',
+                ((value, line_id, field_id, map_file_id, pages)
+                 for value, line_id, field_id, pages in rows))
+            stats['indexed'] += 1
+            stats['values'] += len(rows)
+
+            pending += 1
+            if pending >= COMMIT_INTERVAL:
+                conn.commit()
+                pending = 0
+
+            if stats['indexed'] % PROGRESS_INTERVAL == 0:
+                elapsed = time.time() - start_time
+                print(f"  Progress: {i + 1:,}/{len(names):,} files scanned, "
+                      f"{stats['indexed']:,} indexed ({elapsed:.1f}s)")
+
+        conn.commit()
+    finally:
+        conn.close()
+
+    return stats
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Build and query a cross-instance index of MAP file field values',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Build or refresh the index (only new or changed MAP files are read)
+  %(prog)s --map-dir /Volumes/X9Pro/OCBC/250_MapFiles --index map_values.sqlite
+
+  # Find every MAP file containing a value
+  %(prog)s --index map_values.sqlite --line-id 5 --field-id 3 --value EP24123109039499
+
+  # Search across instances by field name (resolves instances from the database)
+  python intellistor_extractor.py --report DDU017P --field ACCOUNT_NO \\
+      --value "200-044295-001" --all-instances --value-index map_values.sqlite
+        """
+    )
+    parser.add_argument('--index', required=True, help='SQLite index file')
+    parser.add_argument('--map-dir', help='MAP files directory to index')
+    parser.add_argument('--no-prune', action='store_true',
+                        help='Keep entries for MAP files no longer in --map-dir')
+    parser.add_argument('--limit', type=int, default=0,
+                        help='Index at most N new/changed MAP files (default: all)')
+    parser.add_argument('--line-id', type=int, help='LINE_ID of the field to look up')
+    parser.add_argument('--field-id', type=int, help='FIELD_ID of the field to look up')
+    parser.add_argument('--value', help='Value to look up')
+    parser.add_argument('--prefix', action='store_true', help='Prefix match for --value')
+
+    args = parser.parse_args()
+
+    if args.map_dir:
+        if not os.path.isdir(args.map_dir):
+            print(f"ERROR: MAP directory not found: {args.map_dir}", file=sys.stderr)
+            sys.exit(1)
+        t0 = time.time()
+        stats = build_index(args.map_dir, args.index, prune=not args.no_prune, limit=args.limit)
+        print(f"MAP files: {stats['files']:,} (indexed {stats['indexed']:,}, "
+              f"unchanged {stats['unchanged']:,}, errors {stats['errors']:,}, "
+              f"removed {stats['removed']:,})")
+        print(f"Values written: {stats['values']:,} in {time.time() - t0:.1f}s")
+
+    if args.value is not None:
+        if args.line_id is None or args.field_id is None:
+            print("ERROR: --value requires --line-id and --field-id", file=sys.stderr)
+            sys.exit(1)
+        if not os.path.exists(args.index):
+            print(f"ERROR: Index not found: {args.index}", file=sys.stderr)
+            sys.exit(1)
+        t0 = time.time()
+        conn = open_index(args.index)
+        try:
+            hits = lookup(conn, args.value, args.line_id, args.field_id, args.prefix)
+        finally:
+            conn.close()
+        for filename, value, pages in hits:
+            print(f"  {filename:<20} {value:<30} pages: {','.join(map(str, pages)) or '-'}")
+        print(f"{len(hits)} match(es) in {len({h[0] for h in hits})} MAP file(s), "
+              f"{(time.time() - t0) * 1000:.1f}ms")
+    elif not args.map_dir:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+rpt_index_cache.py - Persistent page/section index for IntelliSTOR .RPT files
+
+Locating and parsing the RPT trailer (SECTIONHDR, PAGETBLHDR, BPAGETBLHDR) is
+repeated every time a tool opens an RPT file. This module captures the result in
+a compact binary index that can be cached on disk and reused as long as the RPT
+file is unchanged (same path, size and mtime). A cached lookup never touches the
+RPT trailer, so fetching a single page costs one seek plus one inflate.
+
+Cache locations (opt-in, chosen by the caller):
+  - Sidecar:     cache_dir='' -> {rpt_stem}.rptidx next to the RPT file
+  - Shared dir:  cache_dir=DIR -> DIR/{rpt_stem}_{path_hash}.rptidx
+
+.rptidx Layout (little-endian):
+  [magic:8]              - b'RPTIDX01'
+  [rpt_size:8]           - RPT file size in bytes
+  [rpt_mtime_ns:8]       - RPT file modification time (ns)
+  [path_len:2]           - Length of the absolute RPT path (UTF-8)
+  [sectionhdr_pos:8]     - Absolute SECTIONHDR marker position (-1 if absent)
+  [pagetblhdr_pos:8]     - Absolute PAGETBLHDR marker position (-1 if absent)
+  [bpagetblhdr_pos:8]    - Absolute BPAGETBLHDR marker position (-1 if absent)
+  [header_len:4]         - Length of the raw header block (first 0x200 bytes)
+  [sections_len:4]       - Length of the section triplets (12 bytes each)
+  [page_table_len:4]     - Length of the raw PAGETBLHDR entries (24 bytes each)
+  [binary_table_len:4]   - Length of the raw BPAGETBLHDR entries (16 bytes each)
+  [path][header][sections][page_table][binary_table]
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+from rpt_section_reader import (
+    parse_rpt_header, locate_trailer, read_section_triplets,
+    RptHeader, SectionEntry, TRAILER_MARKER_SKIP
+)
+
+
+RPTIDX_MAGIC = b'RPTIDX01'
+RPTIDX_EXT = '.rptidx'
+_RPTIDX_HEADER = struct.Struct('<8sQqHqqqIIII')
+
+PAGE_ENTRY_SIZE = 24     # PAGETBLHDR entry
+BINARY_ENTRY_SIZE = 16   # BPAGETBLHDR entry
+
+
+@dataclass
+class RptIndex:
+    """Located and extracted RPT trailer tables for one RPT file."""
+    header: RptHeader
+    header_bytes: bytes          # First 0x200 bytes of the RPT file
+    sections: List[SectionEntry]
+    page_table: bytes            # Raw PAGETBLHDR entries (24 bytes each)
+    binary_table: bytes          # Raw BPAGETBLHDR entries (16 bytes each)
+    sectionhdr_pos: int = -1
+    pagetblhdr_pos: int = -1
+    bpagetblhdr_pos: int = -1
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_table) // PAGE_ENTRY_SIZE
+
+    @property
+    def binary_count(self) -> int:
+        return len(self.binary_table) // BINARY_ENTRY_SIZE
+
+
+# ============================================================================
+# Building
+# ============================================================================
+
+def build_index(buf) -> Optional[RptIndex]:
+    """
+    Build an RptIndex from a whole-file buffer.
+
+    Args:
+        buf: Contents of the RPT file (mmap or bytes)
+
+    Returns:
+        RptIndex, or None if the buffer is not a valid RPT file
+    """
+    header_bytes = bytes(buf[:0x200])
+    header = parse_rpt_header(header_bytes)
+    if header is None:
+        return None
+
+    sectionhdr_pos, pagetblhdr_pos, bpagetblhdr_pos = locate_trailer(buf, header)
+
+    sections = []
+    if sectionhdr_pos != -1:
+        sections = read_section_triplets(buf, sectionhdr_pos, header.section_count)
+
+    page_table = b''
+    if pagetblhdr_pos != -1:
+        start = pagetblhdr_pos + TRAILER_MARKER_SKIP
+        count = min(header.page_count, (len(buf) - start) // PAGE_ENTRY_SIZE)
+        page_table = bytes(buf[start:start + max(count, 0) * PAGE_ENTRY_SIZE])
+
+    binary_table = b''
+    if bpagetblhdr_pos != -1:
+        start = bpagetblhdr_pos + TRAILER_MARKER_SKIP
+        count = min(header.binary_object_count, (len(buf) - start) // BINARY_ENTRY_SIZE)
+        binary_table = bytes(buf[start:start + max(count, 0) * BINARY_ENTRY_SIZE])
+
+    return RptIndex(
+        header=header,
+        header_bytes=header_bytes,
+        sections=sections,
+        page_table=page_table,
+        binary_table=binary_table,
+        sectionhdr_pos=sectionhdr_pos,
+        pagetblhdr_pos=pagetblhdr_pos,
+        bpagetblhdr_pos=bpagetblhdr_pos
+    )
+
+
+# ============================================================================
+# Cache Files
+# ============================================================================
+
+def index_path(rpt_path: str, cache_dir: str = '') -> str:
+    """
+    Return the .rptidx path for an RPT file.
+
+    Args:
+        rpt_path: Path to the .RPT file
+        cache_dir: Shared cache directory, or '' for a sidecar next to the RPT file
+    """
+    stem = os.path.splitext(os.path.basename(rpt_path))[0]
+    if not cache_dir:
+        return os.path.join(os.path.dirname(rpt_path), stem + RPTIDX_EXT)
+    # Same-named RPT files from different folders get distinct entries
+    path_hash = hashlib.sha1(os.path.abspath(rpt_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f'{stem}_{path_hash}{RPTIDX_EXT}')
+
+
+def load_index(rpt_path: str, cache_dir: str = '') -> Optional[RptIndex]:
+    """
+    Load a cached RptIndex if it is still valid for the RPT file.
+
+    The cache entry is valid when it was written for the same absolute path,
+    file size and mtime.
+
+    Returns:
+        RptIndex, or None on a cache miss (missing, stale or unreadable entry)
+    """
+    try:
+        st = os.stat(rpt_path)
+        with open(index_path(rpt_path, cache_dir), 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if len(data) < _RPTIDX_HEADER.size:
+        return None
+    (magic, rpt_size, rpt_mtime_ns, path_len,
+     sectionhdr_pos, pagetblhdr_pos, bpagetblhdr_pos,
+     header_len, sections_len, page_table_len, binary_table_len) = _RPTIDX_HEADER.unpack_from(data)
+    if magic != RPTIDX_MAGIC or rpt_size != st.st_size or rpt_mtime_ns != st.st_mtime_ns:
+        return None
+    if _RPTIDX_HEADER.size + path_len + header_len + sections_len + page_table_len + binary_table_len != len(data):
+        return None
+    if sections_len % 12 or page_table_len % PAGE_ENTRY_SIZE or binary_table_len % BINARY_ENTRY_SIZE:
+        return None
+
+    pos = _RPTIDX_HEADER.size
+    stored_path = data[pos:pos + path_len].decode('utf-8', errors='replace')
+    if stored_path != os.path.abspath(rpt_path):
+        return None
+    pos += path_len
+
+    header_bytes = data[pos:pos + header_len]
+    pos += header_len
+    header = parse_rpt_header(header_bytes)
+    if header is None:
+        return None
+
+    sections = [SectionEntry(section_id=sid, start_page=sp, page_count=pc)
+                for sid, sp, pc in struct.iter_unpack('<III', data[pos:pos + sections_len])]
+    pos += sections_len
+    page_table = data[pos:pos + page_table_len]
+    pos += page_table_len
+    binary_table = data[pos:pos + binary_table_len]
+
+    return RptIndex(
+        header=header,
+        header_bytes=header_bytes,
+        sections=sections,
+        page_table=page_table,
+        binary_table=binary_table,
+        sectionhdr_pos=sectionhdr_pos,
+        pagetblhdr_pos=pagetblhdr_pos,
+        bpagetblhdr_pos=bpagetblhdr_pos
+    )
+
+
+def save_index(rpt_path: str, index: RptIndex, cache_dir: str = '') -> bool:
+    """
+    Write an RptIndex to the cache (atomically, via a temporary file).
+
+    Returns:
+        True if written, False if the cache location is not writable
+    """
+    try:
+        st = os.stat(rpt_path)
+        path_bytes = os.path.abspath(rpt_path).encode('utf-8')
+        sections_blob = b''.join(struct.pack('<III', s.section_id, s.start_page, s.page_count)
+                                 for s in index.sections)
+        head = _RPTIDX_HEADER.pack(
+            RPTIDX_MAGIC, st.st_size, st.st_mtime_ns, len(path_bytes),
+            index.sectionhdr_pos, index.pagetblhdr_pos, index.bpagetblhdr_pos,
+            len(index.header_bytes), len(sections_blob),
+            len(index.page_table), len(index.binary_table))
+
+        out_path = index_path(rpt_path, cache_dir)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f'{out_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            for blob in (head, path_bytes, index.header_bytes, sections_blob,
+                         index.page_table, index.binary_table):
+                f.write(blob)
+        os.replace(tmp_path, out_path)
+        return True
+    except OSError as e:
+        print(f"  WARNING: Could not write RPT index cache for {rpt_path}: {e}", file=sys.stderr)
+        return False
+
+
+def get_rpt_index(rpt_path: str, cache_dir: Optional[str] = None) -> Optional[RptIndex]:
+    """
+    Return the RptIndex for an RPT file, using the cache when enabled.
+
+    Args:
+        rpt_path: Path to the .RPT file
+        cache_dir: None = no caching, '' = sidecar .rptidx next to the RPT file,
+                   otherwise a shared cache directory
+
+    Returns:
+        RptIndex, or None if the file is not a valid RPT file
+    """
+    if cache_dir is not None:
+        index = load_index(rpt_path, cache_dir)
+        if index is not None:
+            return index
+
+    if os.path.getsize(rpt_path) == 0:
+        return None
+    with open(rpt_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            index = build_index(mm)
+
+    if index is not None and cache_dir is not None:
+        save_index(rpt_path, index, cache_dir)
+    return index
@@ -18,13 +18,24 @@ RPT File Layout:
   [...]   BPAGETBLHDR   - 16-byte entries per binary object (PDF/AFP, if present)
 """
 
+import mmap
 import struct
 import os
 import sys
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
 
+RPTINSTHDR_OFFSET = 0xF0    # Base offset for Table Directory / page table offsets
+
+SECTIONHDR_MARKER = b'SECTIONHDR'
+PAGETBLHDR_MARKER = b'PAGETBLHDR'
+BPAGETBLHDR_MARKER = b'BPAGETBLHDR'
+TRAILER_MARKER_SKIP = 13    # marker + null padding (10+3 / 11+2 bytes)
+TRAILER_SCAN_WINDOW = 4096  # bytes searched around a Table Directory offset hint
+
+
 @dataclass
 class RptHeader:
     """Parsed RPT file header metadata."""
@@ -36,6 +47,7 @@ class RptHeader:
     section_data_offset: int
     page_table_offset: int
     binary_object_count: int = 0  # Table Directory Row 2 (0x1F4): BPAGETBLHDR entry count
+    binary_table_offset: int = 0  # Table Directory Row 2 (0x1F8): BPAGETBLHDR offset hint
 
 
 @dataclass
@@ -98,13 +110,14 @@ def parse_rpt_header(data: bytes) -> Optional[RptHeader]:
     section_data_offset = 0
     page_table_offset = 0
     binary_object_count = 0
+    binary_table_offset = 0
 
     if len(data) >= 0x1F0:
         page_count = struct.unpack_from('<I', data, 0x1D4)[0]
         section_count = struct.unpack_from('<I', data, 0x1E4)[0]
         # These offsets point to related structures but not directly to SECTIONHDR marker
         # SECTIONHDR is found by scanning from compressed_data_end area
-        page_table_data_offset = struct.unpack_from('<I', data, 0x1D8)[0]
+        page_table_offset = struct.unpack_from('<I', data, 0x1D8)[0]
         compressed_data_end = struct.unpack_from('<I', data, 0x1E8)[0]
         # SECTIONHDR marker is near compressed_data_end (within ~1KB after it)
         section_data_offset = compressed_data_end  # approximate; actual scan in read_sectionhdr
@@ -112,6 +125,7 @@ def parse_rpt_header(data: bytes) -> Optional[RptHeader]:
     # Row 2: binary object count (PDF/AFP embedded documents)
     if len(data) >= 0x200:
         binary_object_count = struct.unpack_from('<I', data, 0x1F4)[0]
+        binary_table_offset = struct.unpack_from('<I', data, 0x1F8)[0]
 
     return RptHeader(
         domain_id=domain_id,
@@ -121,10 +135,114 @@ def parse_rpt_header(data: bytes) -> Optional[RptHeader]:
         section_count=section_count,
         section_data_offset=section_data_offset,
         page_table_offset=page_table_offset,
-        binary_object_count=binary_object_count
+        binary_object_count=binary_object_count,
+        binary_table_offset=binary_table_offset
     )
 
 
+def _is_marker_at(buf, pos: int, marker: bytes) -> bool:
+    if pos < 0 or buf[pos:pos + len(marker)] != marker:
+        return False
+    # 'PAGETBLHDR' is also the tail of 'BPAGETBLHDR'
+    if marker == PAGETBLHDR_MARKER and pos > 0 and buf[pos - 1] == ord('B'):
+        return False
+    return True
+
+
+def _scan_marker(buf, marker: bytes, start: int, end: Optional[int] = None) -> int:
+    end = len(buf) if end is None else min(end, len(buf))
+    pos = buf.find(marker, start, end)
+    while pos != -1 and not _is_marker_at(buf, pos, marker):
+        pos = buf.find(marker, pos + 1, end)
+    return pos
+
+
+def find_trailer_marker(buf, marker: bytes, hint: int, start: int) -> int:
+    """
+    Find a trailer marker, trying the Table Directory offset hint before a full scan.
+
+    Args:
+        buf: Whole-file buffer supporting find() (mmap or bytes)
+        marker: SECTIONHDR_MARKER, PAGETBLHDR_MARKER or BPAGETBLHDR_MARKER
+        hint: Offset from the Table Directory (0 = unknown)
+        start: Lowest position the marker may appear at
+
+    Returns:
+        Absolute position of the marker, or -1 if not found
+    """
+    if hint:
+        # Offsets are relative to RPTINSTHDR in rpt_file_builder output; the
+        # compressed_data_end value is only approximate. Try exact hits first,
+        # then a small window around the hint.
+        for pos in (hint + RPTINSTHDR_OFFSET, hint):
+            if pos >= start and _is_marker_at(buf, pos, marker):
+                return pos
+        pos = _scan_marker(buf, marker, max(start, hint - 16),
+                           hint + RPTINSTHDR_OFFSET + TRAILER_SCAN_WINDOW)
+        if pos != -1:
+            return pos
+    return _scan_marker(buf, marker, start)
+
+
+def locate_trailer(buf, header: RptHeader) -> Tuple[int, int, int]:
+    """
+    Locate SECTIONHDR, PAGETBLHDR and BPAGETBLHDR (in file order).
+
+    Args:
+        buf: Whole-file buffer supporting find() (mmap or bytes)
+        header: Parsed RPT header (Table Directory offsets and counts)
+
+    Returns:
+        Tuple of absolute marker positions (sectionhdr, pagetblhdr, bpagetblhdr),
+        -1 for any structure that was not found
+    """
+    sectionhdr_pos = find_trailer_marker(
+        buf, SECTIONHDR_MARKER, header.section_data_offset, 0x200)
+
+    start = sectionhdr_pos if sectionhdr_pos != -1 else 0x200
+    pagetblhdr_pos = find_trailer_marker(
+        buf, PAGETBLHDR_MARKER, header.page_table_offset, start)
+
+    bpagetblhdr_pos = -1
+    if header.binary_object_count > 0:
+        if pagetblhdr_pos != -1:
+            start = pagetblhdr_pos
+        bpagetblhdr_pos = find_trailer_marker(
+            buf, BPAGETBLHDR_MARKER, header.binary_table_offset, start)
+
+    return sectionhdr_pos, pagetblhdr_pos, bpagetblhdr_pos
+
+
+def read_section_triplets(buf, sectionhdr_pos: int, section_count: int) -> List[SectionEntry]:
+    """
+    Parse the SECTIONHDR triplets following a located SECTIONHDR marker.
+
+    Args:
+        buf: Whole-file buffer supporting find() (mmap or bytes)
+        sectionhdr_pos: Absolute position of the SECTIONHDR marker
+        section_count: Section count from the Table Directory (0 = read up to ENDDATA)
+
+    Returns:
+        List of SectionEntry
+    """
+    sections = []
+    start = sectionhdr_pos + TRAILER_MARKER_SKIP
+    if section_count > 0:
+        end = min(start + section_count * 12, len(buf))
+    else:
+        end = buf.find(b'ENDDATA', start)
+        if end == -1:
+            end = len(buf)
+
+    for offset in range(start, end - 11, 12):
+        sid, sp, pc = struct.unpack_from('<III', buf, offset)
+        if sp >= 1 and pc >= 1:
+            sections.append(SectionEntry(section_id=sid, start_page=sp, page_count=pc))
+        elif sid == 0 and sp == 0 and pc == 0:
+            break  # all-zero triplet = end of valid data
+    return sections
+
+
 def read_sectionhdr(filepath: str) -> Tuple[Optional[RptHeader], List[SectionEntry]]:
     """
     Read SECTIONHDR from an RPT file.
@@ -184,18 +302,19 @@ def read_sectionhdr(filepath: str) -> Tuple[Optional[RptHeader], List[SectionEnt
                     return header, sections
 
         # Strategy 2: Full file scan for SECTIONHDR marker (fallback)
-        f.seek(0)
-        full_data = f.read()
-        marker_pos = full_data.find(b'SECTIONHDR')
-        if marker_pos == -1:
+        # Scan through a read-only mapping so the file is never copied into memory.
+        if file_size == 0:
             return header, []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            marker_pos = mm.find(b'SECTIONHDR')
+            if marker_pos == -1:
+                return header, []
 
-        data_start = marker_pos + 13
-        enddata_pos = full_data.find(b'ENDDATA', data_start)
-        if enddata_pos == -1:
-            section_bytes = full_data[data_start:]
-        else:
-            section_bytes = full_data[data_start:enddata_pos]
+            data_start = marker_pos + 13
+            enddata_pos = mm.find(b'ENDDATA', data_start)
+            if enddata_pos == -1:
+                enddata_pos = file_size
+            section_bytes = mm[data_start:enddata_pos]
 
         num_triplets = len(section_bytes) // 12
         for i in range(num_triplets):
@@ -210,6 +329,52 @@ def read_sectionhdr(filepath: str) -> Tuple[Optional[RptHeader], List[SectionEnt
     return header, sections
 
 
+class SectionIndex:
+    """
+    Interval index over SECTIONHDR triplets.
+
+    Answers both directions without scanning the page table:
+      - section_id -> page span (START_PAGE .. START_PAGE + PAGE_COUNT - 1)
+      - page number -> SECTION_ID (bisection over the sorted start pages)
+
+    When a SECTION_ID occurs more than once, the last triplet wins for
+    section_id lookups (as with the dict lookups this replaces).
+    """
+
+    def __init__(self, sections: List[SectionEntry]):
+        self.sections = sections
+        self._by_id = {s.section_id: s for s in sections}
+        self._ordered = sorted(sections, key=lambda s: s.start_page)
+        self._starts = [s.start_page for s in self._ordered]
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def __contains__(self, section_id: int) -> bool:
+        return section_id in self._by_id
+
+    def get(self, section_id: int) -> Optional[SectionEntry]:
+        """Return the SectionEntry for section_id, or None."""
+        return self._by_id.get(section_id)
+
+    def page_span(self, section_id: int) -> Optional[Tuple[int, int]]:
+        """Return (first_page, last_page) for section_id (1-based, inclusive), or None."""
+        s = self._by_id.get(section_id)
+        if s is None:
+            return None
+        return s.start_page, s.start_page + s.page_count - 1
+
+    def section_for_page(self, page_number: int) -> Optional[int]:
+        """Return the SECTION_ID covering page_number, or None if no section covers it."""
+        i = bisect_right(self._starts, page_number) - 1
+        if i < 0:
+            return None
+        s = self._ordered[i]
+        if page_number < s.start_page + s.page_count:
+            return s.section_id
+        return None
+
+
 def format_segments(sections: List[SectionEntry]) -> str:
     """
     Format section entries as pipe-separated string for CSV output.
@@ -34,10 +34,8 @@ import argparse
 import csv
 import json
 import os
-import struct
 import sys
 import time
-from bisect import bisect_left
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple, Set
 
@@ -102,7 +100,9 @@ def binary_search_entries(
     Binary search for a value in a MAP file segment's sorted entries.
 
     MAP file entries are sorted alphabetically by value within each segment.
-    This performs O(log n) binary search instead of O(n) linear scan.
+    This performs O(log n) binary search instead of O(n) linear scan; the
+    search itself is MapFileParser.search_segment, shared with the viewer
+    and intellistor_extractor.
 
     Args:
         parser: MapFileParser with loaded data
@@ -113,226 +113,13 @@ def binary_search_entries(
     Returns:
         List of matching IndexEntry objects
     """
-    if segment.field_width == 0 or segment.field_width > 100:
-        return []
-
-    entry_size = 7 + segment.field_width
-    end_boundary = min(segment.offset + segment.size, len(parser.data))
-    data_start = segment.data_offset
-    available_bytes = end_boundary - data_start
-    total_entries = available_bytes // entry_size if entry_size > 0 else 0
-
-    if total_entries == 0:
-        return []
-
-    # First detect format by sampling entries
-    is_u32_format = _detect_entry_format(parser, segment, entry_size, data_start,
-                                          end_boundary, min(100, total_entries))
-
-    # Pad search value to field_width for comparison (MAP values are space-padded)
-    padded_search = search_value.ljust(segment.field_width)[:segment.field_width]
-
-    # Binary search for first occurrence
-    lo, hi = 0, total_entries - 1
-    first_match = -1
-
-    while lo <= hi:
-        mid = (lo + hi) // 2
-        offset = data_start + mid * entry_size
-
-        if offset + entry_size > end_boundary:
-            hi = mid - 1
-            continue
-
-        # Read length field
-        length = struct.unpack('<H', parser.data[offset:offset + 2])[0]
-        if length != segment.field_width:
-            # Invalid entry — entries are contiguous, so this is beyond valid data
-            hi = mid - 1
-            continue
-
-        # Read value
-        text_start = offset + 2
-        text_end = text_start + segment.field_width
-        try:
-            entry_value = parser.data[text_start:text_end].decode('ascii', errors='replace')
-        except Exception:
-            hi = mid - 1
-            continue
-
-        if prefix_match:
-            # For prefix match, compare only the prefix portion
-            entry_prefix = entry_value[:len(search_value)]
-            search_prefix = search_value
-            if entry_prefix < search_prefix:
-                lo = mid + 1
-            elif entry_prefix > search_prefix:
-                hi = mid - 1
-            else:
-                first_match = mid
-                hi = mid - 1  # Keep searching left for first match
-        else:
-            # Exact match (padded)
-            if entry_value < padded_search:
-                lo = mid + 1
-            elif entry_value > padded_search:
-                hi = mid - 1
-            else:
-                first_match = mid
-                hi = mid - 1  # Keep searching left for first match
-
-    if first_match == -1:
-        return []
-
-    # Collect all matching entries starting from first_match
-    matches = []
-    for i in range(first_match, total_entries):
-        offset = data_start + i * entry_size
-        if offset + entry_size > end_boundary:
-            break
-
-        length = struct.unpack('<H', parser.data[offset:offset + 2])[0]
-        if length != segment.field_width:
-            break
-
-        text_start = offset + 2
-        text_end = text_start + segment.field_width
-        try:
-            entry_value = parser.data[text_start:text_end].decode('ascii', errors='replace')
-        except Exception:
-            break
-
-        stripped_value = entry_value.strip()
-
-        if prefix_match:
-            if not stripped_value.startswith(search_value.strip()):
-                break
-        else:
-            if stripped_value != search_value.strip():
-                break
-
-        # Read trailing bytes
-        trailing_start = text_end
-        trailing = parser.data[trailing_start:trailing_start + 5]
-
-        if is_u32_format:
-            u32_val = struct.unpack('<I', trailing[0:4])[0]
-            last_byte = trailing[4] if len(trailing) >= 5 else 0
-            matches.append(IndexEntry(
-                value=stripped_value,
-                page_number=0,
-                raw_length=length,
-                raw_trailing=trailing,
-                u32_index=u32_val,
-                entry_format='u32_index'
-            ))
-        else:
-            page = struct.unpack('<H', trailing[0:2])[0]
-            matches.append(IndexEntry(
-                value=stripped_value,
-                page_number=page,
-                raw_length=length,
-                raw_trailing=trailing,
-                u32_index=0,
-                entry_format='page'
-            ))
-
-    return matches
-
-
-def _detect_entry_format(
-    parser: MapFileParser,
-    segment: MapSegmentInfo,
-    entry_size: int,
-    data_start: int,
-    end_boundary: int,
-    sample_count: int
-) -> bool:
-    """
-    Detect whether entries use page format (small files) or u32_index format (large files).
-
-    Heuristic: read a sample of entries and check if all uint16 values at the
-    trailing position are odd. If ALL are odd, it's u32_index format.
-
-    Returns True if u32_index format, False if page format.
-    """
-    odd_count = 0
-    valid_count = 0
-
-    for i in range(sample_count):
-        offset = data_start + i * entry_size
-        if offset + entry_size > end_boundary:
-            break
-
-        length = struct.unpack('<H', parser.data[offset:offset + 2])[0]
-        if length != segment.field_width:
-            break
-
-        trailing_start = offset + 2 + segment.field_width
-        if trailing_start + 2 > end_boundary:
-            break
-
-        u16 = struct.unpack('<H', parser.data[trailing_start:trailing_start + 2])[0]
-        valid_count += 1
-        if u16 % 2 == 1:
-            odd_count += 1
-
-    # All sampled uint16 values odd AND meaningful sample → u32_index format
-    return odd_count == valid_count and valid_count >= 3
+    return parser.search_segment(segment, search_value, prefix_match)
 
 
 # ============================================================================
 # Page Resolution for u32_index Format (Large MAP Files)
 # ============================================================================
 
-def build_segment0_page_lookup(parser: MapFileParser) -> Dict[int, int]:
-    """
-    Build u32_join_key → page_number lookup from Segment 0 for large MAP files.
-
-    In large MAP files, index entries use u32_index format where the 4-byte
-    value is a join key into Segment 0's 15-byte record array.
-
-    Segment 0 record format (15 bytes, little-endian):
-      [page_number:4][rec_id_byte:1][type:1][pad:1][u32_join_key:4][u32_extra:4]
-
-    Record types (byte 5):
-      0x08 = data record (contains page mapping)
-      0x0c = separator record (skip)
-
-    The u32_join_key values are sequential odd numbers (1, 3, 5, 7...).
-
-    Args:
-        parser: MapFileParser with loaded data and parsed segments
-
-    Returns:
-        Dict mapping u32_join_key → page_number
-    """
-    if not parser.segments:
-        return {}
-
-    seg0 = parser.segments[0]
-    lookup = {}
-    record_size = 15
-    offset = seg0.data_offset
-    end = seg0.offset + seg0.size
-
-    while offset + record_size <= end:
-        if offset + record_size > len(parser.data):
-            break
-
-        page_raw = struct.unpack('<I', parser.data[offset:offset + 4])[0]
-        rec_type = parser.data[offset + 5]
-        u32_join_key = struct.unpack('<I', parser.data[offset + 7:offset + 11])[0]
-
-        if rec_type == 0x08:  # data record
-            page_number = page_raw & 0x7FFFFFFF  # mask off branch boundary flag
-            lookup[u32_join_key] = page_number
-
-        offset += record_size
-
-    return lookup
-
-
 def resolve_pages(entries: List[IndexEntry], parser: MapFileParser) -> List[dict]:
     """
     Resolve page numbers from MAP index entries.
@@ -359,7 +146,7 @@ def resolve_pages(entries: List[IndexEntry], parser: MapFileParser) -> List[dict
                 'format': 'page'
             })
     elif fmt == 'u32_index':
-        seg0_lookup = build_segment0_page_lookup(parser)
+        seg0_lookup = parser.segment0_page_lookup()
         for entry in entries:
             page = seg0_lookup.get(entry.u32_index)
             results.append({
@@ -400,7 +187,15 @@ def output_table(results: List[dict], field_info: dict = None, segment_info: dic
     val_width = max(len(r['value']) for r in results) if results else 10
     val_width = max(val_width, 5)
 
-    if results[0].get('format') == 'u32_index':
+    if 'query' in results[0]:
+        # Batch search (--values-file): show which search value each match belongs to
+        q_width = max(5, max(len(r['query']) for r in results))
+        print(f"  {'QUERY':<{q_width}}  {'VALUE':<{val_width}}  {'PAGE':>8}")
+        print(f"  {'-' * q_width}  {'-' * val_width}  {'--------':>8}")
+        for r in results:
+            page_str = str(r['page']) if r['page'] else '(unresolved)'
+            print(f"  {r['query']:<{q_width}}  {r['value']:<{val_width}}  {page_str:>8}")
+    elif results[0].get('format') == 'u32_index':
         print(f"  {'VALUE':<{val_width}}  {'PAGE':>8}  {'U32_INDEX':>12}")
         print(f"  {'-' * val_width}  {'--------':>8}  {'------------':>12}")
         for r in results:
@@ -419,6 +214,8 @@ def output_csv(results: List[dict], output_path: str = None):
         return
 
     fieldnames = ['value', 'page']
+    if 'query' in results[0]:
+        fieldnames.insert(0, 'query')
     if results[0].get('format') == 'u32_index':
         fieldnames.append('u32_index')
 
@@ -438,12 +235,15 @@ def output_csv(results: List[dict], output_path: str = None):
 
 
 def output_json(results: List[dict], field_info: dict = None,
-                segment_info: dict = None, output_path: str = None):
+                segment_info: dict = None, output_path: str = None,
+                not_found: Optional[List[str]] = None):
     """Write results as JSON."""
     output = {
         'matches': results,
         'match_count': len(results),
     }
+    if not_found is not None:
+        output['not_found'] = not_found
     if field_info:
         output['field'] = field_info.get('name', '')
         output['line_id'] = field_info.get('line_id')
@@ -532,9 +332,6 @@ def list_values(parser: MapFileParser, line_id: int, field_id: int,
     Reads all entries from the matching segment and shows unique values
     with occurrence counts.
     """
-    if not parser.segments:
-        parser.parse_segments()
-
     segment = parser.find_segment_for_field(line_id, field_id)
     if not segment:
         print(f"No segment found for LINE_ID={line_id}, FIELD_ID={field_id}", file=sys.stderr)
@@ -550,12 +347,8 @@ def list_values(parser: MapFileParser, line_id: int, field_id: int,
 
     entries = parser.read_index_entries(segment, max_entries=max_values if max_values > 0 else 0)
 
-    # Count unique values
-    value_counts: Dict[str, int] = {}
-    for entry in entries:
-        value_counts[entry.value] = value_counts.get(entry.value, 0) + 1
-
-    sorted_values = sorted(value_counts.items())
+    # Count unique values (sorted run lengths over the columnar entry set)
+    sorted_values = entries.unique_counts()
 
     print(f"\nField: {field_name} (LINE_ID={line_id}, FIELD_ID={field_id})")
     print(f"Total entries: {len(entries)}, Unique values: {len(sorted_values)}")
@@ -597,19 +390,17 @@ def do_search(
 
     # Load and parse MAP file
     parser = MapFileParser(map_path)
-    if not parser.load():
+    if not parser.load(use_mmap=True):
         print(f"ERROR: Failed to load MAP file: {map_path}", file=sys.stderr)
         sys.exit(1)
 
-    parser.parse_segments()
-
-    # Find target segment
+    # Find target segment (only the segment headers up to it are read)
     segment = parser.find_segment_for_field(line_id, field_id)
     if not segment:
         print(f"ERROR: No segment found for LINE_ID={line_id}, FIELD_ID={field_id}",
               file=sys.stderr)
         print(f"\nAvailable segments:", file=sys.stderr)
-        for seg in parser.segments[1:]:
+        for seg in parser.parse_segments()[1:]:
             print(f"  Segment {seg.index}: LINE_ID={seg.line_id}, FIELD_ID={seg.field_id}",
                   file=sys.stderr)
         sys.exit(1)
@@ -640,6 +431,7 @@ def do_search(
 
     # Resolve pages
     results = resolve_pages(matches, parser)
+    parser.close()
 
     if results:
         segment_info['entry_format'] = results[0].get('format', 'unknown')
@@ -657,6 +449,83 @@ def do_search(
         output_json(results, field_info, segment_info, output_path)
 
 
+def read_values_file(path: str) -> List[str]:
+    """Read search values, one per line (blank lines are skipped)."""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def do_search_many(
+    map_path: str,
+    line_id: int,
+    field_id: int,
+    search_values: List[str],
+    prefix_match: bool = False,
+    output_format: str = 'table',
+    output_path: str = None
+):
+    """
+    Batch search: look up a list of values in one pass over the field's index.
+
+    Uses MapFileParser.search_many (sorted merge join). Matches are reported
+    grouped by search value, in sorted order, with a 'query' column; values
+    without matches are listed separately.
+    """
+    t0 = time.time()
+
+    parser = MapFileParser(map_path)
+    if not parser.load(use_mmap=True):
+        print(f"ERROR: Failed to load MAP file: {map_path}", file=sys.stderr)
+        sys.exit(1)
+
+    segment = parser.find_segment_for_field(line_id, field_id)
+    if not segment:
+        print(f"ERROR: No segment found for LINE_ID={line_id}, FIELD_ID={field_id}",
+              file=sys.stderr)
+        sys.exit(1)
+
+    grouped = parser.search_many(search_values, line_id, field_id, prefix_match)
+
+    # Resolve all matches at once (one Segment 0 lookup for u32_index files)
+    queries = [q for q, entries in grouped.items() for _ in entries]
+    matches = [e for entries in grouped.values() for e in entries]
+    results = resolve_pages(matches, parser)
+    parser.close()
+    for query, result in zip(queries, results):
+        result['query'] = query
+    not_found = [q for q, entries in grouped.items() if not entries]
+
+    elapsed_ms = (time.time() - t0) * 1000
+    summary = (f"{len(grouped) - len(not_found)} of {len(grouped)} value(s) found, "
+               f"{len(results)} match(es), {len(not_found)} not found")
+
+    if output_format == 'table':
+        output_table(results, None, {
+            'segment_index': segment.index,
+            'line_id': segment.line_id,
+            'field_id': segment.field_id,
+            'field_width': segment.field_width,
+            'entry_count': segment.entry_count
+        })
+        if not_found:
+            print(f"\nNot found ({len(not_found)}):")
+            for q in not_found[:50]:
+                print(f"  {q}")
+            if len(not_found) > 50:
+                print(f"  ... and {len(not_found) - 50} more")
+        print(f"\n{summary}")
+        print(f"Search completed in {elapsed_ms:.1f}ms")
+    elif output_format == 'csv':
+        output_csv(results, output_path)
+        print(summary, file=sys.stderr)
+    elif output_format == 'json':
+        output_json(results, {'name': f"L{line_id}/F{field_id}", 'line_id': line_id,
+                              'field_id': field_id},
+                    {'segment_index': segment.index, 'entry_count': segment.entry_count,
+                     'entry_format': results[0]['format'] if results else 'unknown'},
+                    output_path, not_found=not_found)
+
+
 # ============================================================================
 # CLI
 # ============================================================================
@@ -676,6 +545,9 @@ Examples:
   # Prefix search:
   python papyrus_rpt_search.py --map 25001002.MAP --line-id 5 --field-id 3 --value "200-044" --prefix
 
+  # Batch search for a list of values (one per line), results as CSV:
+  python papyrus_rpt_search.py --map 25001002.MAP --line-id 5 --field-id 3 --values-file accounts.txt --format csv --output hits.csv
+
   # List all indexed fields:
   python papyrus_rpt_search.py --map 25001002.MAP --list-fields
 
@@ -701,6 +573,9 @@ Examples:
     # Search
     search_group = parser.add_argument_group('Search')
     search_group.add_argument('--value', help='Value to search for')
+    search_group.add_argument('--values-file',
+                              help='File with values to search for, one per line '
+                                   '(batch search in a single pass over the index)')
     search_group.add_argument('--prefix', action='store_true',
                               help='Enable prefix matching (default: exact)')
 
@@ -737,11 +612,11 @@ Examples:
     # === Mode: List fields ===
     if args.list_fields:
         p = MapFileParser(args.map)
-        if not p.load():
+        if not p.load(use_mmap=True):
             print(f"ERROR: Failed to load MAP file: {args.map}", file=sys.stderr)
             sys.exit(1)
-        p.parse_segments()
         list_fields(p, metadata)
+        p.close()
         return
 
     # === Resolve field specification ===
@@ -785,16 +660,35 @@ Examples:
     # === Mode: List values ===
     if args.list_values:
         p = MapFileParser(args.map)
-        if not p.load():
+        if not p.load(use_mmap=True):
             print(f"ERROR: Failed to load MAP file: {args.map}", file=sys.stderr)
             sys.exit(1)
-        p.parse_segments()
         list_values(p, line_id, field_id, metadata, args.max_values)
+        p.close()
+        return
+
+    # === Mode: Batch search ===
+    if args.values_file:
+        if args.value:
+            print("ERROR: --value and --values-file are mutually exclusive.", file=sys.stderr)
+            sys.exit(1)
+        if not os.path.isfile(args.values_file):
+            print(f"ERROR: Values file not found: {args.values_file}", file=sys.stderr)
+            sys.exit(1)
+        do_search_many(
+            map_path=args.map,
+            line_id=line_id,
+            field_id=field_id,
+            search_values=read_values_file(args.values_file),
+            prefix_match=args.prefix,
+            output_format=args.format,
+            output_path=args.output
+        )
         return
 
     # === Mode: Search ===
     if not args.value:
-        print("ERROR: --value is required for search mode.", file=sys.stderr)
+        print("ERROR: --value (or --values-file) is required for search mode.", file=sys.stderr)
         print("Use --list-fields to see available fields, or --list-values to see all values.",
               file=sys.stderr)
         sys.exit(1)
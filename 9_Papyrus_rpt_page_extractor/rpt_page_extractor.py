@@ -12,6 +12,7 @@ Supports:
   - Section-based:   --section-id 14259 (extract only pages belonging to that section)
   - Multi-section:   --section-id 14259 14260 14261 (multiple sections, in order)
   - Folder mode:     --folder <dir> (process all RPT files in a directory)
+  - Batch jobs:      --jobs N (process files on N worker processes), --summary <file.json|csv>
   - Binary objects:  --binary-only (extract only PDF/AFP), --no-binary (skip binary)
   - Concatenate:     --page-concat (all text pages into one file, separated by form-feed)
   - CSV export:      --export-sections <file.csv> (export section table as CSV for rpt_file_builder)
@@ -42,25 +43,44 @@ BPAGETBLHDR Entry Format (16 bytes, little-endian):
   [reserved:4]           - Always 0
   [uncompressed_size:4]  - Decompressed data size in bytes
   [compressed_size:4]    - zlib stream size in bytes
+
+File access goes through RptFile, a read-only memory mapping of the RPT file. The
+trailer structures are located once via the Table Directory offsets and page /
+binary object streams are inflated straight from memoryview slices of the mapping,
+so memory use stays flat regardless of the RPT file size. zlib releases the GIL
+while inflating, so bulk decompression can fan out over a thread pool (--workers).
+The page table is held as a columnar PageTable rather than one object per page,
+so page range and section selection are slices, not scans of the whole table.
+Extraction streams: each page (and each binary object chunk) is written as soon
+as it is inflated, so only a small window of pages is held in memory at a time.
 """
 
+import csv
+import io
+import json
+import mmap
 import struct
+import threading
+import time
 import zlib
 import os
 import sys
 import argparse
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
-from rpt_section_reader import parse_rpt_header, read_sectionhdr, SectionEntry, RptHeader
+from rpt_section_reader import RPTINSTHDR_OFFSET, SectionEntry, SectionIndex, RptHeader
+from rpt_index_cache import RptIndex, build_index, load_index, save_index
 
 
 # ============================================================================
 # Data Structures
 # ============================================================================
 
-RPTINSTHDR_OFFSET = 0xF0  # Base offset for page_offset values
-
 @dataclass
 class PageTableEntry:
     """One PAGETBLHDR entry — metadata for a single page."""
@@ -77,6 +97,141 @@ class PageTableEntry:
         return self.page_offset + RPTINSTHDR_OFFSET
 
 
+_U32 = 'I' if array('I').itemsize == 4 else 'L'  # array typecode for uint32 columns
+
+
+class PageTable:
+    """
+    Columnar PAGETBLHDR table.
+
+    The 24-byte entries are loaded in one pass into parallel uint32 columns
+    (page number, page offset, line width | lines per page << 16, uncompressed
+    and compressed size) instead of one PageTableEntry object per page. Slicing
+    by position or page range returns a PageTable view over the same columns in
+    O(1), and size totals are computed over the columns directly.
+
+    Iterating or indexing still yields PageTableEntry objects, so code that
+    works with a list of entries keeps working unchanged.
+    """
+
+    __slots__ = ('page_numbers', 'page_offsets', 'dimensions',
+                 'uncompressed_sizes', 'compressed_sizes', '_start', '_stop')
+
+    def __init__(self, page_numbers: array, page_offsets: array, dimensions: array,
+                 uncompressed_sizes: array, compressed_sizes: array,
+                 start: int = 0, stop: Optional[int] = None):
+        self.page_numbers = page_numbers
+        self.page_offsets = page_offsets
+        self.dimensions = dimensions
+        self.uncompressed_sizes = uncompressed_sizes
+        self.compressed_sizes = compressed_sizes
+        self._start = start
+        self._stop = len(page_numbers) if stop is None else stop
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> 'PageTable':
+        """Build a PageTable from raw PAGETBLHDR entries (24 bytes each)."""
+        # Each entry is six little-endian uint32 words:
+        #   page_offset, pad, line_width | lines_per_page << 16,
+        #   uncompressed_size, compressed_size, pad
+        words = array(_U32)
+        words.frombytes(raw[:len(raw) // 24 * 24])
+        if sys.byteorder == 'big':
+            words.byteswap()
+        count = len(words) // 6
+        return cls(array(_U32, range(1, count + 1)),
+                   words[0::6], words[2::6], words[3::6], words[4::6])
+
+    @classmethod
+    def concat(cls, tables: List['PageTable']) -> 'PageTable':
+        """Join PageTables (e.g. several section slices) in the given order."""
+        if len(tables) == 1:
+            return tables[0]
+        columns = [array(_U32) for _ in range(5)]
+        for t in tables:
+            for column, source in zip(columns, t._columns()):
+                column.extend(source[t._start:t._stop])
+        return cls(*columns)
+
+    def _columns(self) -> Tuple[array, array, array, array, array]:
+        return (self.page_numbers, self.page_offsets, self.dimensions,
+                self.uncompressed_sizes, self.compressed_sizes)
+
+    def _view(self, start: int, stop: int) -> 'PageTable':
+        return PageTable(*self._columns(), start=start, stop=max(start, stop))
+
+    def _entry(self, i: int) -> PageTableEntry:
+        dims = self.dimensions[i]
+        return PageTableEntry(
+            page_number=self.page_numbers[i],
+            page_offset=self.page_offsets[i],
+            line_width=dims & 0xFFFF,
+            lines_per_page=dims >> 16,
+            uncompressed_size=self.uncompressed_sizes[i],
+            compressed_size=self.compressed_sizes[i]
+        )
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __iter__(self) -> Iterator[PageTableEntry]:
+        for i in range(self._start, self._stop):
+            yield self._entry(i)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self._view(self._start + start, self._start + stop)
+            return [self._entry(self._start + i) for i in range(start, stop, step)]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError('page table index out of range')
+        return self._entry(self._start + key)
+
+    def entries(self) -> List[PageTableEntry]:
+        """Materialise the table as a list of PageTableEntry objects."""
+        return list(self)
+
+    def page_range(self, start_page: int, end_page: int) -> 'PageTable':
+        """
+        Return the entries for pages start_page..end_page (inclusive, 1-based).
+
+        The table must be in page order (as read from the RPT file). For a
+        contiguous table this is pure index arithmetic; otherwise the bounds
+        are found by bisection.
+        """
+        if not len(self):
+            return self
+        pages = self.page_numbers
+        first = pages[self._start]
+        if pages[self._stop - 1] - first == len(self) - 1:
+            lo = self._start + min(max(start_page - first, 0), len(self))
+            hi = self._start + min(max(end_page - first + 1, 0), len(self))
+        else:
+            lo = bisect_left(pages, start_page, self._start, self._stop)
+            hi = bisect_right(pages, end_page, self._start, self._stop)
+        return self._view(lo, hi)
+
+    def without_page(self, page_number: int) -> 'PageTable':
+        """Return the table without page_number (self if it is not present)."""
+        pages = self.page_numbers
+        for i in range(self._start, self._stop):
+            if pages[i] == page_number:
+                return PageTable.concat([self._view(self._start, i),
+                                         self._view(i + 1, self._stop)])
+        return self
+
+    def total_compressed(self) -> int:
+        """Sum of compressed_size over the table."""
+        return sum(memoryview(self.compressed_sizes)[self._start:self._stop])
+
+    def total_uncompressed(self) -> int:
+        """Sum of uncompressed_size over the table."""
+        return sum(memoryview(self.uncompressed_sizes)[self._start:self._stop])
+
+
 @dataclass
 class BinaryObjectEntry:
     """One BPAGETBLHDR entry — metadata for an embedded binary object (PDF/AFP)."""
@@ -92,65 +247,209 @@ class BinaryObjectEntry:
 
 
 # ============================================================================
-# PAGETBLHDR Parsing
+# Memory-mapped RPT File Access
 # ============================================================================
 
-def read_page_table(filepath: str, page_count: int) -> List[PageTableEntry]:
+INFLATE_CHUNK_SIZE = 64 * 1024  # compressed bytes fed to the inflater per step
+INFLATE_OVERRUN = 64            # bytes read past compressed_size to finish a truncated stream
+
+
+class RptFile:
     """
-    Read PAGETBLHDR entries from an RPT file.
+    Read-only, memory-mapped view of an RPT file.
 
-    Uses targeted scan to find the PAGETBLHDR marker, then reads
-    page_count x 24-byte entries.
+    The file is mapped once and the trailer structures (SECTIONHDR, PAGETBLHDR,
+    BPAGETBLHDR) are located up front using the Table Directory offsets at 0x1D0
+    as seek hints, falling back to a forward marker scan over the mapping (see
+    rpt_index_cache.build_index). With index_cache set, the located tables are
+    loaded from / saved to a .rptidx cache instead, so repeat opens of an
+    unchanged RPT file never touch its trailer. Page and binary object streams
+    are handed to zlib as memoryview slices of the mapping, so no part of the
+    file is copied into Python bytes objects.
 
-    Args:
-        filepath: Path to .RPT file
-        page_count: Number of pages (from header Table Directory)
+    inflate_retries / inflate_failures count streams that needed bytes past
+    their compressed_size to complete, and streams that could not be inflated.
 
-    Returns:
-        List of PageTableEntry objects (1-indexed page numbers)
+    Use as a context manager (or call close()) to release the mapping.
     """
-    entries = []
 
-    with open(filepath, 'rb') as f:
-        data = f.read()
+    def __init__(self, filepath: str, index_cache: Optional[str] = None):
+        """
+        Args:
+            filepath: Path to .RPT file
+            index_cache: None = no index cache, '' = sidecar .rptidx next to the
+                         RPT file, otherwise a shared cache directory
+        """
+        self.filepath = filepath
+        self.file_size = os.path.getsize(filepath)
+        self.index: Optional[RptIndex] = None
+        self.index_cached = False
+        self.inflate_retries = 0
+        self.inflate_failures = 0
+        self._stats_lock = threading.Lock()
+        self._section_index: Optional[SectionIndex] = None
+
+        if index_cache is not None:
+            self.index = load_index(filepath, index_cache)
+            self.index_cached = self.index is not None
+
+        self._file = open(filepath, 'rb')
+        self._mm = None
+        self._view = None
+        if self.file_size > 0:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mm)
+            if self.index is None:
+                self.index = build_index(self._mm)
+                if self.index is not None and index_cache is not None:
+                    save_index(filepath, self.index, index_cache)
+
+        self.header: Optional[RptHeader] = self.index.header if self.index else None
+
+    def __enter__(self) -> 'RptFile':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Release the memory mapping and the underlying file handle."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    # ------------------------------------------------------------------
+    # Trailer tables
+    # ------------------------------------------------------------------
+
+    @property
+    def sections(self) -> List[SectionEntry]:
+        """SECTIONHDR triplets (SECTION_ID, START_PAGE, PAGE_COUNT)."""
+        return self.index.sections if self.index else []
 
-    pt_pos = data.find(b'PAGETBLHDR')
-    if pt_pos == -1:
-        return entries
+    @property
+    def section_index(self) -> SectionIndex:
+        """SectionIndex over the SECTIONHDR triplets (built on first use)."""
+        if self._section_index is None:
+            self._section_index = SectionIndex(self.sections)
+        return self._section_index
+
+    def read_page_table(self, page_count: Optional[int] = None) -> PageTable:
+        """Parse PAGETBLHDR entries (defaults to the Table Directory page count)."""
+        if self.index is None:
+            return PageTable.from_bytes(b'')
+        table = self.index.page_table
+        if page_count is not None:
+            table = table[:page_count * 24]
+        return PageTable.from_bytes(table)
+
+    def read_binary_page_table(self, count: Optional[int] = None) -> List['BinaryObjectEntry']:
+        """Parse BPAGETBLHDR entries (defaults to the Table Directory binary count)."""
+        if self.index is None:
+            return []
+        table = self.index.binary_table
+        if count is not None:
+            table = table[:count * 16]
+
+        return [
+            BinaryObjectEntry(
+                index=i + 1,
+                page_offset=page_offset,
+                uncompressed_size=uncompressed_size,
+                compressed_size=compressed_size
+            )
+            for i, (page_offset, _, uncompressed_size, compressed_size) in enumerate(
+                struct.iter_unpack('<IIII', table))
+        ]
+
+    # ------------------------------------------------------------------
+    # Stream access
+    # ------------------------------------------------------------------
+
+    def inflate(self, abs_offset: int, size: int) -> bytes:
+        """
+        Incrementally decompress the zlib stream at abs_offset from the mapping.
 
-    # Skip marker (10 bytes) + 3 null padding bytes = 13 bytes
-    entry_start = pt_pos + 13
-    entry_size = 24
+        Feeds a zlib.decompressobj INFLATE_CHUNK_SIZE slices of the mapping
+        until the end of the stream. A stream that is still open after `size`
+        bytes (truncated compressed_size) is finished from up to INFLATE_OVERRUN
+        further bytes and counted in inflate_retries.
 
-    for i in range(page_count):
-        offset = entry_start + i * entry_size
-        if offset + entry_size > len(data):
-            break
+        Raises zlib.error if the stream is invalid or does not complete.
+        """
+        inflater = zlib.decompressobj()
+        pieces = []
+        pos = abs_offset
+        end = min(abs_offset + size, self.file_size)
+        limit = min(abs_offset + size + INFLATE_OVERRUN, self.file_size)
+        retried = False
+
+        try:
+            while not inflater.eof and pos < limit:
+                if pos >= end:
+                    retried = True
+                    end = limit
+                chunk_end = min(pos + INFLATE_CHUNK_SIZE, end)
+                with self._view[pos:chunk_end] as chunk:
+                    pieces.append(inflater.decompress(chunk))
+                pos = chunk_end
+            if not inflater.eof:
+                raise zlib.error('incomplete or truncated stream')
+        except zlib.error:
+            with self._stats_lock:
+                self.inflate_failures += 1
+            raise
+
+        if retried:
+            with self._stats_lock:
+                self.inflate_retries += 1
+        # A single piece is returned as-is; otherwise one exact-size allocation
+        return b''.join(pieces)
+
+
+@contextmanager
+def open_rpt(source: Union[str, RptFile]) -> Iterator[RptFile]:
+    """Yield an RptFile for a path, or pass through an already open RptFile."""
+    if isinstance(source, RptFile):
+        yield source
+    else:
+        with RptFile(source) as rpt:
+            yield rpt
 
-        page_offset = struct.unpack_from('<I', data, offset)[0]
-        # skip pad at offset+4
-        line_width = struct.unpack_from('<H', data, offset + 8)[0]
-        lines_per_page = struct.unpack_from('<H', data, offset + 10)[0]
-        uncompressed_size = struct.unpack_from('<I', data, offset + 12)[0]
-        compressed_size = struct.unpack_from('<I', data, offset + 16)[0]
 
-        entries.append(PageTableEntry(
-            page_number=i + 1,
-            page_offset=page_offset,
-            line_width=line_width,
-            lines_per_page=lines_per_page,
-            uncompressed_size=uncompressed_size,
-            compressed_size=compressed_size
-        ))
+# ============================================================================
+# PAGETBLHDR Parsing
+# ============================================================================
 
-    return entries
+def read_page_table(filepath: Union[str, RptFile], page_count: int) -> PageTable:
+    """
+    Read PAGETBLHDR entries from an RPT file.
+
+    Locates the PAGETBLHDR marker via the Table Directory (see RptFile),
+    then reads page_count x 24-byte entries.
+
+    Args:
+        filepath: Path to .RPT file (or an open RptFile)
+        page_count: Number of pages (from header Table Directory)
+
+    Returns:
+        PageTable (iterates as PageTableEntry objects, 1-indexed page numbers)
+    """
+    with open_rpt(filepath) as rpt:
+        if rpt.header is None:
+            return PageTable.from_bytes(b'')
+        return rpt.read_page_table(page_count)
 
 
 # ============================================================================
 # Page Decompression
 # ============================================================================
 
-def decompress_page(filepath: str, entry: PageTableEntry) -> Optional[bytes]:
+def decompress_page(filepath: Union[str, RptFile], entry: PageTableEntry) -> Optional[bytes]:
     """
     Decompress a single page from the RPT file.
 
@@ -158,7 +457,7 @@ def decompress_page(filepath: str, entry: PageTableEntry) -> Optional[bytes]:
     and decompress it.
 
     Args:
-        filepath: Path to .RPT file
+        filepath: Path to .RPT file (or an open RptFile)
         entry: PageTableEntry with offset and size info
 
     Returns:
@@ -166,114 +465,128 @@ def decompress_page(filepath: str, entry: PageTableEntry) -> Optional[bytes]:
     """
     abs_offset = entry.absolute_offset
 
-    with open(filepath, 'rb') as f:
-        f.seek(abs_offset)
-        compressed = f.read(entry.compressed_size)
-
-    if len(compressed) < entry.compressed_size:
-        return None
+    with open_rpt(filepath) as rpt:
+        if abs_offset + entry.compressed_size > rpt.file_size:
+            return None
 
-    try:
-        return zlib.decompress(compressed)
-    except zlib.error:
-        # Try with extra bytes (some streams may need more)
-        with open(filepath, 'rb') as f:
-            f.seek(abs_offset)
-            compressed = f.read(entry.compressed_size + 64)
         try:
-            return zlib.decompress(compressed)
+            return rpt.inflate(abs_offset, entry.compressed_size)
         except zlib.error:
             return None
 
 
-def decompress_pages(filepath: str, entries: List[PageTableEntry]) -> List[Tuple[int, bytes]]:
+DECOMPRESS_BATCH_SIZE = 256  # streams in flight per batch when decompressing in parallel
+
+
+def _inflate_entries(rpt: RptFile, entries: list,
+                     workers: int = 1) -> Iterator[Tuple[object, Optional[bytes], Optional[str]]]:
     """
-    Decompress multiple pages from the RPT file.
+    Inflate the zlib streams for a list of table entries, in order.
 
-    Opens the file once and reads all requested pages for efficiency.
+    Works for both PageTableEntry and BinaryObjectEntry. With workers > 1 the
+    streams are decompressed on a thread pool in bounded batches of
+    DECOMPRESS_BATCH_SIZE; results are still yielded in entry order.
 
     Args:
-        filepath: Path to .RPT file
-        entries: List of PageTableEntry objects to decompress
+        rpt: Open RptFile
+        entries: Table entries with absolute_offset and compressed_size
+        workers: Number of decompression threads (1 = serial)
 
-    Returns:
-        List of (page_number, decompressed_bytes) tuples
+    Yields:
+        (entry, decompressed_bytes, error) - error is a message when the
+        stream could not be decompressed, in which case the data is None
     """
-    results = []
-    file_size = os.path.getsize(filepath)
+    def inflate(entry) -> Tuple[Optional[bytes], Optional[str]]:
+        abs_offset = entry.absolute_offset
+        if abs_offset + entry.compressed_size > rpt.file_size:
+            return None, f"offset 0x{abs_offset:X} exceeds file size {rpt.file_size:,}"
+        try:
+            return rpt.inflate(abs_offset, entry.compressed_size), None
+        except zlib.error as e:
+            return None, f"decompression failed: {e}"
 
-    with open(filepath, 'rb') as f:
+    if workers <= 1 or len(entries) <= 1:
         for entry in entries:
-            abs_offset = entry.absolute_offset
-            if abs_offset + entry.compressed_size > file_size:
-                print(f"  WARNING: Page {entry.page_number} offset 0x{abs_offset:X} "
-                      f"exceeds file size {file_size:,}", file=sys.stderr)
+            yield (entry,) + inflate(entry)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, len(entries), DECOMPRESS_BATCH_SIZE):
+            batch = list(entries[start:start + DECOMPRESS_BATCH_SIZE])
+            for entry, (data, error) in zip(batch, pool.map(inflate, batch)):
+                yield entry, data, error
+
+
+def iter_pages(filepath: Union[str, RptFile],
+               entries: List[PageTableEntry],
+               workers: int = 1) -> Iterator[Tuple[int, bytes]]:
+    """
+    Decompress pages from the RPT file one at a time, in entry order.
+
+    Pages that fail to decompress are reported on stderr and skipped. At most
+    DECOMPRESS_BATCH_SIZE pages are held in memory when workers > 1.
+
+    Args:
+        filepath: Path to .RPT file (or an open RptFile)
+        entries: List of PageTableEntry objects to decompress
+        workers: Number of decompression threads (1 = serial)
+
+    Yields:
+        (page_number, decompressed_bytes) tuples
+    """
+    with open_rpt(filepath) as rpt:
+        for entry, page_data, error in _inflate_entries(rpt, entries, workers):
+            if error:
+                print(f"  WARNING: Page {entry.page_number} {error}", file=sys.stderr)
                 continue
+            yield entry.page_number, page_data
 
-            f.seek(abs_offset)
-            compressed = f.read(entry.compressed_size)
 
-            try:
-                page_data = zlib.decompress(compressed)
-                results.append((entry.page_number, page_data))
-            except zlib.error as e:
-                print(f"  WARNING: Page {entry.page_number} decompression failed: {e}",
-                      file=sys.stderr)
+def decompress_pages(filepath: Union[str, RptFile],
+                     entries: List[PageTableEntry],
+                     workers: int = 1) -> List[Tuple[int, bytes]]:
+    """
+    Decompress multiple pages from the RPT file.
 
-    return results
+    Maps the file once and inflates all requested pages from it. Prefer
+    iter_pages when the pages are written out one by one.
+
+    Args:
+        filepath: Path to .RPT file (or an open RptFile)
+        entries: List of PageTableEntry objects to decompress
+        workers: Number of decompression threads (1 = serial)
+
+    Returns:
+        List of (page_number, decompressed_bytes) tuples, in entry order
+    """
+    return list(iter_pages(filepath, entries, workers))
 
 
 # ============================================================================
 # BPAGETBLHDR Parsing
 # ============================================================================
 
-def read_binary_page_table(filepath: str, count: int) -> List[BinaryObjectEntry]:
+def read_binary_page_table(filepath: Union[str, RptFile], count: int) -> List[BinaryObjectEntry]:
     """
     Read BPAGETBLHDR entries from an RPT file.
 
-    Scans for the BPAGETBLHDR marker and reads count x 16-byte entries
-    describing embedded binary objects (PDF/AFP documents).
+    Locates the BPAGETBLHDR marker via the Table Directory (see RptFile) and
+    reads count x 16-byte entries describing embedded binary objects (PDF/AFP documents).
 
     Args:
-        filepath: Path to .RPT file
+        filepath: Path to .RPT file (or an open RptFile)
         count: Number of binary objects (from header Table Directory Row 2)
 
     Returns:
         List of BinaryObjectEntry objects (1-indexed)
     """
-    entries = []
     if count <= 0:
-        return entries
-
-    with open(filepath, 'rb') as f:
-        data = f.read()
+        return []
 
-    bp_pos = data.find(b'BPAGETBLHDR')
-    if bp_pos == -1:
-        return entries
-
-    # Skip marker (11 bytes) + 2 null padding bytes = 13 bytes
-    entry_start = bp_pos + 13
-    entry_size = 16
-
-    for i in range(count):
-        offset = entry_start + i * entry_size
-        if offset + entry_size > len(data):
-            break
-
-        page_offset = struct.unpack_from('<I', data, offset)[0]
-        # skip reserved at offset+4
-        uncompressed_size = struct.unpack_from('<I', data, offset + 8)[0]
-        compressed_size = struct.unpack_from('<I', data, offset + 12)[0]
-
-        entries.append(BinaryObjectEntry(
-            index=i + 1,
-            page_offset=page_offset,
-            uncompressed_size=uncompressed_size,
-            compressed_size=compressed_size
-        ))
-
-    return entries
+    with open_rpt(filepath) as rpt:
+        if rpt.header is None:
+            return []
+        return rpt.read_binary_page_table(count)
 
 
 # ============================================================================
@@ -350,42 +663,76 @@ def detect_binary_type(data: bytes, object_header: Optional[dict] = None) -> str
 # Binary Object Decompression and Assembly
 # ============================================================================
 
-def decompress_binary_objects(filepath: str,
-                              entries: List[BinaryObjectEntry]) -> List[Tuple[int, bytes]]:
+def iter_binary_objects(filepath: Union[str, RptFile],
+                        entries: List[BinaryObjectEntry],
+                        workers: int = 1) -> Iterator[Tuple[int, bytes]]:
+    """
+    Decompress binary object zlib streams one at a time, in entry order.
+
+    Objects that fail to decompress are reported on stderr and skipped.
+
+    Args:
+        filepath: Path to .RPT file (or an open RptFile)
+        entries: List of BinaryObjectEntry objects to decompress
+        workers: Number of decompression threads (1 = serial)
+
+    Yields:
+        (index, decompressed_bytes) tuples
+    """
+    with open_rpt(filepath) as rpt:
+        for entry, obj_data, error in _inflate_entries(rpt, entries, workers):
+            if error:
+                print(f"  WARNING: Binary object {entry.index} {error}", file=sys.stderr)
+                continue
+            yield entry.index, obj_data
+
+
+def decompress_binary_objects(filepath: Union[str, RptFile],
+                              entries: List[BinaryObjectEntry],
+                              workers: int = 1) -> List[Tuple[int, bytes]]:
     """
     Decompress binary object zlib streams from the RPT file.
 
-    Opens the file once and reads all binary object entries for efficiency.
+    Maps the file once and inflates all binary object entries from it.
 
     Args:
-        filepath: Path to .RPT file
+        filepath: Path to .RPT file (or an open RptFile)
         entries: List of BinaryObjectEntry objects to decompress
+        workers: Number of decompression threads (1 = serial)
 
     Returns:
-        List of (index, decompressed_bytes) tuples
+        List of (index, decompressed_bytes) tuples, in entry order
     """
-    results = []
-    file_size = os.path.getsize(filepath)
+    return list(iter_binary_objects(filepath, entries, workers))
 
-    with open(filepath, 'rb') as f:
-        for entry in entries:
-            abs_offset = entry.absolute_offset
-            if abs_offset + entry.compressed_size > file_size:
-                print(f"  WARNING: Binary object {entry.index} offset 0x{abs_offset:X} "
-                      f"exceeds file size {file_size:,}", file=sys.stderr)
-                continue
 
-            f.seek(abs_offset)
-            compressed = f.read(entry.compressed_size)
+def binary_document_name(head: bytes, object_header: Optional[dict] = None,
+                         rpt_name: str = '') -> Tuple[str, str]:
+    """
+    Determine the output filename and format description of a binary document.
+
+    Args:
+        head: Leading bytes of the assembled document (for magic-byte detection)
+        object_header: Optional Object Header metadata (for filename and type detection)
+        rpt_name: RPT filename stem (for fallback naming)
+
+    Returns:
+        Tuple of (output_filename, format_description)
+    """
+    # Detect format from magic bytes
+    ext = detect_binary_type(head, object_header)
 
-            try:
-                obj_data = zlib.decompress(compressed)
-                results.append((entry.index, obj_data))
-            except zlib.error as e:
-                print(f"  WARNING: Binary object {entry.index} decompression failed: {e}",
-                      file=sys.stderr)
+    # Determine filename
+    if object_header and object_header.get('Object File Name'):
+        filename = object_header['Object File Name'].strip()
+    else:
+        filename = f'{rpt_name}_binary{ext}'
 
-    return results
+    # Format description
+    format_map = {'.pdf': 'PDF', '.afp': 'AFP', '.bin': 'Binary'}
+    format_desc = format_map.get(ext, 'Binary')
+
+    return filename, format_desc
 
 
 def assemble_binary_document(objects: List[Tuple[int, bytes]],
@@ -395,7 +742,8 @@ def assemble_binary_document(objects: List[Tuple[int, bytes]],
     Assemble decompressed binary objects into a single document.
 
     Binary objects from an RPT file concatenate to form a complete document
-    (e.g., a multi-part PDF or AFP file).
+    (e.g., a multi-part PDF or AFP file). Holds the whole document in memory;
+    write_binary_document streams it to disk instead.
 
     Args:
         objects: List of (index, decompressed_bytes) tuples, in order
@@ -407,36 +755,81 @@ def assemble_binary_document(objects: List[Tuple[int, bytes]],
     """
     # Concatenate all objects in order
     combined = b''.join(data for _, data in objects)
+    filename, format_desc = binary_document_name(combined, object_header, rpt_name)
+    return combined, filename, format_desc
 
-    # Detect format from magic bytes
-    ext = detect_binary_type(combined, object_header)
 
-    # Determine filename
-    if object_header and object_header.get('Object File Name'):
-        filename = object_header['Object File Name'].strip()
-    else:
-        filename = f'{rpt_name}_binary{ext}'
+def write_binary_document(objects: Iterable[Tuple[int, bytes]],
+                          output_dir: Optional[str],
+                          object_header: Optional[dict] = None,
+                          rpt_name: str = '') -> Optional[Tuple[str, str, int, int]]:
+    """
+    Stream decompressed binary objects to disk as a single document.
 
-    # Format description
-    format_map = {'.pdf': 'PDF', '.afp': 'AFP', '.bin': 'Binary'}
-    format_desc = format_map.get(ext, 'Binary')
+    Objects are written chunk by chunk as they arrive; only the leading bytes
+    needed for format detection are buffered before the output file is opened.
 
-    return combined, filename, format_desc
+    Args:
+        objects: Iterable of (index, decompressed_bytes) tuples, in order
+        output_dir: Directory to write the document into, or None to only
+                    measure it (used by --info)
+        object_header: Optional Object Header metadata (for filename and type detection)
+        rpt_name: RPT filename stem (for fallback naming)
+
+    Returns:
+        Tuple of (output_filename, format_description, object_count, total_size),
+        or None if there were no objects
+    """
+    objects = iter(objects)
+
+    # Buffer leading objects until the magic bytes are available
+    head_chunks = []
+    head_size = 0
+    for _, data in objects:
+        head_chunks.append(data)
+        head_size += len(data)
+        if head_size >= 4:
+            break
+    if not head_chunks:
+        return None
+
+    filename, format_desc = binary_document_name(b''.join(head_chunks), object_header, rpt_name)
+    object_count = len(head_chunks)
+    total_size = head_size
+
+    if output_dir is None:
+        for _, data in objects:
+            object_count += 1
+            total_size += len(data)
+        return filename, format_desc, object_count, total_size
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, filename), 'wb') as f:
+        for data in head_chunks:
+            f.write(data)
+        for _, data in objects:
+            f.write(data)
+            object_count += 1
+            total_size += len(data)
+
+    return filename, format_desc, object_count, total_size
 
 
 # ============================================================================
 # Page Selection
 # ============================================================================
 
-def select_pages_by_range(entries: List[PageTableEntry],
-                          start_page: int, end_page: int) -> List[PageTableEntry]:
+def select_pages_by_range(entries: Union[PageTable, List[PageTableEntry]],
+                          start_page: int, end_page: int) -> Union[PageTable, List[PageTableEntry]]:
     """Select page table entries for a page range (inclusive, 1-based)."""
+    if isinstance(entries, PageTable):
+        return entries.page_range(start_page, end_page)
     return [e for e in entries if start_page <= e.page_number <= end_page]
 
 
-def select_pages_by_section(entries: List[PageTableEntry],
+def select_pages_by_section(entries: Union[PageTable, List[PageTableEntry]],
                             sections: List[SectionEntry],
-                            section_id: int) -> Optional[List[PageTableEntry]]:
+                            section_id: int) -> Optional[Union[PageTable, List[PageTableEntry]]]:
     """
     Select page table entries for a specific section.
 
@@ -463,54 +856,58 @@ def select_pages_by_section(entries: List[PageTableEntry],
     return select_pages_by_range(entries, start, end)
 
 
-def select_pages_by_sections(entries: List[PageTableEntry],
-                             sections: List[SectionEntry],
-                             section_ids: List[int]) -> Tuple[List[PageTableEntry], List[int], List[int]]:
+def select_pages_by_sections(entries: Union[PageTable, List[PageTableEntry]],
+                             sections: Union[SectionIndex, List[SectionEntry]],
+                             section_ids: List[int]) -> Tuple[Union[PageTable, List[PageTableEntry]],
+                                                              List[int], List[int]]:
     """
     Select page table entries for multiple sections, preserving the requested order.
 
     Pages are collected in the order of section_ids provided. Sections that
-    are not found are silently skipped.
+    are not found are silently skipped. Each section is resolved to its page
+    span through a SectionIndex, so with a PageTable every section costs one
+    slice rather than a scan of the page table.
 
     Args:
         entries: All page table entries
-        sections: SECTIONHDR entries from the RPT file
+        sections: SECTIONHDR entries from the RPT file (or a prebuilt SectionIndex)
         section_ids: List of SECTION_IDs to extract, in desired order
 
     Returns:
-        Tuple of (selected_entries, found_ids, skipped_ids)
+        Tuple of (selected_entries, found_ids, skipped_ids); selected_entries
+        is a PageTable when entries is one
     """
-    # Build lookup for sections
-    section_map = {s.section_id: s for s in sections}
+    index = sections if isinstance(sections, SectionIndex) else SectionIndex(sections)
 
-    selected = []
+    parts = []
     found_ids = []
     skipped_ids = []
 
     for sid in section_ids:
-        if sid not in section_map:
+        span = index.page_span(sid)
+        if span is None:
             skipped_ids.append(sid)
             continue
         found_ids.append(sid)
-        section = section_map[sid]
-        start = section.start_page
-        end = section.start_page + section.page_count - 1
-        selected.extend(select_pages_by_range(entries, start, end))
+        parts.append(select_pages_by_range(entries, *span))
 
-    return selected, found_ids, skipped_ids
+    if isinstance(entries, PageTable):
+        return PageTable.concat(parts), found_ids, skipped_ids
+    return [e for part in parts for e in part], found_ids, skipped_ids
 
 
 # ============================================================================
 # Output
 # ============================================================================
 
-def save_pages(pages: List[Tuple[int, bytes]], output_dir: str,
+def save_pages(pages: Iterable[Tuple[int, bytes]], output_dir: str,
                page_prefix: str = 'page') -> int:
     """
     Save decompressed pages as .txt files.
 
     Args:
-        pages: List of (page_number, content_bytes) tuples
+        pages: Iterable of (page_number, content_bytes) tuples (may be a
+               generator such as iter_pages, each page is written as it arrives)
         output_dir: Directory to save files in
         page_prefix: Prefix for page filenames
 
@@ -531,6 +928,33 @@ def save_pages(pages: List[Tuple[int, bytes]], output_dir: str,
     return saved
 
 
+def _count_pages(pages: Iterable[Tuple[int, bytes]], stats: dict) -> Iterator[Tuple[int, bytes]]:
+    """Pass pages through while tallying pages_extracted / bytes_decompressed."""
+    for page_num, content in pages:
+        stats['pages_extracted'] += 1
+        stats['bytes_decompressed'] += len(content)
+        yield page_num, content
+
+
+def new_stats(filepath: str) -> dict:
+    """Return an empty per-file extraction statistics dict."""
+    return {
+        'file': filepath,
+        'pages_total': 0,
+        'pages_selected': 0,
+        'pages_extracted': 0,
+        'bytes_compressed': 0,
+        'bytes_decompressed': 0,
+        'binary_objects': 0,
+        'binary_filename': None,
+        'binary_size': 0,
+        'inflate_retries': 0,
+        'inflate_failures': 0,
+        'elapsed_seconds': 0.0,
+        'error': None
+    }
+
+
 def extract_rpt(filepath: str, output_base: str,
                 page_range: Optional[Tuple[int, int]] = None,
                 section_id: Optional[int] = None,
@@ -539,7 +963,9 @@ def extract_rpt(filepath: str, output_base: str,
                 binary_only: bool = False,
                 no_binary: bool = False,
                 page_concat: bool = False,
-                export_sections_csv: Optional[str] = None) -> dict:
+                export_sections_csv: Optional[str] = None,
+                workers: int = 1,
+                index_cache: Optional[str] = None) -> dict:
     """
     Extract pages from a single RPT file.
 
@@ -557,27 +983,42 @@ def extract_rpt(filepath: str, output_base: str,
         binary_only: If True, extract only the binary document (skip text pages)
         no_binary: If True, extract only text pages (skip binary objects)
         page_concat: If True, concatenate all text pages into a single file with \f\n separators
+        export_sections_csv: Optional path to export the section table as CSV
+        workers: Number of threads used to decompress pages and binary objects
+        index_cache: Enable the .rptidx page index cache: '' = sidecar next to
+                     the RPT file, otherwise a shared cache directory (None = off)
 
     Returns:
         dict with extraction statistics
     """
-    stats = {
-        'file': filepath,
-        'pages_total': 0,
-        'pages_selected': 0,
-        'pages_extracted': 0,
-        'bytes_compressed': 0,
-        'bytes_decompressed': 0,
-        'binary_objects': 0,
-        'binary_filename': None,
-        'binary_size': 0,
-        'error': None
-    }
+    with RptFile(filepath, index_cache) as rpt:
+        stats = _extract_from_rpt(rpt, output_base, page_range, section_id, section_ids,
+                                  info_only, binary_only, no_binary, page_concat,
+                                  export_sections_csv, workers)
+        stats['inflate_retries'] = rpt.inflate_retries
+        stats['inflate_failures'] = rpt.inflate_failures
+        if rpt.inflate_retries:
+            print(f"  Recovered {rpt.inflate_retries} truncated zlib stream(s) "
+                  f"(read past compressed_size)")
+        return stats
+
 
-    # Read header
-    with open(filepath, 'rb') as f:
-        header_data = f.read(0x200)
-    header = parse_rpt_header(header_data)
+def _extract_from_rpt(rpt: RptFile, output_base: str,
+                      page_range: Optional[Tuple[int, int]],
+                      section_id: Optional[int],
+                      section_ids: Optional[List[int]],
+                      info_only: bool,
+                      binary_only: bool,
+                      no_binary: bool,
+                      page_concat: bool,
+                      export_sections_csv: Optional[str],
+                      workers: int) -> dict:
+    """Body of extract_rpt, working against an open RptFile."""
+    filepath = rpt.filepath
+    stats = new_stats(filepath)
+
+    # Header and trailer offsets were parsed when the file was mapped
+    header = rpt.header
     if header is None:
         stats['error'] = 'Not a valid RPT file (no RPTFILEHDR signature)'
         return stats
@@ -586,23 +1027,24 @@ def extract_rpt(filepath: str, output_base: str,
     rpt_name = os.path.splitext(os.path.basename(filepath))[0]
 
     # Read page table
-    page_entries = read_page_table(filepath, header.page_count)
+    page_entries = rpt.read_page_table(header.page_count)
     if not page_entries:
         stats['error'] = 'No PAGETBLHDR found'
         return stats
 
     # Read sections (needed for --section-id and info display)
-    _, sections = read_sectionhdr(filepath)
+    sections = rpt.sections
+    section_index = rpt.section_index
 
     # Read binary object table (if present)
     binary_entries = []
     if header.binary_object_count > 0:
-        binary_entries = read_binary_page_table(filepath, header.binary_object_count)
+        binary_entries = rpt.read_binary_page_table(header.binary_object_count)
 
     # Parse Object Header from text page 1 (if binary objects exist)
     object_header = None
     if binary_entries and page_entries:
-        first_page = decompress_page(filepath, page_entries[0])
+        first_page = decompress_page(rpt, page_entries[0])
         if first_page:
             object_header = parse_object_header(first_page)
 
@@ -615,8 +1057,8 @@ def extract_rpt(filepath: str, output_base: str,
     if header.binary_object_count > 0:
         print(f"  Binary Objects: {header.binary_object_count}")
 
-    total_comp = sum(e.compressed_size for e in page_entries)
-    total_uncomp = sum(e.uncompressed_size for e in page_entries)
+    total_comp = page_entries.total_compressed()
+    total_uncomp = page_entries.total_uncompressed()
     if total_comp > 0:
         ratio = total_uncomp / total_comp
         print(f"  Compressed: {total_comp:,} bytes -> Uncompressed: {total_uncomp:,} bytes ({ratio:.1f}x)")
@@ -650,19 +1092,22 @@ def extract_rpt(filepath: str, output_base: str,
     if info_only:
         # Show page table sample
         print(f"\n  Page Table (first 5 / last 5):")
-        print(f"  {'PAGE':>6s}  {'OFFSET':>10s}  {'WIDTH':>6s}  {'LINES':>6s}  {'UNCOMP':>8s}  {'COMP':>8s}")
+        print(f"  {'PAGE':>6s}  {'OFFSET':>10s}  {'WIDTH':>6s}  {'LINES':>6s}  {'UNCOMP':>8s}  {'COMP':>8s}"
+              f"  {'SECTION_ID':>10s}")
         if len(page_entries) <= 10:
-            show = page_entries
+            show = page_entries.entries()
         else:
-            show = page_entries[:5]
+            show = page_entries[:5].entries()
             show.append(None)  # separator
             show.extend(page_entries[-5:])
         for e in show:
             if e is None:
                 print(f"  {'...':>6s}")
                 continue
+            sid = section_index.section_for_page(e.page_number)
             print(f"  {e.page_number:>6d}  0x{e.absolute_offset:08X}  {e.line_width:>6d}  "
-                  f"{e.lines_per_page:>6d}  {e.uncompressed_size:>8,d}  {e.compressed_size:>8,d}")
+                  f"{e.lines_per_page:>6d}  {e.uncompressed_size:>8,d}  {e.compressed_size:>8,d}"
+                  f"  {'-' if sid is None else sid:>10}")
 
         # Show binary object table if present
         if binary_entries:
@@ -679,11 +1124,12 @@ def extract_rpt(filepath: str, output_base: str,
                     print(f"    {key}: {value}")
 
             # Show assembled document info
-            bin_objs = decompress_binary_objects(filepath, binary_entries)
-            if bin_objs:
-                combined, filename, format_desc = assemble_binary_document(
-                    bin_objs, object_header, rpt_name)
-                print(f"\n  Assembled document: {format_desc} ({len(combined):,} bytes)")
+            document = write_binary_document(
+                iter_binary_objects(rpt, binary_entries, workers), None,
+                object_header, rpt_name)
+            if document:
+                filename, format_desc, _, total_size = document
+                print(f"\n  Assembled document: {format_desc} ({total_size:,} bytes)")
                 print(f"  Output filename: {filename}")
 
         return stats
@@ -696,7 +1142,7 @@ def extract_rpt(filepath: str, output_base: str,
 
     if effective_section_ids is not None:
         selected, found_ids, skipped_ids = select_pages_by_sections(
-            page_entries, sections, effective_section_ids)
+            page_entries, section_index, effective_section_ids)
         if skipped_ids:
             print(f"\n  Skipped (not found): {', '.join(str(sid) for sid in skipped_ids)}")
         if not found_ids:
@@ -705,13 +1151,12 @@ def extract_rpt(filepath: str, output_base: str,
             if sections:
                 print(f"  Available section IDs: {', '.join(str(s.section_id) for s in sections[:20])}")
             return stats
-        section_map = {s.section_id: s for s in sections}
         for sid in found_ids:
-            si = section_map[sid]
+            si = section_index.get(sid)
             print(f"\n  Extracting section {sid}: "
                   f"pages {si.start_page}-{si.start_page + si.page_count - 1} "
                   f"({si.page_count} pages)")
-        total_section_pages = sum(section_map[sid].page_count for sid in found_ids)
+        total_section_pages = sum(section_index.get(sid).page_count for sid in found_ids)
         print(f"\n  Total: {len(found_ids)} section(s), {total_section_pages} pages")
 
     elif page_range is not None:
@@ -746,10 +1191,8 @@ def extract_rpt(filepath: str, output_base: str,
         if page_concat:
             # Concatenate mode: all selected pages (including Object Header) into one file
             if selected:
-                pages = decompress_pages(filepath, selected)
-                stats['pages_extracted'] = len(pages)
-                stats['bytes_compressed'] = sum(e.compressed_size for e in selected)
-                stats['bytes_decompressed'] = sum(len(content) for _, content in pages)
+                pages = _count_pages(iter_pages(rpt, selected, workers), stats)
+                stats['bytes_compressed'] = selected.total_compressed()
 
                 os.makedirs(output_dir, exist_ok=True)
                 concat_filename = rpt_name + '.txt'
@@ -773,15 +1216,13 @@ def extract_rpt(filepath: str, output_base: str,
             text_selected = selected
             if binary_entries and object_header and selected:
                 # Object Header is text page 1 — skip it from regular text output
-                text_selected = [e for e in selected if e.page_number != 1]
-                if text_selected != selected:
+                text_selected = selected.without_page(1)
+                if text_selected is not selected:
                     print(f"  Object Header page (page 1) separated from text output")
 
             if text_selected:
-                pages = decompress_pages(filepath, text_selected)
-                stats['pages_extracted'] = len(pages)
-                stats['bytes_compressed'] = sum(e.compressed_size for e in text_selected)
-                stats['bytes_decompressed'] = sum(len(content) for _, content in pages)
+                pages = _count_pages(iter_pages(rpt, text_selected, workers), stats)
+                stats['bytes_compressed'] = text_selected.total_compressed()
 
                 saved = save_pages(pages, output_dir, page_prefix='page')
                 print(f"  Saved {saved} text pages to {output_dir}/")
@@ -794,7 +1235,7 @@ def extract_rpt(filepath: str, output_base: str,
 
             # Save Object Header as separate file (for reference)
             if binary_entries and object_header:
-                first_page = decompress_page(filepath, page_entries[0])
+                first_page = decompress_page(rpt, page_entries[0])
                 if first_page:
                     os.makedirs(output_dir, exist_ok=True)
                     oh_path = os.path.join(output_dir, 'object_header.txt')
@@ -811,27 +1252,147 @@ def extract_rpt(filepath: str, output_base: str,
     # Extract binary objects (unless --no-binary)
     # -----------------------------------------------------------------------
     if not no_binary and binary_entries:
-        bin_objs = decompress_binary_objects(filepath, binary_entries)
-        if bin_objs:
-            combined, filename, format_desc = assemble_binary_document(
-                bin_objs, object_header, rpt_name)
+        document = write_binary_document(
+            iter_binary_objects(rpt, binary_entries, workers), output_dir,
+            object_header, rpt_name)
+        if document:
+            filename, format_desc, object_count, total_size = document
 
-            os.makedirs(output_dir, exist_ok=True)
-            bin_path = os.path.join(output_dir, filename)
-            with open(bin_path, 'wb') as f:
-                f.write(combined)
-
-            stats['binary_objects'] = len(bin_objs)
+            stats['binary_objects'] = object_count
             stats['binary_filename'] = filename
-            stats['binary_size'] = len(combined)
+            stats['binary_size'] = total_size
 
-            print(f"  Saved {format_desc} document: {filename} ({len(combined):,} bytes) to {output_dir}/")
+            print(f"  Saved {format_desc} document: {filename} ({total_size:,} bytes) to {output_dir}/")
         else:
             print(f"  WARNING: Binary objects found but all decompression failed")
 
     return stats
 
 
+# ============================================================================
+# Batch Processing
+# ============================================================================
+
+SUMMARY_FIELDS = [
+    'file', 'elapsed_seconds', 'pages_total', 'pages_selected', 'pages_extracted',
+    'bytes_compressed', 'bytes_decompressed', 'binary_objects', 'binary_filename',
+    'binary_size', 'inflate_retries', 'inflate_failures', 'error'
+]
+
+
+def run_extract(filepath: str, options: dict) -> dict:
+    """
+    Run extract_rpt for one file, recording its wall time in the stats.
+
+    Args:
+        filepath: Path to .RPT file
+        options: Keyword arguments passed through to extract_rpt
+
+    Returns:
+        dict with extraction statistics (including elapsed_seconds)
+    """
+    start = time.perf_counter()
+    stats = extract_rpt(filepath=filepath, **options)
+    stats['elapsed_seconds'] = round(time.perf_counter() - start, 3)
+
+    if stats['error']:
+        print(f"  ERROR: {stats['error']}")
+
+    return stats
+
+
+def _run_extract_captured(filepath: str, options: dict) -> Tuple[dict, str]:
+    """
+    Process-pool task: run_extract with its console output captured.
+
+    Returning the output as one string lets the parent print it as a block,
+    so output from concurrent files is grouped per file instead of interleaved.
+    """
+    buf = io.StringIO()
+    with redirect_stdout(buf), redirect_stderr(buf):
+        try:
+            stats = run_extract(filepath, options)
+        except Exception as e:
+            stats = new_stats(filepath)
+            stats['error'] = f'{type(e).__name__}: {e}'
+            print(f"\n{'='*70}")
+            print(f"File: {filepath}")
+            print(f"  ERROR: {stats['error']}")
+    return stats, buf.getvalue()
+
+
+def run_extract_pool(rpt_files: List[str], options: dict, jobs: int) -> List[dict]:
+    """
+    Extract many RPT files on a process pool.
+
+    Each file's console output is printed as one block when the file finishes.
+
+    Args:
+        rpt_files: RPT file paths
+        options: Keyword arguments passed through to extract_rpt
+        jobs: Number of worker processes
+
+    Returns:
+        List of per-file stats dicts, in rpt_files order
+    """
+    all_stats = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_run_extract_captured, fp, options) for fp in rpt_files]
+        for future in as_completed(futures):
+            stats, output = future.result()
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            all_stats.append(stats)
+
+    order = {fp: i for i, fp in enumerate(rpt_files)}
+    all_stats.sort(key=lambda s: order[s['file']])
+    return all_stats
+
+
+def merge_stats(all_stats: List[dict], elapsed_seconds: float) -> dict:
+    """
+    Merge per-file stats dicts into batch totals.
+
+    elapsed_seconds is the wall-clock time of the whole batch; per-file times overlap
+    under --jobs, so they stay in the per-file rows and are not summed.
+    """
+    totals = {
+        'files': len(all_stats),
+        'errors': sum(1 for s in all_stats if s['error']),
+    }
+    for key in ('pages_total', 'pages_selected', 'pages_extracted', 'bytes_compressed',
+                'bytes_decompressed', 'binary_objects', 'binary_size',
+                'inflate_retries', 'inflate_failures'):
+        totals[key] = sum(s[key] for s in all_stats)
+    totals['elapsed_seconds'] = round(elapsed_seconds, 3)
+    return totals
+
+
+def write_summary(all_stats: List[dict], summary_path: str, elapsed_seconds: float) -> None:
+    """
+    Write per-file extraction stats as JSON or CSV (chosen by file extension).
+
+    The JSON form also includes the merged batch totals, timed by elapsed_seconds
+    (the batch wall-clock time).
+    """
+    summary_dir = os.path.dirname(summary_path)
+    if summary_dir:
+        os.makedirs(summary_dir, exist_ok=True)
+
+    if summary_path.lower().endswith('.csv'):
+        with open(summary_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(all_stats)
+    else:
+        summary = {
+            'totals': merge_stats(all_stats, elapsed_seconds),
+            'files': [{k: s[k] for k in SUMMARY_FIELDS} for s in all_stats],
+        }
+        with open(summary_path, 'w') as f:
+            json.dump(summary, f, indent=2)
+
+
 # ============================================================================
 # CLI
 # ============================================================================
@@ -871,6 +1432,15 @@ Examples:
   # Process all RPT files in a folder
   python rpt_page_extractor.py --folder /path/to/rpt/files
 
+  # Decompress pages on 8 threads (large reports)
+  python rpt_page_extractor.py --workers 8 --folder /path/to/rpt/files
+
+  # Show info, caching the page/section tables in .rptidx files for repeat runs
+  python rpt_page_extractor.py --info --index-cache /tmp/rptidx 251110OD.RPT
+
+  # Process a folder on 8 worker processes, with per-file timings in a summary
+  python rpt_page_extractor.py --jobs 8 --summary timings.csv --folder /path/to/rpt/files
+
   # Extract only the binary document (PDF/AFP) from an RPT file
   python rpt_page_extractor.py --binary-only 260271Q7.RPT
 
@@ -933,6 +1503,33 @@ Examples:
         action='store_true',
         help='Concatenate all text pages into a single file (separated by form-feed)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Decompress pages and binary objects using N threads (default: 1)'
+    )
+    parser.add_argument(
+        '--index-cache',
+        nargs='?',
+        const='',
+        metavar='DIR',
+        help='Cache located page/section tables as .rptidx files and reuse them on '
+             'later runs (in DIR, or next to each RPT file if DIR is omitted)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Process RPT files on N worker processes (default: 1)'
+    )
+    parser.add_argument(
+        '--summary',
+        metavar='FILE',
+        help='Write per-file stats and timings to FILE (.json, or .csv)'
+    )
     parser.add_argument(
         '--export-sections',
         metavar='CSV_FILE',
@@ -951,6 +1548,12 @@ Examples:
     if args.binary_only and args.no_binary:
         parser.error('Cannot use both --binary-only and --no-binary')
 
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
     if args.page_concat and args.binary_only:
         parser.error('Cannot use both --page-concat and --binary-only (binary-only has no text pages to concatenate)')
 
@@ -983,33 +1586,40 @@ Examples:
         rpt_files = args.rptfile
 
     # Process each RPT file
-    all_stats = []
-    for filepath in rpt_files:
-        stats = extract_rpt(
-            filepath=filepath,
-            output_base=args.output,
-            page_range=page_range,
-            section_ids=args.section_id,
-            info_only=args.info,
-            binary_only=args.binary_only,
-            no_binary=args.no_binary,
-            page_concat=args.page_concat,
-            export_sections_csv=args.export_sections
-        )
-        all_stats.append(stats)
-
-        if stats['error']:
-            print(f"  ERROR: {stats['error']}")
+    options = dict(
+        output_base=args.output,
+        page_range=page_range,
+        section_ids=args.section_id,
+        info_only=args.info,
+        binary_only=args.binary_only,
+        no_binary=args.no_binary,
+        page_concat=args.page_concat,
+        export_sections_csv=args.export_sections,
+        workers=args.workers,
+        index_cache=args.index_cache
+    )
+    batch_start = time.perf_counter()
+    if args.jobs > 1 and len(rpt_files) > 1:
+        print(f"Processing with {args.jobs} worker processes")
+        all_stats = run_extract_pool(rpt_files, options, args.jobs)
+    else:
+        all_stats = [run_extract(filepath, options) for filepath in rpt_files]
+    batch_elapsed = time.perf_counter() - batch_start
 
     # Summary for batch mode
     if len(rpt_files) > 1:
-        total_pages = sum(s['pages_extracted'] for s in all_stats)
-        total_bytes = sum(s['bytes_decompressed'] for s in all_stats)
-        errors = sum(1 for s in all_stats if s['error'])
+        totals = merge_stats(all_stats, batch_elapsed)
         print(f"\n{'='*70}")
-        print(f"SUMMARY: {len(rpt_files)} files, {total_pages} pages extracted, "
-              f"{total_bytes:,} bytes decompressed, {errors} errors")
-
+        print(f"SUMMARY: {totals['files']} files, {totals['pages_extracted']} pages extracted, "
+              f"{totals['bytes_decompressed']:,} bytes decompressed, {totals['errors']} errors, "
+              f"{totals['elapsed_seconds']:.1f}s")
+        if totals['inflate_retries'] or totals['inflate_failures']:
+            print(f"  zlib streams: {totals['inflate_retries']} recovered past compressed_size, "
+                  f"{totals['inflate_failures']} failed")
+
+    if args.summary:
+        write_summary(all_stats, args.summary, batch_elapsed)
+        print(f"Summary written to: {args.summary}")
 
 if __name__ == '__main__':
     main()